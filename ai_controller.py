@@ -0,0 +1,219 @@
+# (파일: ai_controller.py)
+#
+# CPU 상대. 키보드 대신 입력 비트를 만들어 Player를 조종합니다. (headless.py 컨트롤러와 같은 호출 방식)
+#
+# 결정 시점마다 현재 경기 상태를 헤드리스 그림자 Match에 복사해 두고,
+# 후보 행동 순서(예: 전진 10틱 -> 잽)를 짧은 시간 앞까지 실제 Player/collisions 규칙으로 시뮬레이션해서
+# 점수가 가장 높은 것을 고릅니다.
+#   - 반응 지연 동안은 지금 하던 행동을 계속하므로, 그 구간은 한 번만 시뮬레이션해서 모든 후보가 공유합니다.
+#   - 앞부분이 같은 후보끼리는 그 앞부분을 시뮬레이션한 상태를 재사용합니다. (깊이 2: 7 + 49 구간)
+#   - 후보 평가는 프레임당 TIME_BUDGET_MS 안에서만 하고, 남은 후보는 다음 프레임에 이어서 평가합니다.
+#   - 난이도는 탐색 깊이(행동 몇 개를 이어 볼지), 예측 길이, 반응 지연으로만 정합니다. (데미지 보정 없음)
+
+import time
+
+from inputs import INPUT_LEFT, INPUT_RIGHT, INPUT_JAB, INPUT_STRAIGHT, INPUT_UPPERCUT, INPUT_BLOCK
+from combat_log import COMBAT_LOG, LEVEL_OFF
+from frame_profiler import PROFILER
+
+TIME_BUDGET_MS = 2.0
+
+# depth: 이어 볼 행동 수, horizon: 반응 이후 예측하는 틱 수, reaction: 결정까지 걸리는 틱 수,
+# interval: 같은 행동을 유지할 최소 틱 수 (다음 결정까지)
+DIFFICULTY = {
+    'easy': {'depth': 1, 'horizon': 12, 'reaction': 20, 'interval': 15},
+    'normal': {'depth': 1, 'horizon': 24, 'reaction': 12, 'interval': 10},
+    'hard': {'depth': 2, 'horizon': 30, 'reaction': 6, 'interval': 6},
+}
+
+# 후보 행동 ('forward'/'back'은 상대 방향 기준)
+ACTIONS = ('idle', 'forward', 'back', 'jab', 'straight', 'uppercut', 'block')
+ACTION_BITS = {'idle': 0, 'jab': INPUT_JAB, 'straight': INPUT_STRAIGHT, 'uppercut': INPUT_UPPERCUT,
+               'block': INPUT_BLOCK}
+
+# --- 평가 가중치 ---
+DAMAGE_DEALT_WEIGHT = 1.0
+DAMAGE_TAKEN_WEIGHT = 1.2
+KO_SCORE = 1000
+PREFERRED_GAP = 120     # frame_rect.x 차이 - 서로 마주 볼 때 잽이 닿는 거리(약 71 ~ 186)의 가운데
+DISTANCE_WEIGHT = 0.02
+
+
+class CpuController:
+    """
+    controller(match, player_index) -> 이번 틱 입력 비트
+    GameScreen(cpu=...)나 headless.run_match에 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self, difficulty='normal', time_budget_ms=TIME_BUDGET_MS):
+        settings = DIFFICULTY[difficulty]
+        self.depth = settings['depth']
+        self.horizon = settings['horizon']
+        self.reaction = settings['reaction']
+        self.interval = settings['interval']
+        self.time_budget = time_budget_ms / 1000
+
+        self.shadow = None          # 예측용 헤드리스 Match (처음 호출 때 생성)
+        self.current_bits = 0
+        self.plan = []              # 결정된 [(행동 비트, 유지 틱 수)]
+        self.next_decision = 0
+
+        # 진행 중인 탐색
+        self.search_state = None    # 반응 지연 구간까지 시뮬레이션한 뒤의 상태
+        self.opponent_bits = 0      # 예측: 상대는 마지막 입력을 계속 유지
+        self.start_hp = (0, 0)      # 반응 지연 구간이 끝난 시점의 (내 hp, 상대 hp)
+        self.candidates = []
+        self.next_candidate = 0
+        self.best = None            # (점수, 후보)
+        self.decide_at = 0
+        self._prefix_states = {}    # 후보 앞부분(튜플) -> 그 구간까지 시뮬레이션한 상태
+        self._candidate_cost = 0.0  # 후보 하나 평가에 걸린 시간 (지수 평균, 초)
+
+        # 통계
+        self.decisions = 0
+        self.evaluated = 0
+
+    # ==================================================
+    # 1. 호출 (틱마다)
+    # ==================================================
+    def __call__(self, match, player_index):
+        if match.game_over:
+            return 0
+        me = match.players[player_index]
+
+        deadline = time.perf_counter() + self.time_budget
+        if self.search_state is None and not self.plan and match.tick >= self.next_decision \
+                and me.is_actionable():
+            self._begin_search(match, player_index)
+
+        if self.search_state is not None:
+            self._continue_search(player_index, deadline)
+            if match.tick >= self.decide_at:
+                self._finish_search(match)
+
+        if self.plan:
+            bits, remaining = self.plan[0]
+            self.current_bits = bits
+            if remaining <= 1:
+                self.plan.pop(0)
+            else:
+                self.plan[0] = (bits, remaining - 1)
+        return self.current_bits
+
+    # ==================================================
+    # 2. 탐색
+    # ==================================================
+    def _action_bits(self, action, direction):
+        if action == 'forward':
+            return INPUT_RIGHT if direction > 0 else INPUT_LEFT
+        if action == 'back':
+            return INPUT_LEFT if direction > 0 else INPUT_RIGHT
+        return ACTION_BITS[action]
+
+    def _begin_search(self, match, player_index):
+        if self.shadow is None:
+            from match import Match
+            self.shadow = Match(match.screen_width, match.screen_height, headless=True,
+                                move_data=match.move_data, tuning=match.tuning)
+
+        me = match.players[player_index]
+        opponent = match.players[1 - player_index]
+        direction = 1 if opponent.frame_rect.centerx >= me.frame_rect.centerx else -1
+
+        # 후보: 깊이만큼 행동을 이어 붙인 순서 (깊이 2면 앞 절반 / 뒤 절반)
+        sequences = [[action] for action in ACTIONS]
+        for _ in range(self.depth - 1):
+            sequences = [sequence + [action] for sequence in sequences for action in ACTIONS]
+        hold = max(1, self.horizon // self.depth)
+        self.candidates = [[(self._action_bits(action, direction), hold) for action in sequence]
+                           for sequence in sequences]
+
+        # 반응 지연 동안은 지금 행동을 계속한다고 보고 한 번만 미리 진행
+        opponent_bits = match.last_inputs[1 - player_index]
+        with _quiet():
+            self.shadow.load_state(match.save_state(include_effects=False))
+            for _ in range(self.reaction):
+                self._step_shadow(player_index, self.current_bits, opponent_bits)
+            self.search_state = self.shadow.save_state(include_effects=False)
+            self.start_hp = (self.shadow.players[player_index].hp, self.shadow.players[1 - player_index].hp)
+
+        self.opponent_bits = opponent_bits
+        self.next_candidate = 0
+        self.best = None
+        self._prefix_states = {(): self.search_state}
+        self.decide_at = match.tick + self.reaction
+
+    def _continue_search(self, player_index, deadline):
+        """deadline까지 다음 후보들을 평가합니다. (넘길 것 같으면 다음 프레임으로 미룸)"""
+        with _quiet():
+            while self.next_candidate < len(self.candidates):
+                start = time.perf_counter()
+                if start + self._candidate_cost > deadline:
+                    break
+                candidate = self.candidates[self.next_candidate]
+                score = self._evaluate(candidate, player_index)
+                if self.best is None or score > self.best[0]:
+                    self.best = (score, candidate)
+                self.next_candidate += 1
+                self.evaluated += 1
+                cost = time.perf_counter() - start
+                self._candidate_cost = cost if not self._candidate_cost else self._candidate_cost * 0.8 + cost * 0.2
+
+    def _finish_search(self, match):
+        """반응 지연이 끝났으면 (다 못 봤어도) 지금까지 가장 좋은 후보로 결정합니다."""
+        if self.best is not None:
+            self.plan = list(self.best[1])
+            self.decisions += 1
+        self.search_state = None
+        self.next_decision = match.tick + self.interval
+
+    def _step_shadow(self, player_index, my_bits, opponent_bits):
+        if player_index == 0:
+            self.shadow.step(my_bits, opponent_bits)
+        else:
+            self.shadow.step(opponent_bits, my_bits)
+
+    def _evaluate(self, candidate, player_index):
+        shadow = self.shadow
+        me = shadow.players[player_index]
+        opponent = shadow.players[1 - player_index]
+        my_hp, opponent_hp = self.start_hp
+
+        # 이미 시뮬레이션해 둔 가장 긴 앞부분부터 이어서 진행
+        done = len(candidate) - 1
+        while tuple(candidate[:done]) not in self._prefix_states:
+            done -= 1
+        shadow.load_state(self._prefix_states[tuple(candidate[:done])])
+
+        for level in range(done, len(candidate)):
+            bits, hold = candidate[level]
+            for _ in range(hold):
+                if shadow.game_over:
+                    break
+                self._step_shadow(player_index, bits, self.opponent_bits)
+            if level < len(candidate) - 1:
+                self._prefix_states[tuple(candidate[:level + 1])] = shadow.save_state(include_effects=False)
+
+        score = (opponent_hp - opponent.hp) * DAMAGE_DEALT_WEIGHT - (my_hp - me.hp) * DAMAGE_TAKEN_WEIGHT
+        if not opponent.is_alive:
+            score += KO_SCORE
+        if not me.is_alive:
+            score -= KO_SCORE
+        gap = abs(opponent.frame_rect.x - me.frame_rect.x)
+        score -= abs(gap - PREFERRED_GAP) * DISTANCE_WEIGHT
+        return score
+
+
+class _quiet:
+    """예측 시뮬레이션 동안 전투 로그를 끄고 프로파일러 기록을 멈춥니다.
+    (이 시간은 다음 lap인 'update'에 합쳐짐)"""
+
+    def __enter__(self):
+        self.log_level = COMBAT_LOG.level
+        self.profiling = PROFILER.enabled
+        COMBAT_LOG.level = LEVEL_OFF
+        PROFILER.enabled = False
+
+    def __exit__(self, *exc):
+        COMBAT_LOG.level = self.log_level
+        PROFILER.enabled = self.profiling
\ No newline at end of file
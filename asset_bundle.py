@@ -0,0 +1,219 @@
+# (파일: asset_bundle.py)
+#
+# 오프라인 에셋 베이커 + 메모리 맵 로더.
+#   python asset_bundle.py bake     -> 모든 프레임을 스케일링해서 atlas 번들 하나로 굽습니다.
+#   python asset_bundle.py measure  -> 폴더 로딩 vs 번들 로딩 시작 시간을 비교합니다.
+#
+# 번들 구조 (리틀 엔디언):
+#   헤더    : MAGIC, version, atlas_w, atlas_h, entry_count, pixel_offset
+#   인덱스  : 항목마다 [폴더 이름, 배율, 지문(fingerprint), 원본 프레임 크기, 프레임 수,
+#             프레임별 (x, y, w, h, 원본 내 오프셋 x, y)]  -- 프레임은 투명 여백이 잘린 상태
+#   픽셀    : atlas_w * atlas_h * 4 바이트의 RGBA (PNG가 아니므로 디코딩 없이 바로 사용)
+
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+import utils
+
+MAGIC = b'BXATLAS1'
+VERSION = 2
+BUNDLE_PATH = "assets.atlas"
+ATLAS_WIDTH = 2048
+
+_HEADER = struct.Struct('<8sHHHHI')
+_ENTRY_HEAD = struct.Struct('<fIHHH')
+_RECT = struct.Struct('<HHHHHH')
+
+# 게임이 실제로 사용하는 (폴더, 배율) 목록
+FIGHTER_FOLDERS = ('Idle', 'Walk', 'PunchLeft', 'PunchRight', 'PunchUp', 'Blocking', 'Dizzy', 'KO')
+EFFECT_FOLDERS = ('BlockEffect', 'HitEffect')
+BAKE_TARGETS = [(folder, 0.5) for folder in FIGHTER_FOLDERS] + \
+               [(folder, 2.0) for folder in EFFECT_FOLDERS]
+
+
+def folder_fingerprint(folder_path):
+    """파일 이름/크기/수정 시각으로 폴더 지문을 만듭니다. (디코딩 없이 stale 여부 판단용)"""
+    if not os.path.isdir(folder_path):
+        return 0
+    crc = 0
+    for file_name in sorted(os.listdir(folder_path)):
+        st = os.stat(os.path.join(folder_path, file_name))
+        crc = zlib.crc32(f"{file_name}:{st.st_size}:{st.st_mtime_ns};".encode('utf-8'), crc)
+    return crc
+
+
+# ==================================================
+# 1. 굽기 (bake)
+# ==================================================
+def _pack_shelves(sizes, atlas_width):
+    """높이 순 선반(shelf) 패킹. sizes 순서대로 (x, y) 위치와 최종 높이를 반환합니다."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > atlas_width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+def bake_bundle(path=BUNDLE_PATH, targets=BAKE_TARGETS):
+    entries = []
+    all_frames = []
+    all_offsets = []
+    for folder, scale in targets:
+        frames = utils.decode_animation_frames(folder, scale)
+        entries.append((folder, scale, folder_fingerprint(folder), frames.frame_size, len(frames)))
+        all_frames.extend(frames)
+        all_offsets.extend(frames.offsets)
+
+    positions, atlas_height = _pack_shelves([img.get_size() for img in all_frames], ATLAS_WIDTH)
+
+    pixels = bytearray(ATLAS_WIDTH * atlas_height * 4)
+    row_bytes = ATLAS_WIDTH * 4
+    for img, (x, y) in zip(all_frames, positions):
+        w, h = img.get_size()
+        data = pygame.image.tobytes(img, 'RGBA')
+        for row in range(h):
+            dst = (y + row) * row_bytes + x * 4
+            pixels[dst:dst + w * 4] = data[row * w * 4:(row + 1) * w * 4]
+
+    index = bytearray()
+    i = 0
+    for folder, scale, fingerprint, (frame_w, frame_h), count in entries:
+        name = folder.encode('utf-8')
+        index += struct.pack('<B', len(name)) + name
+        index += _ENTRY_HEAD.pack(scale, fingerprint, frame_w, frame_h, count)
+        for _ in range(count):
+            w, h = all_frames[i].get_size()
+            index += _RECT.pack(positions[i][0], positions[i][1], w, h, *all_offsets[i])
+            i += 1
+
+    pixel_offset = _HEADER.size + len(index)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, ATLAS_WIDTH, atlas_height, len(entries), pixel_offset))
+        f.write(index)
+        f.write(pixels)
+
+    print(f"번들 생성: {path} ({len(all_frames)} 프레임, {ATLAS_WIDTH}x{atlas_height})")
+
+
+# ==================================================
+# 2. 로딩 (memory-mapped)
+# ==================================================
+class AssetBundle:
+    """번들 파일을 메모리 맵으로 열고, atlas에서 프레임 Surface를 잘라 줍니다."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.atlas_w, self.atlas_h, entry_count, pixel_offset = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"지원하지 않는 번들 형식입니다: {path}")
+
+        self.entries = {}
+        pos = _HEADER.size
+        for _ in range(entry_count):
+            name_len = self._map[pos]
+            folder = self._map[pos + 1:pos + 1 + name_len].decode('utf-8')
+            pos += 1 + name_len
+            scale, fingerprint, frame_w, frame_h, count = _ENTRY_HEAD.unpack_from(self._map, pos)
+            pos += _ENTRY_HEAD.size
+            rects = [_RECT.unpack_from(self._map, pos + k * _RECT.size) for k in range(count)]
+            pos += count * _RECT.size
+            self.entries[(folder, float(scale))] = (fingerprint, (frame_w, frame_h), rects)
+
+        self._pixel_offset = pixel_offset
+        self._atlas = None
+
+    def _get_atlas(self):
+        if self._atlas is None:
+            size = self.atlas_w * self.atlas_h * 4
+            view = memoryview(self._map)[self._pixel_offset:self._pixel_offset + size]
+            atlas = pygame.image.frombuffer(view, (self.atlas_w, self.atlas_h), 'RGBA')
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()  # 화면 포맷으로 한 번만 변환
+            self._atlas = atlas
+        return self._atlas
+
+    def load_frames(self, folder_path, scale_factor=1.0):
+        """번들에 최신 항목이 있으면 프레임 리스트를, 없거나 오래됐으면 None을 반환합니다."""
+        entry = self.entries.get((folder_path, float(scale_factor)))
+        if entry is None:
+            return None
+        fingerprint, frame_size, rects = entry
+        if fingerprint != folder_fingerprint(folder_path):
+            return None
+        atlas = self._get_atlas()
+        frames = [atlas.subsurface(rect[:4]) for rect in rects]
+        return utils.FrameList(frames, frame_size, [rect[4:] for rect in rects])
+
+
+_bundle = None
+_bundle_checked = False
+
+
+def get_bundle(path=BUNDLE_PATH):
+    """기본 번들을 한 번만 엽니다. 파일이 없거나 깨졌으면 None."""
+    global _bundle, _bundle_checked
+    if not _bundle_checked:
+        _bundle_checked = True
+        if os.path.exists(path):
+            try:
+                _bundle = AssetBundle(path)
+            except (OSError, ValueError, struct.error) as e:
+                print(f"경고: 에셋 번들을 열 수 없습니다 ({e}). 폴더에서 로드합니다.")
+    return _bundle
+
+
+# ==================================================
+# 3. 측정
+# ==================================================
+def measure(repeat=5, path=BUNDLE_PATH):
+    def median(values):
+        values = sorted(values)
+        return values[len(values) // 2]
+
+    folder_times = []
+    bundle_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for folder, scale in BAKE_TARGETS:
+            utils.decode_animation_frames(folder, scale)
+        folder_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        bundle = AssetBundle(path)
+        for folder, scale in BAKE_TARGETS:
+            if bundle.load_frames(folder, scale) is None:
+                raise SystemExit(f"번들 항목이 오래되었습니다: {folder}. 먼저 bake 하세요.")
+        bundle_times.append(time.perf_counter() - start)
+
+    folder_ms = median(folder_times) * 1000
+    bundle_ms = median(bundle_times) * 1000
+    print(f"폴더 로딩 : {folder_ms:8.1f} ms")
+    print(f"번들 로딩 : {bundle_ms:8.1f} ms  (x{folder_ms / bundle_ms:.1f})")
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "bake"
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)  # convert_alpha()에 필요
+    if command == "bake":
+        bake_bundle()
+    elif command == "measure":
+        measure()
+    else:
+        print("사용법: python asset_bundle.py [bake|measure]")
\ No newline at end of file
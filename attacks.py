@@ -1,28 +1,33 @@
 # (파일: attacks.py)
 
 from utils import load_animation_frames
-import pygame
+from frame_data import get_compiled_move
 
 
 class Attack:
     """
     공격 모션의 데이터(프레임, 데미지, 타격 시점, 범위, KO여부)를 관리
+    (데미지/판정 데이터는 moves.json에서 방향별로 컴파일된 테이블을 사용합니다)
     """
 
-    def __init__(self, folder_name, damage, hit_frame, hitbox_rect,
-                 scale_factor=1.0, flip_images=False, is_ko_move=False):  # <-- [수정]
+    def __init__(self, folder_name, move_name, scale_factor=1.0, flip_images=False, headless=False,
+                 move_data=None):
 
-        self.frames = load_animation_frames(folder_name, scale_factor, flip_images)
+        self.frames = load_animation_frames(folder_name, scale_factor, flip_images, headless)
         self.frame_count = len(self.frames)
 
-        # 2. 데미지 정보
-        self.damage = damage
-        self.is_ko_move = is_ko_move  # <-- [수정] KO 기술인지 여부 저장
+        # 1. 방향별로 미리 반전된 프레임 데이터
+        frame_width = self.frames.frame_size[0]
+        self.compiled = get_compiled_move(move_name, self.frame_count, frame_width, flip_images, move_data)
 
-        # 3. 타격 판정 정보
-        self.hit_frame = hit_frame
+        # 2. 데미지 정보
+        self.damage = self.compiled.damage
+        self.is_ko_move = self.compiled.is_ko_move
 
-        # 4. 공격 범위 (Hitbox)
-        self.hitbox = pygame.Rect(hitbox_rect)
+        # 3. 타격 판정 정보 (프레임별 히트박스/허트박스, 이미 반전됨)
+        self.hit_frame = self.compiled.active[0]
+        self.hitboxes = self.compiled.hitboxes
+        self.hurtboxes = self.compiled.hurtboxes
 
-        # (참고: hitbox 좌우 반전은 Player 클래스 __init__에서 처리하는 것이 더 정확합니다)
\ No newline at end of file
+        # 4. 이 프레임부터 후딜을 끊고 다른 행동 가능
+        self.actionable_frame = self.compiled.actionable_frame
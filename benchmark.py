@@ -0,0 +1,327 @@
+# (파일: benchmark.py)
+#
+# 핫패스 벤치마크. SDL dummy 드라이버로 창 없이 실행됩니다.
+#   python benchmark.py                          -> 측정 후 bench_results.json 저장
+#   python benchmark.py --save-baseline          -> 측정 결과를 기준값(bench_baseline.json)으로 저장
+#   python benchmark.py --compare                -> 기준값과 비교, 느려진 항목이 있으면 종료 코드 1
+#   python benchmark.py --only collisions        -> 이름에 'collisions'가 들어간 항목만
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+SCREEN_WIDTH = 1080
+SCREEN_HEIGHT = 720
+RESULTS_PATH = "bench_results.json"
+BASELINE_PATH = "bench_baseline.json"
+REGRESSION_THRESHOLD = 0.10  # 중앙값이 10% 넘게 느려지면 회귀로 판단
+
+BENCHMARKS = []
+
+
+def benchmark(name, repeat=200, warmup=20):
+    """벤치마크 등록 데코레이터. 함수는 (준비된 상태) -> 한 번 측정할 callable 을 반환합니다."""
+    def register(setup):
+        BENCHMARKS.append((name, setup, repeat, warmup))
+        return setup
+    return register
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def run_one(setup, repeat, warmup):
+    fn = setup()
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # GC 타이밍 때문에 튀는 값 방지
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    samples.sort()
+    return {
+        'median_us': percentile(samples, 50),
+        'p90_us': percentile(samples, 90),
+        'p99_us': percentile(samples, 99),
+        'min_us': samples[0],
+        'repeat': repeat,
+    }
+
+
+# ==================================================
+# 벤치마크 항목
+# ==================================================
+def _new_game_screen():
+    from game_screen import GameScreen
+    return GameScreen(SCREEN_WIDTH, SCREEN_HEIGHT, assets={'bg_image': None, 'sounds': None})
+
+
+def _fighting_match():
+    """서로 잽이 닿는 거리까지 다가선 Match."""
+    from inputs import INPUT_JAB, INPUT_LEFT, INPUT_RIGHT
+    from match import Match
+
+    match = Match(SCREEN_WIDTH, SCREEN_HEIGHT)
+    for _ in range(40):
+        match.step(INPUT_RIGHT, INPUT_LEFT)
+    match.player1.hp = match.player2.hp = 10 ** 9  # 벤치마크 도중 KO/Dizzy 방지
+    return match, INPUT_JAB
+
+
+def _register_folder_benchmarks():
+    from match import ANIM_FOLDERS, FIGHTER_SCALE, EFFECT_FOLDERS, EFFECT_SCALE
+    from utils import decode_animation_frames
+
+    targets = [(folder, FIGHTER_SCALE) for folder in ANIM_FOLDERS.values()] + \
+              [(folder, EFFECT_SCALE) for folder in EFFECT_FOLDERS]
+    for folder, scale in targets:
+        # 캐시를 거치지 않는 순수 디코딩 비용
+        benchmark(f"load_animation_frames/{folder}", repeat=10, warmup=1)(
+            lambda folder=folder, scale=scale: (lambda: decode_animation_frames(folder, scale)))
+
+
+@benchmark("GameScreen/construct_cold", repeat=5, warmup=0)
+def bench_game_screen_cold():
+    from frame_cache import get_frame_cache
+
+    def run():
+        get_frame_cache().clear()
+        _new_game_screen()
+    return run
+
+
+@benchmark("GameScreen/construct_warm", repeat=50, warmup=2)
+def bench_game_screen_warm():
+    return _new_game_screen
+
+
+@benchmark("Player.update/tick", repeat=2000, warmup=100)
+def bench_player_update():
+    match, jab = _fighting_match()
+
+    def run():
+        match.player1.update(jab)
+        match.player2.update(jab)
+    return run
+
+
+@benchmark("handle_player_collisions/tick", repeat=2000, warmup=100)
+def bench_collisions():
+    from collisions import handle_player_collisions
+
+    match, _ = _fighting_match()
+    p1, p2 = match.player1, match.player2
+
+    def run():
+        # 양쪽 모두 잽의 타격 프레임에서 서로 맞는 최악의 경우
+        for player in (p1, p2):
+            player.current_state = 'Jab'
+            player.current_frame = player.attacks['Jab'].hit_frame
+            player.has_hit = False
+        match.effect_group.empty()
+        handle_player_collisions(p1, p2, match.effect_group, match.effect_frames, None)
+    return run
+
+
+def _jab_exchange(precise):
+    """서로 잽 타격 프레임 그림까지 맞춘 상태에서 판정 한 번 (사각형만 / 마스크 정밀 판정)"""
+    from collisions import resolve_collisions
+
+    match, _ = _fighting_match()
+    for player in match.players:
+        frames = player.attacks['Jab'].frames
+        player.current_state = 'Jab'
+        player.current_frame = player.image_index = player.attacks['Jab'].hit_frame
+        player.image_frames = frames
+        player.image = frames[player.image_index]
+        player.image_offset = frames.offsets[player.image_index]
+        player.sync_draw_rect()
+
+    def run():
+        for player in match.players:
+            player.has_hit = False
+        match.effect_group.empty()
+        resolve_collisions(match.players, match.effect_group, match.effect_frames, None, precise=precise)
+    return run
+
+
+# 정밀 판정은 사각형이 겹친 쌍에만 마스크 검사를 더하므로 이 둘의 차이가 틱당 추가 비용
+benchmark("resolve_collisions/rect_tick", repeat=2000, warmup=100)(lambda: _jab_exchange(False))
+benchmark("resolve_collisions/precise_tick", repeat=2000, warmup=100)(lambda: _jab_exchange(True))
+
+
+@benchmark("EffectPool/burst_tick", repeat=2000, warmup=100)
+def bench_effect_burst():
+    from match import EFFECT_SCALE
+    from visual_effects import EffectPool, mirrored_pair
+
+    # 풀이 가득 찬 상태에서 틱마다 16개씩 새로 나오는 경우 (가장 오래된 이펙트를 재사용)
+    pool = EffectPool()
+    hit_frames = mirrored_pair('HitEffect', EFFECT_SCALE)
+    positions = [(40 * i, 300 + (i % 5) * 20) for i in range(16)]
+
+    def run():
+        for i, pos in enumerate(positions):
+            pool.spawn(pos, hit_frames[i % 2])
+        pool.update()
+    return run
+
+
+def _crowd(count, spacing=120):
+    """한 줄로 선 count명. 둘씩 마주 보고 서서 모두 잽 타격 프레임으로 짝을 노립니다."""
+    from match import ANIM_FOLDERS, FIGHTER_SCALE
+    from player import Player
+
+    arena_width = spacing * (count + 4)
+    fighters = []
+    for i in range(count):
+        fighter = Player((spacing * (i + 2), SCREEN_HEIGHT - 30), (0,) * 6, ANIM_FOLDERS, arena_width,
+                         FIGHTER_SCALE, flip_images=bool(i % 2), headless=True, name=f"F{i}")
+        fighter.update(0)
+        fighter.hp = 10 ** 9
+        fighters.append(fighter)
+    return fighters
+
+
+def _register_crowd_benchmarks():
+    from collisions import resolve_collisions
+    from visual_effects import EffectPool
+
+    def setup(count, broadphase):
+        fighters = _crowd(count)
+        effect_group = EffectPool(0)
+
+        def run():
+            for fighter in fighters:
+                fighter.current_state = 'Jab'
+                fighter.current_frame = fighter.attacks['Jab'].hit_frame
+                fighter.has_hit = False
+            resolve_collisions(fighters, effect_group, {}, None, broadphase=broadphase)
+        return run
+
+    # 브로드페이즈(sort-and-sweep)와 전체 쌍 검사의 인원수별 비교
+    for count in (2, 8, 32, 128):
+        for label, broadphase in (("sweep", True), ("brute", False)):
+            benchmark(f"resolve_collisions/{label}_{count}", repeat=300, warmup=10)(
+                lambda count=count, broadphase=broadphase: setup(count, broadphase))
+
+
+@benchmark("GameScreen.draw/frame", repeat=500, warmup=20)
+def bench_draw():
+    from game_screen import load_game_background
+
+    screen = pygame.display.get_surface()
+    game_screen = _new_game_screen()
+    game_screen.bg_image = load_game_background(SCREEN_WIDTH, SCREEN_HEIGHT)
+    for _ in range(30):
+        game_screen.match.step(0, 0)
+
+    return lambda: game_screen.draw(screen)
+
+
+# ==================================================
+# 실행 / 비교
+# ==================================================
+def run_all(only=None):
+    results = {}
+    real_stdout = sys.stdout
+    for name, setup, repeat, warmup in BENCHMARKS:
+        if only and only not in name:
+            continue
+        # 에셋 경고 등 print 때문에 측정이 흔들리지 않도록 stdout을 잠시 버림
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            results[name] = run_one(setup, repeat, warmup)
+        finally:
+            sys.stdout.close()
+            sys.stdout = real_stdout
+        r = results[name]
+        print(f"{name:45s} median {r['median_us']:10.1f} us   p90 {r['p90_us']:10.1f}   p99 {r['p99_us']:10.1f}")
+    return results
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """기준값 대비 중앙값 변화를 출력하고, 회귀한 항목 수를 반환합니다."""
+    regressions = 0
+    print("\n--- 기준값 비교 (median) ---")
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:45s} (기준값 없음)")
+            continue
+        change = r['median_us'] / base['median_us'] - 1.0
+        mark = ""
+        if change > threshold:
+            mark = "  <-- 회귀"
+            regressions += 1
+        print(f"{name:45s} {base['median_us']:10.1f} -> {r['median_us']:10.1f} us  ({change:+.1%}){mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Boxing King 핫패스 벤치마크")
+    parser.add_argument("--only", help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from combat_log import COMBAT_LOG, LEVEL_OFF
+    COMBAT_LOG.set_level(LEVEL_OFF)  # 배포 설정과 같이 전투 로그 없이 측정
+
+    _register_folder_benchmarks()
+    _register_crowd_benchmarks()
+    results = run_all(args.only)
+
+    payload = {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'results': results,
+    }
+    path = args.baseline if args.save_baseline else args.output
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2)
+    print(f"\n저장: {path}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"기준값 파일이 없습니다: {args.baseline} (--save-baseline 으로 먼저 만드세요)")
+            sys.exit(2)
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
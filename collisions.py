@@ -1,118 +1,157 @@
 # (파일: collisions.py)
 
 import pygame
-from visual_effects import VisualEffect
+from combat_log import COMBAT_LOG, LEVEL_DEBUG, EVENT_HIT, EVENT_BLOCK, EVENT_INVINCIBLE
 
+BROADPHASE_MIN_FIGHTERS = 8  # 이보다 적으면 정렬 비용이 더 커서 모든 쌍을 바로 검사
 
-def handle_player_collisions(player1, player2, effect_group, effect_frames, sounds):
+
+def find_candidate_pairs(players, hitboxes):
+    """
+    x축 sort-and-sweep 브로드페이즈.
+    hitboxes: {공격자 인덱스: 히트박스 Rect}
+    반환값: 히트박스와 상대 허트박스의 x 구간이 겹치는 (공격자 인덱스, 피격자 인덱스) 목록 (인덱스 순 정렬)
     """
-    타격 판정, 이펙트 생성(방향 적용), 사운드 재생
+    # (왼쪽, 오른쪽, 종류, 인덱스) - 종류 0: 허트박스, 1: 히트박스
+    edges = [(player.hurtbox_absolute.left, player.hurtbox_absolute.right, 0, i)
+             for i, player in enumerate(players)]
+    edges.extend((box.left, box.right, 1, i) for i, box in hitboxes.items())
+    edges.sort()
+
+    pairs = []
+    open_hurt = []  # 아직 구간이 끝나지 않은 [(오른쪽, 인덱스)]
+    open_hit = []
+    for left, right, kind, index in edges:
+        open_hurt = [entry for entry in open_hurt if entry[0] > left]
+        open_hit = [entry for entry in open_hit if entry[0] > left]
+        if kind == 0:
+            pairs.extend((attacker, index) for _, attacker in open_hit if attacker != index)
+            open_hurt.append((right, index))
+        else:
+            pairs.extend((index, defender) for _, defender in open_hurt if defender != index)
+            open_hit.append((right, index))
+
+    pairs.sort()
+    return pairs
+
+
+def masks_overlap(attacker, defender, hitbox):
     """
+    정밀 판정: 히트박스와 허트박스가 겹치는 영역 안에서 공격자 그림과 피격자 그림의 픽셀이 실제로 닿는지.
+    영역 크기의 마스크 하나만 만들므로 비용은 히트박스 크기로 제한됩니다.
+    마스크가 없으면 (헤드리스 프레임) 사각형 판정 결과를 그대로 씁니다.
+    """
+    attacker_mask = attacker.current_mask()
+    defender_mask = defender.current_mask()
+    if attacker_mask is None or defender_mask is None:
+        return True
+
+    area = hitbox.clip(defender.hurtbox_absolute)
+    window = pygame.mask.Mask(area.size, fill=True)
+    # 영역 안의 공격자 픽셀 (히트박스 밖의 몸통이 상대에 겹치는 건 타격이 아님)
+    strike = window.overlap_mask(attacker_mask, (attacker.rect.x - area.x, attacker.rect.y - area.y))
+    return strike.overlap(defender_mask, (defender.rect.x - area.x, defender.rect.y - area.y)) is not None
+
 
-    AWAKEN_MULTIPLIER = 1.5
-
-    # ==================================================
-    # 1. P1(공격) -> P2(피격)  [방향: 정방향]
-    # ==================================================
-    absolute_hitbox_p1 = player1.get_absolute_hitbox()
-
-    if (absolute_hitbox_p1 and
-            player1.has_hit == False and
-            player2.is_alive):
-
-        if absolute_hitbox_p1.colliderect(player2.hurtbox_absolute):
-            player1.has_hit = True
-
-            # 1. 펀치 소리
-            attack_type = player1.current_state
-            if attack_type in sounds:
-                sounds[attack_type].play()
-
-            # 2. 이펙트 위치 (교집합 중심)
-            intersection = absolute_hitbox_p1.clip(player2.hurtbox_absolute)
-            hit_pos = intersection.center
-
-            # 3. 상태별 분기
-            if player2.current_state == 'Blocking':
-                print("P2 Blocked!")
-                if 'BlockEffect' in effect_frames:
-                    # P1 공격이므로 flip=False (기본)
-                    effect = VisualEffect(hit_pos, effect_frames['BlockEffect'], flip=False)
-                    effect_group.add(effect)
-
-                if 'Block' in sounds: sounds['Block'].play()
-
-            elif player2.current_state == 'Dizzy':
-                print("P2 is Invincible!")
-
-            else:
-                # 타격 이펙트 (flip=False)
-                if 'HitEffect' in effect_frames:
-                    effect = VisualEffect(hit_pos, effect_frames['HitEffect'], flip=False)
-                    effect_group.add(effect)
-
-                # 데미지 처리
-                was_alive = player2.is_alive
-                current_attack = player1.attacks[player1.current_state]
-                if current_attack.is_ko_move:
-                    player2.take_damage(player2.max_hp)
-                else:
-                    damage = current_attack.damage
-                    if player1.is_awakened: damage *= AWAKEN_MULTIPLIER
-                    player2.take_damage(damage)
-
-                if was_alive and not player2.is_alive:
-                    if 'Bell' in sounds: sounds['Bell'].play()
-
-    # ==================================================
-    # 2. P2(공격) -> P1(피격) [방향: 반대방향(Flip)]
-    # ==================================================
-    absolute_hitbox_p2 = player2.get_absolute_hitbox()
-
-    if (absolute_hitbox_p2 and
-            player2.has_hit == False and
-            player1.is_alive):
-
-        if absolute_hitbox_p2.colliderect(player1.hurtbox_absolute):
-            player2.has_hit = True
-
-            # 1. 펀치 소리
-            attack_type = player2.current_state
-            if attack_type in sounds:
-                sounds[attack_type].play()
-
-            # 2. 이펙트 위치
-            intersection = absolute_hitbox_p2.clip(player1.hurtbox_absolute)
-            hit_pos = intersection.center
-
-            if player1.current_state == 'Blocking':
-                print("P1 Blocked!")
-                if 'BlockEffect' in effect_frames:
-                    # ▼▼▼ [수정] P2 공격이므로 flip=True ▼▼▼
-                    effect = VisualEffect(hit_pos, effect_frames['BlockEffect'], flip=True)
-                    effect_group.add(effect)
-
-                if 'Block' in sounds: sounds['Block'].play()
-
-            elif player1.current_state == 'Dizzy':
-                print("P1 is Invincible!")
-
-            else:
-                # 타격 이펙트
-                if 'HitEffect' in effect_frames:
-                    # ▼▼▼ [수정] P2 공격이므로 flip=True ▼▼▼
-                    effect = VisualEffect(hit_pos, effect_frames['HitEffect'], flip=True)
-                    effect_group.add(effect)
-
-                # 데미지 처리
-                was_alive = player1.is_alive
-                current_attack = player2.attacks[player2.current_state]
-                if current_attack.is_ko_move:
-                    player1.take_damage(player1.max_hp)
-                else:
-                    damage = current_attack.damage
-                    if player2.is_awakened: damage *= AWAKEN_MULTIPLIER
-                    player1.take_damage(damage)
-
-                if was_alive and not player1.is_alive:
-                    if 'Bell' in sounds: sounds['Bell'].play()
\ No newline at end of file
+def resolve_collisions(players, effect_group, effect_frames, sounds, broadphase=True, precise=False):
+    """
+    N명 타격 판정, 이펙트 생성(방향 적용), 사운드 재생
+    - 공격자 인덱스 순서대로 처리하며, 한 번의 공격은 한 명만 맞힙니다. (has_hit)
+    - 같은 team끼리는 맞지 않습니다.
+    effect_group: visual_effects.EffectPool, effect_frames: {이름: (정방향, 반전) 프레임}
+    sounds: sound_bank.SoundPlayer (None이면 소리 없음)
+    broadphase: False면 인원수와 상관없이 모든 쌍을 검사 (비교/디버그용)
+    precise: True면 사각형이 겹친 뒤 프레임 마스크로 한 번 더 확인 (masks_overlap)
+    반환값: 이번 틱에 맞은 타격 목록 [(공격자, 피격자, 기술 이름, 결과)]
+            결과는 'hit' / 'block' / 'invincible'
+    """
+    hitboxes = {}
+    for i, player in enumerate(players):
+        if not player.has_hit:
+            hitbox = player.get_absolute_hitbox()
+            if hitbox is not None:
+                hitboxes[i] = hitbox
+    if not hitboxes:
+        return []
+
+    if broadphase and len(players) >= BROADPHASE_MIN_FIGHTERS:
+        pairs = find_candidate_pairs(players, hitboxes)
+    else:
+        pairs = [(a, d) for a in hitboxes for d in range(len(players)) if a != d]
+
+    results = []
+    for a, d in pairs:
+        attacker, defender = players[a], players[d]
+        if attacker.has_hit or not defender.is_alive:
+            continue
+        if attacker.team is not None and attacker.team == defender.team:
+            continue
+
+        # 앞선 타격으로 공격자의 상태가 바뀌었을 수 있으므로 (Dizzy/KO) 다시 가져옴
+        hitbox = attacker.get_absolute_hitbox()
+        if hitbox is None or not hitbox.colliderect(defender.hurtbox_absolute):
+            continue
+        if precise and not masks_overlap(attacker, defender, hitbox):
+            continue
+
+        results.append(_apply_hit(attacker, defender, hitbox, effect_group, effect_frames, sounds))
+    return results
+
+
+def _apply_hit(attacker, defender, hitbox, effect_group, effect_frames, sounds):
+    """맞은 한 번을 처리하고 (공격자, 피격자, 기술 이름, 결과)를 반환합니다."""
+    attacker.has_hit = True
+
+    attack_type = attacker.current_state  # 펀치 소리는 결과가 정해진 뒤 냄 (KO면 펀치 소리 대신 'KO')
+
+    # 1. 이펙트 위치 (교집합 중심), 방향은 공격자를 따름
+    hit_pos = hitbox.clip(defender.hurtbox_absolute).center
+    flip = attacker.flip_images
+
+    # 2. 상태별 분기
+    if defender.current_state == 'Blocking':
+        if COMBAT_LOG.level >= LEVEL_DEBUG:
+            COMBAT_LOG.emit(EVENT_BLOCK, attacker.name, defender.name, attack_type, 0, defender.hp, *hit_pos)
+        if 'BlockEffect' in effect_frames:
+            effect_group.spawn(hit_pos, effect_frames['BlockEffect'][flip])
+        if sounds is not None:
+            sounds.play(attack_type)
+            sounds.play('Block')
+        return (attacker, defender, attack_type, 'block')
+
+    if defender.current_state == 'Dizzy':
+        if sounds is not None: sounds.play(attack_type)
+        if COMBAT_LOG.level >= LEVEL_DEBUG:
+            COMBAT_LOG.emit(EVENT_INVINCIBLE, attacker.name, defender.name, attack_type, 0, defender.hp, *hit_pos)
+        return (attacker, defender, attack_type, 'invincible')
+
+    # 타격 이펙트
+    if 'HitEffect' in effect_frames:
+        effect_group.spawn(hit_pos, effect_frames['HitEffect'][flip])
+
+    # 데미지 처리
+    was_alive = defender.is_alive
+    current_attack = attacker.attacks[attack_type]
+    if current_attack.is_ko_move:
+        damage = defender.max_hp
+    else:
+        damage = current_attack.damage
+        if attacker.is_awakened: damage *= attacker.awaken_multiplier
+    defender.take_damage(damage)
+
+    if COMBAT_LOG.level >= LEVEL_DEBUG:
+        COMBAT_LOG.emit(EVENT_HIT, attacker.name, defender.name, attack_type, damage, defender.hp, *hit_pos)
+
+    if sounds is not None:
+        if was_alive and not defender.is_alive:
+            sounds.play('KO')
+            sounds.play('Bell')
+        else:
+            sounds.play(attack_type)
+
+    return (attacker, defender, attack_type, 'hit')
+
+
+def handle_player_collisions(player1, player2, effect_group, effect_frames, sounds):
+    """1:1 경기용 타격 판정 (resolve_collisions의 2인 버전)"""
+    return resolve_collisions((player1, player2), effect_group, effect_frames, sounds)
\ No newline at end of file
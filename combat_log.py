@@ -0,0 +1,151 @@
+# (파일: combat_log.py)
+#
+# 전투 이벤트 로그. 프레임 루프에서 print를 직접 부르지 않고,
+# 미리 할당된 링 버퍼에 타입이 있는 이벤트를 적어 두면 백그라운드 스레드가 모아서 출력합니다.
+#
+#   if COMBAT_LOG.level >= LEVEL_DEBUG:
+#       COMBAT_LOG.emit(EVENT_HIT, attacker.name, defender.name, move, damage, defender.hp, x, y)
+#
+# 레벨이 LEVEL_OFF면 호출하는 쪽의 비교 한 번으로 끝나고, 쓰기 스레드도 시작하지 않습니다.
+# 버퍼가 가득 차면 (출력이 느려서) 기다리지 않고 이벤트를 버린 뒤 버린 개수만 셉니다.
+
+import atexit
+import sys
+import threading
+
+# --- 레벨 ---
+LEVEL_OFF = 0
+LEVEL_INFO = 1   # KO, Dizzy, 각성
+LEVEL_DEBUG = 2  # 모든 타격/방어/무적
+
+LEVEL_NAMES = {'off': LEVEL_OFF, 'info': LEVEL_INFO, 'debug': LEVEL_DEBUG}
+
+# --- 이벤트 종류 ---
+EVENT_HIT = 0
+EVENT_BLOCK = 1
+EVENT_INVINCIBLE = 2
+EVENT_DIZZY = 3
+EVENT_KO = 4
+EVENT_AWAKEN = 5
+
+EVENT_NAMES = ('HIT', 'BLOCK', 'INVINCIBLE', 'DIZZY', 'KO', 'AWAKEN')
+EVENT_LEVELS = (LEVEL_DEBUG, LEVEL_DEBUG, LEVEL_DEBUG, LEVEL_INFO, LEVEL_INFO, LEVEL_INFO)
+
+BUFFER_CAPACITY = 4096
+FLUSH_INTERVAL = 0.1  # 초
+
+
+class CombatLog:
+    """
+    단일 생산자(시뮬레이션) / 단일 소비자(쓰기 스레드) 링 버퍼.
+    필드별 리스트를 미리 만들어 두고 emit은 값만 덮어쓰므로, 이벤트마다 객체를 만들지 않습니다.
+    """
+
+    def __init__(self, capacity=BUFFER_CAPACITY, level=LEVEL_DEBUG, sink=None):
+        self.capacity = capacity
+        self.level = level
+        self.sink = sink  # write()가 있는 객체 (None이면 sys.stdout)
+        self.frame = 0    # 현재 시뮬레이션 틱 (Match.step이 갱신)
+
+        self._kind = [0] * capacity
+        self._frame = [0] * capacity
+        self._attacker = [None] * capacity
+        self._defender = [None] * capacity
+        self._move = [None] * capacity
+        self._damage = [0] * capacity
+        self._hp = [0] * capacity
+        self._x = [0] * capacity
+        self._y = [0] * capacity
+
+        self._head = 0  # 다음에 쓸 위치 (누적, 생산자만 증가)
+        self._tail = 0  # 다음에 읽을 위치 (누적, 소비자만 증가)
+        self.dropped = 0
+
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    # ==================================================
+    # 1. 기록 (시뮬레이션 스레드)
+    # ==================================================
+    def emit(self, kind, attacker, defender, move, damage, hp, x, y):
+        if EVENT_LEVELS[kind] > self.level:
+            return
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.dropped += 1
+            return
+
+        i = head % self.capacity
+        self._kind[i] = kind
+        self._frame[i] = self.frame
+        self._attacker[i] = attacker
+        self._defender[i] = defender
+        self._move[i] = move
+        self._damage[i] = damage
+        self._hp[i] = hp
+        self._x[i] = x
+        self._y[i] = y
+        self._head = head + 1  # 필드를 다 쓴 뒤에 공개
+
+        if self._thread is None:
+            self._start_writer()
+        elif head - self._tail >= self.capacity // 2:
+            self._wake.set()  # 반 이상 찼으면 주기를 기다리지 않고 바로 비움
+
+    def set_level(self, level):
+        self.level = level
+
+    # ==================================================
+    # 2. 출력 (쓰기 스레드)
+    # ==================================================
+    def _start_writer(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="combat-log", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            self.flush()
+
+    def format_event(self, i):
+        kind = self._kind[i]
+        text = f"[{self._frame[i]:6d}] {EVENT_NAMES[kind]:10s} "
+        if self._attacker[i] is not None:
+            text += f"{self._attacker[i]} -> {self._defender[i]} {self._move[i]}"
+        else:
+            text += f"{self._defender[i]}"
+        if kind == EVENT_HIT:
+            text += f" dmg={self._damage[i]:g}"
+        return text + f" hp={self._hp[i]:g} @({self._x[i]}, {self._y[i]})\n"
+
+    def flush(self):
+        head = self._head
+        if head == self._tail:
+            return
+        lines = [self.format_event(n % self.capacity) for n in range(self._tail, head)]
+        self._tail = head
+        sink = self.sink if self.sink is not None else sys.stdout
+        try:
+            sink.write(''.join(lines))
+            sink.flush()
+        except (OSError, ValueError):
+            pass  # 출력이 닫혀 있어도 게임은 계속 진행
+
+    def close(self):
+        """쓰기 스레드를 멈추고 남은 이벤트를 모두 출력합니다."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.flush()
+        if self.dropped:
+            sys.stderr.write(f"전투 로그: 버퍼가 가득 차 {self.dropped}개 이벤트를 버렸습니다.\n")
+            self.dropped = 0
+
+
+COMBAT_LOG = CombatLog()
+atexit.register(COMBAT_LOG.close)
\ No newline at end of file
@@ -0,0 +1,81 @@
+# (파일: dirty_renderer.py)
+
+import pygame
+
+
+class HudItem:
+    """
+    화면에 고정된 HUD 요소 (체력바, 텍스트 등).
+    key가 바뀌었거나 스프라이트와 겹칠 때만 다시 그립니다.
+    """
+
+    def __init__(self, rect, draw_fn):
+        self.rect = pygame.Rect(rect)
+        self.draw_fn = draw_fn  # draw_fn(surface)
+        self.last_key = None
+
+
+class DirtyRenderer:
+    """
+    더티 렉트 렌더러. 매 프레임 전체를 다시 그리지 않고
+    1) 지난 프레임/이번 프레임 스프라이트 자리, 2) 바뀐 HUD 자리만 배경을 복원한 뒤 다시 그리고,
+    그 사각형 목록을 반환합니다. (pygame.display.update(rects) 용)
+
+    반투명 가장자리가 두 번 블렌딩되지 않도록, 그려지는 모든 영역은 먼저 배경으로 복원합니다.
+    """
+
+    def __init__(self, background=None, fill_color=(0, 0, 0)):
+        self.background = background
+        self.fill_color = fill_color
+        self.prev_rects = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        """다음 render에서 화면 전체를 다시 그립니다. (화면 전환 직후 등)"""
+        self.full_redraw = True
+
+    def _restore(self, screen, rect):
+        if self.background:
+            screen.blit(self.background, rect, rect)
+        else:
+            screen.fill(self.fill_color, rect)
+
+    def render(self, screen, sprites, hud):
+        """
+        sprites: [(image, rect)] 그리는 순서대로
+        hud: [(HudItem, key)] - key가 지난번과 다르면 다시 그림 (None이면 숨김)
+        반환값: 이번 프레임에 바뀐 화면 사각형 목록
+        """
+        new_rects = [rect.copy() for _, rect in sprites]
+
+        if self.full_redraw:
+            self.full_redraw = False
+            self._restore(screen, screen.get_rect())
+            screen.blits([(image, rect) for image, rect in sprites], doreturn=False)
+            for item, key in hud:
+                item.last_key = key
+                if key is not None:
+                    item.draw_fn(screen)
+            self.prev_rects = new_rects
+            return [screen.get_rect()]
+
+        sprite_rects = self.prev_rects + new_rects
+
+        # 다시 그려야 하는 HUD: 값이 바뀌었거나 스프라이트(이전/현재 위치)와 겹침
+        dirty_hud = []
+        for item, key in hud:
+            if key != item.last_key or item.rect.collidelist(sprite_rects) != -1:
+                item.last_key = key
+                dirty_hud.append((item, key))
+
+        dirty = sprite_rects + [item.rect for item, _ in dirty_hud]
+        for rect in dirty:
+            self._restore(screen, rect)
+
+        screen.blits([(image, rect) for image, rect in sprites], doreturn=False)
+        for item, key in dirty_hud:
+            if key is not None:
+                item.draw_fn(screen)
+
+        self.prev_rects = new_rects
+        return dirty
\ No newline at end of file
@@ -0,0 +1,100 @@
+# (파일: frame_cache.py)
+
+import threading
+from collections import OrderedDict
+
+import utils
+import asset_bundle
+
+
+# 기본 메모리 예산 (바이트). 초과하면 가장 오래 쓰지 않은 항목부터 버립니다.
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+def _surface_bytes(surface):
+    """Surface 한 장이 차지하는 픽셀 메모리(바이트)를 추정합니다."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class FrameCache:
+    """
+    (폴더, 배율, 반전, 헤드리스) 키로 애니메이션 프레임을 보관하는 프로세스 전역 캐시.
+    반전 프레임은 디스크에서 다시 읽지 않고 캐시된 정방향 프레임을 뒤집어 만듭니다.
+    반환되는 FrameList는 여러 Player가 공유하므로 수정하지 마세요.
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (frames, size_bytes)
+        self._lock = threading.RLock()
+
+    def get(self, folder_path, scale_factor=1.0, flip_images=False, headless=False):
+        key = (folder_path, float(scale_factor), bool(flip_images), bool(headless))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+            if headless:
+                # 헤드리스 프레임은 크기만 있으므로 반전해도 같은 리스트를 씁니다.
+                frames = self.get(folder_path, scale_factor, False, True) if flip_images else \
+                    utils.stub_animation_frames(folder_path, scale_factor)
+            elif flip_images:
+                # 정방향 프레임을 캐시에서 가져와 뒤집기만 합니다.
+                base = self.get(folder_path, scale_factor, False)
+                frames = utils.flip_frames(base)
+            else:
+                # 구워 둔 번들이 최신이면 디코딩 없이 잘라 쓰고, 아니면 폴더에서 읽습니다.
+                bundle = asset_bundle.get_bundle()
+                frames = bundle.load_frames(folder_path, scale_factor) if bundle else None
+                if frames is None:
+                    frames = utils.decode_animation_frames(folder_path, scale_factor)
+
+            self._store(key, frames)
+            return frames
+
+    def _store(self, key, frames):
+        size = sum(_surface_bytes(img) for img in frames)
+        self._entries[key] = (frames, size)
+        self.used_bytes += size
+        self._evict(keep=key)
+
+    def _evict(self, keep=None):
+        """예산을 넘으면 LRU 순서로 항목을 버립니다. (방금 넣은 항목은 제외)"""
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            oldest_key = next(iter(self._entries))
+            if oldest_key == keep:
+                break
+            _, size = self._entries.pop(oldest_key)
+            self.used_bytes -= size
+
+    def set_budget(self, budget_bytes):
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.used_bytes = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 프로세스 전역 캐시 (GameScreen이 재생성되어도 유지됩니다)
+_frame_cache = FrameCache()
+
+
+def get_frame_cache():
+    return _frame_cache
\ No newline at end of file
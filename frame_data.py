@@ -0,0 +1,95 @@
+# (파일: frame_data.py)
+#
+# moves.json(기술별 데미지, 프레임별 히트박스/허트박스, 발동/후딜 구간)을
+# 좌우 방향별로 미리 반전까지 끝낸 조회 테이블로 컴파일합니다.
+# 런타임에는 (상태, 프레임) 인덱스 조회 + 위치 이동만 하면 됩니다.
+#
+# moves.json 기술 항목:
+#   damage, ko            : 데미지, KO 기술 여부
+#   active   [시작, 끝]   : 히트박스가 살아 있는 프레임 구간 (hitbox 하나를 구간 전체에 사용)
+#   hitboxes {프레임: 박스} : 프레임별로 다른 히트박스가 필요할 때 (active/hitbox 대신 또는 덮어쓰기)
+#   hurtboxes {프레임: 박스}: 해당 프레임에서만 기본 허트박스 대신 쓸 박스
+#   recovery [시작, 끝]   : 후딜 구간. 끝 프레임이 지나면 애니메이션이 남아 있어도 다른 행동 가능
+
+import json
+
+MOVES_PATH = "moves.json"
+
+_data_cache = {}
+_compiled_cache = {}
+
+
+def load_move_data(path=MOVES_PATH):
+    """moves.json을 읽습니다. (프로세스당 한 번)"""
+    data = _data_cache.get(path)
+    if data is None:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        _data_cache[path] = data
+    return data
+
+
+def mirror_box(box, frame_width, flip):
+    """1P 기준 박스를 방향에 맞게 (x, y, w, h) 튜플로 반환합니다."""
+    x, y, w, h = box
+    if flip:
+        x = frame_width - x - w
+    return (x, y, w, h)
+
+
+class CompiledMove:
+    """한 방향(1P/2P)용으로 컴파일된 기술 프레임 데이터."""
+    __slots__ = ('name', 'damage', 'is_ko_move', 'frame_count', 'hitboxes', 'hurtboxes',
+                 'active', 'actionable_frame')
+
+    def __init__(self, name, damage, is_ko_move, frame_count, hitboxes, hurtboxes, active, actionable_frame):
+        self.name = name
+        self.damage = damage
+        self.is_ko_move = is_ko_move
+        self.frame_count = frame_count
+        self.hitboxes = hitboxes      # 프레임별 (x, y, w, h) 또는 None - 이미 반전됨
+        self.hurtboxes = hurtboxes    # 프레임별 (x, y, w, h) - 이미 반전됨
+        self.active = active          # (시작, 끝) 프레임
+        self.actionable_frame = actionable_frame  # 이 프레임부터 다른 행동 가능
+
+
+def compile_move(name, move, default_hurtbox, frame_count, frame_width, flip):
+    hitboxes = [None] * frame_count
+    if 'hitbox' in move and 'active' in move:
+        start, end = move['active']
+        for frame in range(start, min(end, frame_count - 1) + 1):
+            hitboxes[frame] = mirror_box(move['hitbox'], frame_width, flip)
+    for frame, box in move.get('hitboxes', {}).items():
+        if int(frame) < frame_count:
+            hitboxes[int(frame)] = mirror_box(box, frame_width, flip) if box else None
+
+    hurtboxes = [mirror_box(default_hurtbox, frame_width, flip)] * frame_count
+    for frame, box in move.get('hurtboxes', {}).items():
+        if int(frame) < frame_count:
+            hurtboxes[int(frame)] = mirror_box(box, frame_width, flip)
+
+    active_frames = [i for i, box in enumerate(hitboxes) if box is not None]
+    active = (active_frames[0], active_frames[-1]) if active_frames else (-1, -1)
+
+    recovery_end = move.get('recovery', [0, frame_count - 1])[1]
+    actionable_frame = min(recovery_end + 1, frame_count)
+
+    return CompiledMove(name, move.get('damage', 0), move.get('ko', False), frame_count,
+                        tuple(hitboxes), tuple(hurtboxes), active, actionable_frame)
+
+
+def get_compiled_move(name, frame_count, frame_width, flip, data=None):
+    """(기술, 프레임 수, 프레임 폭, 방향) 별로 한 번만 컴파일해서 공유합니다."""
+    data = data if data is not None else load_move_data()
+    key = (id(data), name, frame_count, frame_width, flip)
+    entry = _compiled_cache.get(key)
+    if entry is None:
+        compiled = compile_move(name, data['moves'][name], data['hurtbox'], frame_count, frame_width, flip)
+        entry = (compiled, data)  # data를 같이 잡아 두어 id가 재사용되지 않게 함
+        _compiled_cache[key] = entry
+    return entry[0]
+
+
+def get_default_hurtbox(frame_width, flip, data=None):
+    data = data if data is not None else load_move_data()
+    return mirror_box(data['hurtbox'], frame_width, flip)
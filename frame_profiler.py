@@ -0,0 +1,254 @@
+# (파일: frame_profiler.py)
+#
+# 프레임 단계별 시간 측정기 + 오버레이.
+#   - main.py 루프와 Match.step 곳곳에서 PROFILER.lap('단계')를 부르면,
+#     직전 lap 이후 걸린 시간이 그 단계에 더해집니다. (한 프레임에 여러 틱이 돌면 합산)
+#   - F3: 최근 프레임의 단계별 누적 막대 그래프를 16.7ms 예산선과 함께 표시
+#   - 프레임 제한용 대기는 'wait'에 따로 모으고 막대/합계/예산 초과 집계에서 뺍니다.
+#     'tick'에는 예산보다 더 잔 만큼(oversleep)만 들어가므로, 합계는 실제로 프레임을 늦춘 시간입니다.
+#   - 종료 시 원시 샘플을 CSV(.csv) 또는 바이너리(그 외 확장자)로 저장
+#   - set_enabled를 부른 스레드(메인 루프)의 lap만 기록합니다. (시뮬레이션 스레드의 Match.step lap은 무시)
+#
+# 바이너리 형식 (리틀 엔디언):
+#   MAGIC, version, 단계 수, 프레임 수, 단계 이름 길이 + 이름(쉼표 구분 UTF-8),
+#   이후 프레임마다 단계별 float32 (ms)
+
+import struct
+import threading
+import time
+from array import array
+
+import pygame
+
+PHASES = ('wait', 'events', 'update', 'player_update', 'effects', 'collisions', 'draw', 'overlay', 'flip', 'tick')
+WAIT_PHASES = ('wait',)  # 일부러 쉰 시간 (프레임 합계에 넣지 않음)
+PHASE_COLORS = {
+    'wait': (110, 110, 110),
+    'events': (200, 200, 200), 'update': (120, 120, 255), 'player_update': (80, 200, 255),
+    'effects': (255, 160, 60), 'collisions': (255, 80, 80), 'draw': (80, 220, 80),
+    'overlay': (200, 90, 200), 'flip': (220, 220, 60), 'tick': (70, 70, 70),
+}
+
+FRAME_BUDGET_MS = 1000 / 60
+CAPACITY = 60 * 60 * 10  # 최근 10분치 프레임만 보관 (넘으면 오래된 것부터 덮어씀)
+
+MAGIC = b'BXPF'
+VERSION = 1
+_HEADER = struct.Struct('<4sBBI')
+
+# --- 오버레이 배치 (체력바 사이, 화면 위쪽 가운데) ---
+OVERLAY_SIZE = (400, 185)
+GRAPH_HEIGHT = 120
+GRAPH_MAX_MS = FRAME_BUDGET_MS * 2  # 그래프 맨 위 = 예산의 두 배
+BAR_WIDTH = 2
+LEGEND_INTERVAL = 30  # 범례 숫자는 이 프레임마다 한 번만 갱신
+
+
+class FrameProfiler:
+    def __init__(self, phases=PHASES, capacity=CAPACITY):
+        self.phases = phases
+        self.capacity = capacity
+        self.enabled = False
+        self.overlay_visible = False
+
+        self._index = {name: i for i, name in enumerate(phases)}
+        self._work = [i for i, name in enumerate(phases) if name not in WAIT_PHASES]  # 합계에 들어가는 단계
+        self._current = [0.0] * len(phases)  # 진행 중인 프레임의 단계별 누적 (초)
+        self._last = None
+        self._owner = None  # lap을 기록하는 스레드
+        self.samples = [array('f', bytes(4 * capacity)) for _ in phases]  # 단계별 ms
+        self.frame_count = 0
+
+        self._font = None
+        self._panel = None
+        self._graph = None
+        self._legend = None
+
+    # ==================================================
+    # 1. 측정
+    # ==================================================
+    def lap(self, phase):
+        """직전 lap 이후 걸린 시간을 phase에 더합니다."""
+        if not self.enabled or threading.get_ident() != self._owner:
+            return
+        now = time.perf_counter()
+        if self._last is not None:
+            self._current[self._index[phase]] += now - self._last
+        self._last = now
+
+    def lap_sleep(self):
+        """프레임 제한 대기(clock.tick 등) 직후. 예산까지 남아 있던 시간은 'wait'에,
+        그보다 더 잔 만큼(oversleep)만 'tick'에 더합니다."""
+        if not self.enabled or threading.get_ident() != self._owner:
+            return
+        now = time.perf_counter()
+        if self._last is not None:
+            elapsed = now - self._last
+            work = sum(self._current[i] for i in self._work)
+            planned = min(elapsed, max(0.0, FRAME_BUDGET_MS / 1000 - work))
+            self._current[self._index['wait']] += planned
+            self._current[self._index['tick']] += elapsed - planned
+        self._last = now
+
+    def end_frame(self):
+        """진행 중인 프레임을 샘플로 확정합니다. (main 루프 마지막, clock.tick 다음)"""
+        if not self.enabled:
+            return
+        slot = self.frame_count % self.capacity
+        current = self._current
+        for i, column in enumerate(self.samples):
+            column[slot] = current[i] * 1000.0
+            current[i] = 0.0
+        self.frame_count += 1
+        if self.overlay_visible:
+            self._push_graph_column(slot)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._last = None
+        self._current = [0.0] * len(self.phases)  # 꺼지기 전에 쌓이다 만 프레임은 버림
+        self._owner = threading.get_ident()
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self._graph = None  # 다시 켤 때는 그래프를 새로 채움
+
+    def recent(self, count):
+        """최근 count 프레임의 슬롯 번호 (오래된 것부터)"""
+        count = min(count, self.frame_count, self.capacity)
+        return [(self.frame_count - count + n) % self.capacity for n in range(count)]
+
+    # ==================================================
+    # 2. 오버레이
+    # ==================================================
+    def overlay_rect(self, screen_width):
+        rect = pygame.Rect((0, 0), OVERLAY_SIZE)
+        rect.midtop = (screen_width // 2, 10)
+        return rect
+
+    def _ms_to_height(self, ms):
+        return int(min(ms, GRAPH_MAX_MS) / GRAPH_MAX_MS * GRAPH_HEIGHT)
+
+    def _new_graph(self):
+        width = OVERLAY_SIZE[0] - 20
+        self._graph = pygame.Surface((width, GRAPH_HEIGHT))
+        self._graph.fill((0, 0, 0))
+        for slot in self.recent(width // BAR_WIDTH):
+            self._push_graph_column(slot)
+
+    def _push_graph_column(self, slot):
+        """그래프를 한 칸 왼쪽으로 밀고, 오른쪽 끝에 이 프레임의 누적 막대를 그립니다."""
+        if self._graph is None:
+            return
+        graph = self._graph
+        width = graph.get_width()
+        graph.scroll(-BAR_WIDTH, 0)
+        graph.fill((0, 0, 0), (width - BAR_WIDTH, 0, BAR_WIDTH, GRAPH_HEIGHT))
+
+        bottom = GRAPH_HEIGHT
+        total = 0.0
+        for name, column in zip(self.phases, self.samples):
+            ms = column[slot]
+            if ms <= 0.0 or name in WAIT_PHASES:
+                continue
+            total += ms
+            top = GRAPH_HEIGHT - self._ms_to_height(total)
+            if top < bottom:
+                graph.fill(PHASE_COLORS[name], (width - BAR_WIDTH, top, BAR_WIDTH, bottom - top))
+                bottom = top
+
+    def _render_legend(self):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        slots = self.recent(OVERLAY_SIZE[0] // BAR_WIDTH)
+        if not slots:
+            return None
+
+        legend = pygame.Surface((OVERLAY_SIZE[0] - 20, OVERLAY_SIZE[1] - GRAPH_HEIGHT - 15))
+        legend.fill((20, 20, 20))
+        work_columns = [self.samples[i] for i in self._work]
+        totals = [sum(column[slot] for column in work_columns) for slot in slots]
+        over = sum(1 for total in totals if total > FRAME_BUDGET_MS)
+        header = f"frame avg {sum(totals) / len(totals):5.2f} ms  max {max(totals):5.2f} ms  " \
+                 f"over {FRAME_BUDGET_MS:.1f}ms: {over}/{len(totals)}"
+        legend.blit(self._font.render(header, True, (255, 255, 255)), (0, 0))
+
+        # 단계별 평균 (폭이 모자라면 다음 줄로)
+        x, y = 0, 16
+        for name, column in zip(self.phases, self.samples):
+            avg = sum(column[slot] for slot in slots) / len(slots)
+            text = self._font.render(f"{name} {avg:.2f}", True, PHASE_COLORS[name])
+            if x and x + text.get_width() > legend.get_width():
+                x, y = 0, y + 14
+            legend.blit(text, (x, y))
+            x += text.get_width() + 8
+        return legend
+
+    def draw_overlay(self, screen):
+        """오버레이를 그리고 그린 영역을 반환합니다. (꺼져 있으면 None)"""
+        if not self.overlay_visible:
+            return None
+        rect = self.overlay_rect(screen.get_width())
+        if self._panel is None:
+            self._panel = pygame.Surface(rect.size)
+        if self._graph is None:
+            self._new_graph()
+        if self._legend is None or self.frame_count % LEGEND_INTERVAL == 0:
+            self._legend = self._render_legend()
+
+        panel = self._panel
+        panel.fill((20, 20, 20))
+        panel.blit(self._graph, (10, 10))
+        budget_y = 10 + GRAPH_HEIGHT - self._ms_to_height(FRAME_BUDGET_MS)
+        pygame.draw.line(panel, (255, 255, 255), (10, budget_y), (rect.width - 10, budget_y))
+        if self._legend is not None:
+            panel.blit(self._legend, (10, GRAPH_HEIGHT + 15))
+        screen.blit(panel, rect)
+        return rect
+
+    # ==================================================
+    # 3. 저장
+    # ==================================================
+    def export(self, path):
+        """기록된 프레임을 오래된 순서로 저장합니다. (.csv면 CSV, 아니면 바이너리)"""
+        slots = self.recent(self.capacity)
+        if path.endswith(".csv"):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("frame," + ",".join(self.phases) + ",total\n")  # total에는 wait 제외
+                first = self.frame_count - len(slots)
+                for n, slot in enumerate(slots):
+                    values = [column[slot] for column in self.samples]
+                    total = sum(values[i] for i in self._work)
+                    f.write(f"{first + n}," + ",".join(f"{v:.4f}" for v in values) + f",{total:.4f}\n")
+        else:
+            names = ",".join(self.phases).encode('utf-8')
+            rows = array('f')
+            for slot in slots:
+                rows.extend(column[slot] for column in self.samples)
+            with open(path, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, len(self.phases), len(slots)))
+                f.write(struct.pack('<H', len(names)) + names)
+                f.write(rows.tobytes())
+        return len(slots)
+
+
+def load_profile(path):
+    """바이너리 프로파일을 (단계 이름 목록, 프레임별 [ms...] 목록)으로 읽습니다."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, phase_count, frame_count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("지원하지 않는 프로파일 형식입니다.")
+    offset = _HEADER.size
+    (name_length,) = struct.unpack_from('<H', data, offset)
+    offset += 2
+    phases = data[offset:offset + name_length].decode('utf-8').split(",")
+    offset += name_length
+    values = array('f')
+    values.frombytes(data[offset:offset + 4 * phase_count * frame_count])
+    rows = [list(values[i * phase_count:(i + 1) * phase_count]) for i in range(frame_count)]
+    return phases, rows
+
+
+PROFILER = FrameProfiler()
\ No newline at end of file
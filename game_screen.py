@@ -2,13 +2,42 @@
 
 import pygame
 import os
-from player import Player
-from collisions import handle_player_collisions
-from utils import load_animation_frames
+import time
+from match import Match, P1_CONTROLS, P2_CONTROLS
+from input_system import InputSystem
+from sim_thread import SimulationThread, MatchSnapshot
+from replay import Replay, match_result
+from dirty_renderer import DirtyRenderer, HudItem
+from hud import HudLayer
+from text_cache import render_text
+from sim_clock import FixedStepAccumulator
+from sound_bank import get_sound_player
+
+
+def load_game_background(screen_width, screen_height):
+    try:
+        bg_image = pygame.image.load(os.path.join("Backgrounds", "game.png")).convert()
+        return pygame.transform.scale(bg_image, (screen_width, screen_height))
+    except:
+        print("게임 배경 이미지를 찾을 수 없습니다.")
+        return None
+
+
+def load_match_sounds():
+    """프로세스 전역 사운드 뱅크 (처음 한 번만 디코딩, 파일/볼륨은 sound_bank.SOUND_FILES)"""
+    return get_sound_player()
 
 
 class GameScreen:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, assets=None, replay=None, replay_dir=None, cpu=None,
+                 precise_hits=False):
+        """
+        assets: 미리 로드된 {'bg_image', 'sounds'} (preloader.MatchPreloader). 없으면 여기서 로드합니다.
+        replay: 주어지면 키보드 대신 리플레이 입력으로 진행합니다.
+        replay_dir: 주어지면 경기가 끝났을 때 입력 녹화를 이 폴더에 저장합니다.
+        cpu: 주어지면 2P를 이 컨트롤러(ai_controller.CpuController)가 조종합니다.
+        precise_hits: 프레임 마스크 정밀 타격 판정 (Match 참고)
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
 
@@ -16,70 +45,73 @@ class GameScreen:
         self.result_font = pygame.font.Font(None, 80)
         self.guide_font = pygame.font.Font(None, 40)
 
-        try:
-            self.bg_image = pygame.image.load(os.path.join("Backgrounds", "game.png")).convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (screen_width, screen_height))
-        except:
-            print("게임 배경 이미지를 찾을 수 없습니다.")
-            self.bg_image = None
-
-        # --- 이펙트 로드 ---
-        self.effect_frames = {
-            'BlockEffect': load_animation_frames('BlockEffect', scale_factor=2.0),
-            'HitEffect': load_animation_frames('HitEffect', scale_factor=2.0)
-        }
-        self.effect_group = pygame.sprite.Group()
-
-        # --- [추가] 사운드 로드 ---
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-
-        self.sounds = {}
-        try:
-            # Sounds 폴더에서 파일 로드 (파일명 정확해야 함)
-            self.sounds['Bell'] = pygame.mixer.Sound(os.path.join("Sounds", "boxing_matchbell.wav"))
-            self.sounds['Jab'] = pygame.mixer.Sound(os.path.join("Sounds", "MP_Left Hook.mp3"))
-            self.sounds['Straight'] = pygame.mixer.Sound(os.path.join("Sounds", "MP_Right Cross.mp3"))
-            self.sounds['Uppercut'] = pygame.mixer.Sound(os.path.join("Sounds", "MP_Right Hook.mp3"))
-
-            # 볼륨 조절
-            self.sounds['Bell'].set_volume(0.5)
-            self.sounds['Jab'].set_volume(0.6)
-            self.sounds['Straight'].set_volume(0.6)
-            self.sounds['Uppercut'].set_volume(0.6)
+        if assets is None:
+            assets = {'bg_image': load_game_background(screen_width, screen_height),
+                      'sounds': load_match_sounds()}
+        self.bg_image = assets['bg_image']
 
+        # --- [추가] 사운드 (sound_bank.SoundPlayer, 없으면 None) ---
+        self.sounds = assets['sounds']
+        if self.sounds is not None:
             # 게임 시작 알림 (종소리)
-            self.sounds['Bell'].play()
+            self.sounds.play('Bell')
 
-        except Exception as e:
-            print(f"사운드 로드 실패: {e}")
+        # --- 경기 (플레이어, 이펙트, 타격 판정) ---
+        self.match = Match(screen_width, screen_height, self.sounds, precise_hits=precise_hits)
+        self.player1 = self.match.player1
+        self.player2 = self.match.player2
+        self.effect_group = self.match.effect_group
 
-        # --- 플레이어 생성 ---
-        P1_SCALE = 0.5
-        P1_START_POS = (screen_width // 4, screen_height - 30)
-        P1_CONTROLS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_e, pygame.K_r, pygame.K_s)
+        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites.add(self.player1)
+        self.all_sprites.add(self.player2)
 
-        ANIM_FOLDERS = {
-            'Idle': 'Idle', 'Walk': 'Walk', 'Jab': 'PunchLeft', 'Straight': 'PunchRight',
-            'Uppercut': 'PunchUp', 'Blocking': 'Blocking', 'Dizzy': 'Dizzy', 'KO': 'KO'
-        }
+        # 렌더링 속도와 무관하게 고정 틱으로 시뮬레이션을 진행
+        self.accumulator = FixedStepAccumulator()
 
-        self.player1 = Player(P1_START_POS, P1_CONTROLS, ANIM_FOLDERS, screen_width, P1_SCALE, flip_images=False)
+        # --- HUD (체력바는 값이 바뀔 때만 다시 합성) ---
+        self.hud = HudLayer(self.player1, self.player2, screen_width)
 
-        P2_SCALE = 0.5
-        P2_START_POS = (screen_width * 3 // 4, screen_height - 30)
-        P2_CONTROLS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_u, pygame.K_i, pygame.K_o, pygame.K_DOWN)
+        # --- 더티 렉트 렌더링용 ---
+        self.renderer = DirtyRenderer(self.bg_image)
+        self.hud_bars = [HudItem(bar.rect, bar.blit) for bar in self.hud.bars]
+        self.hud_result = None
+        self.hud_guide = None
 
-        self.player2 = Player(P2_START_POS, P2_CONTROLS, ANIM_FOLDERS, screen_width, P2_SCALE, flip_images=True)
+        # --- 입력 녹화 / 재생 ---
+        self.replay = replay
+        # 정밀 판정 경기는 녹화하지 않음 (리플레이 검증은 마스크가 없는 헤드리스로 돌기 때문)
+        self.recorder = Replay() if replay is None and not precise_hits else None
+        self.replay_dir = replay_dir
+        self.cpu = cpu
 
-        self.all_sprites = pygame.sprite.Group()
-        self.all_sprites.add(self.player1)
-        self.all_sprites.add(self.player2)
+        # 키보드 입력 (이벤트로 키 상태를 관리하고 틱마다 스냅샷, handle_events에서 이벤트를 받음)
+        self.input_system = InputSystem((P1_CONTROLS, P2_CONTROLS))
+        self.input_system.sync(pygame.key.get_pressed())
 
-        self.game_over = False
-        self.winner_text = ""
+        # 롤백 넷플레이 세션 (netplay.RollbackSession). 있으면 세션이 self.match를 진행합니다.
+        self.netplay = None
+
+        # 시뮬레이션 스레드 (start_simulation_thread). 있으면 틱은 스레드가 돌리고 draw는 최신 스냅샷을 그립니다.
+        self.sim_thread = None
+
+        # 입력 지연 추적 (latency.LatencyTracer). drawn_tick은 마지막으로 그린 스냅샷의 틱
+        self.latency = None
+        self.drawn_tick = 0
+
+        # 경기 텔레메트리 (telemetry.TelemetryRecorder, 재생/넷플레이 경기는 기록하지 않음)
+        self.telemetry = None
+
+    @property
+    def game_over(self):
+        return self.match.game_over
+
+    @property
+    def winner_text(self):
+        return self.match.winner_text
 
     def handle_events(self, events):
+        self.input_system.feed(events)
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if self.game_over:
@@ -89,56 +121,124 @@ class GameScreen:
                         return "TITLE"
         return "PLAY"
 
-    def update(self):
-        self.all_sprites.update()
-        self.effect_group.update()
-
-        # [수정] 타격 판정에 sounds 딕셔너리 전달
-        handle_player_collisions(self.player1, self.player2, self.effect_group, self.effect_frames, self.sounds)
-
-        # 승패 판정
-        if not self.game_over:
-            if (not self.player1.is_alive and self.player1.current_state == 'KO') or \
-                    (not self.player2.is_alive and self.player2.current_state == 'KO'):
-                self.game_over = True
-                if not self.player1.is_alive:
-                    self.winner_text = "2P WINS!"
-                else:
-                    self.winner_text = "1P WINS!"
+    def update(self, dt_ms):
+        """dt_ms: 지난 프레임 이후 실제 경과 시간. 밀린 만큼 고정 틱을 여러 번 돌려 따라잡습니다.
+        (시뮬레이션 스레드가 있으면 틱은 스레드가 돌리므로 아무것도 하지 않음)"""
+        if self.sim_thread is not None:
+            return
+        self.accumulator.add(dt_ms)
+        for _ in range(self.accumulator.consume()):
+            self.tick()
+
+    def tick(self):
+        """고정 틱 하나: 입력 스냅샷 -> 경기 진행 -> 녹화"""
+        p1_input, p2_input = self.read_inputs()
+        if self.netplay is not None:
+            # 상대 입력은 세션이 예측/롤백으로 채움 (넷플레이 경기는 녹화하지 않음)
+            self.netplay.advance((p1_input, p2_input)[self.netplay.local_index])
+            return
+        was_over = self.match.game_over
+        self.match.step(p1_input, p2_input)
+        if self.latency is not None and self.replay is None:
+            self.latency.on_tick(self.input_system.last_snapshot, self.match.players)
+        if self.telemetry is not None and self.replay is None:
+            self.telemetry.record(self.match)
+
+        if self.recorder is not None and not was_over:
+            self.recorder.record(p1_input, p2_input)
+            if self.match.game_over:
+                self.finish_recording()
+
+    # --- 시뮬레이션 스레드 ---
+    def start_simulation_thread(self):
+        self.sim_thread = SimulationThread(self)
+        self.sim_thread.start()
+
+    def close(self):
+        """화면을 버리기 전에 부릅니다. (시뮬레이션 스레드 정지)"""
+        if self.sim_thread is not None:
+            self.sim_thread.stop()
+            print(self.sim_thread.summary())
+
+    def make_snapshot(self):
+        """지금 틱의 그릴 거리를 복사합니다. (시뮬레이션 스레드에서는 틱마다 호출)"""
+        sprites = tuple((sprite.image, sprite.rect.copy()) for sprite in self.all_sprites) + \
+            tuple((effect.image, effect.rect.copy()) for effect in self.effect_group)
+        hud = tuple(bar.state_key() for bar in self.hud.bars)
+        return MatchSnapshot(self.match.tick, sprites, hud, self.match.game_over, self.match.winner_text)
+
+    def current_snapshot(self):
+        return self.sim_thread.latest if self.sim_thread is not None else self.make_snapshot()
+
+    def read_inputs(self):
+        """이번 틱의 (P1, P2) 입력 비트. 재생 중이면 리플레이에서, 아니면 입력 스냅샷에서 읽습니다."""
+        if self.replay is not None:
+            tick = self.match.tick
+            return self.replay.inputs[tick] if tick < len(self.replay) else (0, 0)
+
+        p1_input, p2_input = self.input_system.snapshot(self.match.tick, self.match.players).inputs
+        if self.cpu is not None:
+            return p1_input, self.cpu(self.match, 1)
+        return p1_input, p2_input
+
+    def finish_recording(self):
+        self.recorder.result = match_result(self.match)
+        if self.replay_dir:
+            os.makedirs(self.replay_dir, exist_ok=True)
+            stem = os.path.join(self.replay_dir, time.strftime("replay_%Y%m%d_%H%M%S"))
+            path = stem + ".bxr"
+            n = 1
+            while os.path.exists(path):  # 같은 초에 끝난 경기가 있으면 번호를 붙임
+                path = f"{stem}_{n}.bxr"
+                n += 1
+            self.recorder.save(path)
+            print(f"리플레이 저장: {path}")
 
     def draw(self, screen):
+        snapshot = self.current_snapshot()
+        self.drawn_tick = snapshot.tick
         if self.bg_image:
             screen.blit(self.bg_image, (0, 0))
         else:
             screen.fill((0, 0, 0))
 
-        self.all_sprites.draw(screen)
-        self.effect_group.draw(screen)
+        screen.blits(snapshot.sprites, doreturn=False)
 
-        self.draw_health_bar(screen, 20, 20, self.player1)
-        self.draw_health_bar(screen, self.screen_width - 320, 20, self.player2)
+        self.hud.draw(screen, snapshot.hud)
 
-        if self.game_over:
-            self.draw_text_center(screen, self.winner_text, self.result_font, (255, 0, 0), -50)
+        if snapshot.game_over:
+            self.draw_text_center(screen, snapshot.winner_text, self.result_font, (255, 0, 0), -50)
             self.draw_text_center(screen, "Press R to Restart / ESC to Title", self.guide_font, (255, 255, 255), 50)
 
-    def draw_health_bar(self, surface, x, y, player):
-        hp = max(0, player.hp)
-        max_hp = player.max_hp
-        BAR_LENGTH = 300
-        BAR_HEIGHT = 20
-        fill_percent = (hp / max_hp)
-        fill_length = int(BAR_LENGTH * fill_percent)
-
-        outline_rect = pygame.Rect(x, y, BAR_LENGTH, BAR_HEIGHT)
-        fill_rect = pygame.Rect(x, y, fill_length, BAR_HEIGHT)
-
-        bar_color = (255, 255, 0) if player.is_awakened else (0, 255, 0)
-
-        pygame.draw.rect(surface, (255, 0, 0), outline_rect)
-        pygame.draw.rect(surface, bar_color, fill_rect)
+    def draw_dirty(self, screen):
+        """더티 렉트 버전의 draw. 움직인 스프라이트/사라진 이펙트/바뀐 HUD 자리만 다시 그리고
+        pygame.display.update에 넘길 사각형 목록을 반환합니다."""
+        snapshot = self.current_snapshot()
+        self.drawn_tick = snapshot.tick
+        for bar, key in zip(self.hud.bars, snapshot.hud):
+            bar.refresh(key)
+        hud = [(item, key) for item, key in zip(self.hud_bars, snapshot.hud)]
+
+        if snapshot.game_over:
+            winner_text = snapshot.winner_text
+            if self.hud_result is None:
+                result_rect = self.text_rect(winner_text, self.result_font, -50)
+                self.hud_result = HudItem(result_rect, lambda s: self.draw_text_center(
+                    s, winner_text, self.result_font, (255, 0, 0), -50))
+                guide_text = "Press R to Restart / ESC to Title"
+                self.hud_guide = HudItem(self.text_rect(guide_text, self.guide_font, 50), lambda s: self.draw_text_center(
+                    s, guide_text, self.guide_font, (255, 255, 255), 50))
+            hud += [(self.hud_result, winner_text), (self.hud_guide, True)]
+
+        return self.renderer.render(screen, snapshot.sprites, hud)
+
+    def text_rect(self, text, font, y_offset=0):
+        """draw_text_center로 그렸을 때 텍스트가 차지하는 사각형"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        rect.center = (self.screen_width // 2, self.screen_height // 2 + y_offset)
+        return rect
 
     def draw_text_center(self, surface, text, font, color, y_offset=0):
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, color)
         rect = text_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + y_offset))
         surface.blit(text_surface, rect)
\ No newline at end of file
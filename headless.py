@@ -0,0 +1,106 @@
+# (파일: headless.py)
+#
+# 화면/사운드 없이 Match를 최대 속도로 돌리는 헤드리스 엔진.
+#   python headless.py --matches 1000 --seed 1
+#
+# 창을 열지 않고, 이미지도 디코딩하지 않으며 (FrameStub), 벽시계 없이 고정 틱으로만 진행합니다.
+
+import argparse
+import random
+import time
+
+from inputs import (INPUT_LEFT, INPUT_RIGHT, INPUT_JAB, INPUT_STRAIGHT, INPUT_UPPERCUT, INPUT_BLOCK)
+from match import Match
+from combat_log import COMBAT_LOG, LEVEL_NAMES
+from ai_controller import CpuController, DIFFICULTY
+
+SCREEN_WIDTH = 1080
+SCREEN_HEIGHT = 720
+MAX_TICKS = 60 * 60 * 3  # 3분이 지나면 무승부 처리
+
+
+class ScriptedController:
+    """(지속 틱 수, 입력 비트) 목록을 차례대로 재생하고 끝나면 처음부터 반복합니다."""
+
+    def __init__(self, script):
+        self.script = script
+        self.index = 0
+        self.remaining = script[0][0] if script else 0
+
+    def __call__(self, match, player_index):
+        if not self.script:
+            return 0
+        if self.remaining <= 0:
+            self.index = (self.index + 1) % len(self.script)
+            self.remaining = self.script[self.index][0]
+        self.remaining -= 1
+        return self.script[self.index][1]
+
+
+class RandomController:
+    """일정 간격마다 무작위로 행동을 고르는 컨트롤러 (시드 고정 시 재현 가능)."""
+
+    ACTIONS = [
+        (0.30, 'forward'), (0.10, 'back'), (0.10, INPUT_JAB), (0.05, INPUT_STRAIGHT),
+        (0.02, INPUT_UPPERCUT), (0.08, INPUT_BLOCK), (0.35, 0),
+    ]
+
+    def __init__(self, seed=None, interval=10):
+        self.rng = random.Random(seed)
+        self.interval = interval
+        self.current = 0
+
+    def __call__(self, match, player_index):
+        if match.tick % self.interval == 0:
+            forward = INPUT_RIGHT if player_index == 0 else INPUT_LEFT
+            back = INPUT_LEFT if player_index == 0 else INPUT_RIGHT
+            roll = self.rng.random()
+            for weight, action in self.ACTIONS:
+                roll -= weight
+                if roll < 0:
+                    break
+            self.current = {'forward': forward, 'back': back}.get(action, action)
+        return self.current
+
+
+def run_match(p1_controller, p2_controller, max_ticks=MAX_TICKS):
+    """컨트롤러 두 개로 한 경기를 끝까지 돌리고 결과 딕셔너리를 반환합니다."""
+    match = Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True)
+
+    while not match.game_over and match.tick < max_ticks:
+        match.step(p1_controller(match, 0), p2_controller(match, 1))
+
+    return {
+        'winner': match.winner,
+        'ticks': match.tick,
+        'p1_hp': match.player1.hp,
+        'p2_hp': match.player2.hp,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 경기 시뮬레이션")
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", choices=LEVEL_NAMES, default="off", help="전투 로그 레벨")
+    parser.add_argument("--cpu", choices=DIFFICULTY, help="2P를 이 난이도의 CPU로 (기본: 무작위 입력)")
+    args = parser.parse_args()
+    COMBAT_LOG.set_level(LEVEL_NAMES[args.log_level])
+
+    wins = [0, 0, 0]
+    total_ticks = 0
+    start = time.perf_counter()
+    for i in range(args.matches):
+        p2 = CpuController(args.cpu) if args.cpu else RandomController(args.seed + 2 * i + 1)
+        result = run_match(RandomController(args.seed + 2 * i), p2)
+        wins[result['winner']] += 1
+        total_ticks += result['ticks']
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.matches} 경기, {total_ticks} 틱, {elapsed:.2f} 초")
+    print(f"  경기/분: {args.matches / elapsed * 60:.0f},  틱/초: {total_ticks / elapsed:.0f}")
+    print(f"  1P 승: {wins[1]},  2P 승: {wins[2]},  무승부: {wins[0]}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
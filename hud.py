@@ -0,0 +1,65 @@
+# (파일: hud.py)
+
+import pygame
+
+BAR_LENGTH = 300
+BAR_HEIGHT = 20
+
+
+def draw_health_bar(surface, x, y, hp, max_hp, is_awakened):
+    hp = max(0, hp)
+    fill_percent = (hp / max_hp)
+    fill_length = int(BAR_LENGTH * fill_percent)
+
+    outline_rect = pygame.Rect(x, y, BAR_LENGTH, BAR_HEIGHT)
+    fill_rect = pygame.Rect(x, y, fill_length, BAR_HEIGHT)
+
+    bar_color = (255, 255, 0) if is_awakened else (0, 255, 0)
+
+    pygame.draw.rect(surface, (255, 0, 0), outline_rect)
+    pygame.draw.rect(surface, bar_color, fill_rect)
+
+
+class HealthBar:
+    """한 플레이어의 체력바. hp나 각성 상태가 바뀔 때만 미리 합성해 둔 Surface를 다시 그립니다."""
+
+    def __init__(self, player, pos):
+        self.player = player
+        self.rect = pygame.Rect(pos, (BAR_LENGTH, BAR_HEIGHT))
+        self.surface = pygame.Surface(self.rect.size)
+        self.key = None
+
+    def state_key(self):
+        return (self.player.hp, self.player.is_awakened)
+
+    def refresh(self, key=None):
+        """값이 바뀌었으면 다시 합성하고 True를 반환합니다.
+        key: (hp, 각성 여부) - 없으면 플레이어에서 바로 읽음 (스냅샷을 그릴 때는 스냅샷 값)"""
+        if key is None:
+            key = self.state_key()
+        if key == self.key:
+            return False
+        self.key = key
+        draw_health_bar(self.surface, 0, 0, key[0], self.player.max_hp, key[1])
+        return True
+
+    def draw(self, surface, key=None):
+        self.refresh(key)
+        self.blit(surface)
+
+    def blit(self, surface):
+        """마지막으로 합성한 체력바를 그대로 그립니다."""
+        surface.blit(self.surface, self.rect)
+
+
+class HudLayer:
+    """경기 화면의 HUD (양쪽 체력바)."""
+
+    def __init__(self, player1, player2, screen_width):
+        self.bars = [HealthBar(player1, (20, 20)),
+                     HealthBar(player2, (screen_width - 320, 20))]
+
+    def draw(self, surface, keys=None):
+        """keys: 체력바별 (hp, 각성 여부) 목록 (없으면 플레이어에서 바로 읽음)"""
+        for i, bar in enumerate(self.bars):
+            bar.draw(surface, keys[i] if keys is not None else None)
\ No newline at end of file
@@ -0,0 +1,126 @@
+# (파일: input_system.py)
+#
+# 이벤트 기반 입력. 틱마다 pygame.key.get_pressed()를 읽는 대신,
+# main.py가 모은 KEYDOWN/KEYUP 이벤트로 키 상태를 직접 관리하고 틱마다 모든 플레이어 입력을 한 번에 스냅샷으로 만듭니다.
+#   - 눌림 래치: 한 틱보다 짧게 눌렀다 뗀 키도 다음 스냅샷에 한 번은 들어갑니다.
+#   - 입력 버퍼: 동작 중(공격 모션, Dizzy 등)에 누른 공격은 BUFFER_TICKS 동안 보관했다가
+#     행동 가능한 첫 틱에 나갑니다. (여러 개면 마지막에 누른 것)
+# 스냅샷의 입력 비트가 곧 Match.step에 넘기는 값이므로, 리플레이/넷플레이에는 버퍼가 적용된 뒤의 입력이 기록됩니다.
+
+import threading
+import time
+
+import pygame
+
+from inputs import INPUT_BITS, INPUT_JAB, INPUT_STRAIGHT, INPUT_UPPERCUT
+
+BUFFER_TICKS = 18  # 0.3초 - 애니메이션 약 세 프레임 (한 프레임이 7틱)
+BUFFERED_BITS = INPUT_JAB | INPUT_STRAIGHT | INPUT_UPPERCUT
+
+
+class InputSnapshot:
+    """한 틱의 입력. time은 스냅샷을 만든 시각, press_times는 플레이어별로
+    이번 스냅샷에 처음 들어간 키 눌림의 시각 (없으면 None, 둘 다 time.perf_counter 기준 초)."""
+    __slots__ = ('tick', 'time', 'inputs', 'press_times')
+
+    def __init__(self, tick, time, inputs, press_times):
+        self.tick = tick
+        self.time = time
+        self.inputs = inputs
+        self.press_times = press_times
+
+
+class PlayerInput:
+    """플레이어 한 명의 키 상태와 입력 버퍼."""
+
+    def __init__(self, controls):
+        self.key_bits = dict(zip(controls, INPUT_BITS))
+        self.held = 0          # 지금 눌려 있는 비트
+        self.latched = 0       # 지난 스냅샷 이후 한 번이라도 눌린 비트 (이미 뗐어도 유지)
+        self.press_time = None
+        self.buffered = 0      # 보관 중인 공격 비트
+        self.buffered_tick = 0
+
+    def key_down(self, key, now):
+        bit = self.key_bits.get(key)
+        if bit is None:
+            return
+        self.held |= bit
+        self.latched |= bit
+        if self.press_time is None:
+            self.press_time = now
+        if bit & BUFFERED_BITS:
+            self.buffered = bit
+            self.buffered_tick = None  # 다음 스냅샷의 틱으로 기록
+
+    def key_up(self, key):
+        bit = self.key_bits.get(key)
+        if bit is not None:
+            self.held &= ~bit
+
+    def release_all(self):
+        self.held = 0
+
+    def sample(self, tick, actionable):
+        """이번 틱 입력 비트. actionable: 이 플레이어가 이번 틱에 새 행동을 받을 수 있는지"""
+        bits = self.held | self.latched
+        if self.buffered:
+            if self.buffered_tick is None:
+                self.buffered_tick = tick
+            if tick - self.buffered_tick > BUFFER_TICKS:
+                self.buffered = 0
+            elif actionable:
+                bits = (bits & ~BUFFERED_BITS) | self.buffered
+                self.buffered = 0
+        self.latched = 0
+        self.press_time = None
+        return bits
+
+
+class InputSystem:
+    """
+    control_sets: 플레이어별 조작 키 튜플 (좌, 우, 잽, 스트레이트, 어퍼컷, 방어)
+    feed(events)는 프레임마다 한 번, snapshot(tick, players)은 고정 틱마다 한 번 부릅니다.
+    """
+
+    def __init__(self, control_sets):
+        self.players = [PlayerInput(controls) for controls in control_sets]
+        self.last_snapshot = None
+        self._lock = threading.Lock()  # feed(메인 스레드)와 snapshot(시뮬레이션 스레드일 수 있음) 사이
+
+    def sync(self, keys):
+        """pygame.key.get_pressed() 결과로 눌려 있는 키를 맞춥니다. (화면 전환 직후처럼 이벤트를 못 본 경우)"""
+        for player in self.players:
+            player.held = 0
+            for key, bit in player.key_bits.items():
+                if keys[key]:
+                    player.held |= bit
+
+    def feed(self, events):
+        """pygame 이벤트에는 발생 시각이 없으므로 눌림 시각은 이벤트를 받은 시각입니다.
+        (이벤트에 pressed_at 속성이 있으면 그 값 - latency.py가 넣는 합성 입력)"""
+        now = time.perf_counter()
+        with self._lock:
+            self._feed(events, now)
+
+    def _feed(self, events, now):
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                for player in self.players:
+                    player.key_down(event.key, getattr(event, 'pressed_at', now))
+            elif event.type == pygame.KEYUP:
+                for player in self.players:
+                    player.key_up(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # 포커스를 잃으면 KEYUP이 오지 않으므로 모두 뗀 것으로 처리
+                for player in self.players:
+                    player.release_all()
+
+    def snapshot(self, tick, fighters):
+        """fighters: 플레이어 순서의 Player 목록 (버퍼를 내보낼지 판단)"""
+        with self._lock:
+            press_times = tuple(player.press_time for player in self.players)
+            inputs = tuple(player.sample(tick, fighter.is_alive and fighter.is_actionable())
+                           for player, fighter in zip(self.players, fighters))
+        self.last_snapshot = InputSnapshot(tick, time.perf_counter(), inputs, press_times)
+        return self.last_snapshot
\ No newline at end of file
@@ -0,0 +1,22 @@
+# (파일: inputs.py)
+
+# 한 플레이어의 한 틱 입력을 6비트 정수 하나로 표현합니다.
+# 비트 순서는 Player에 넘기는 controls 튜플 순서(좌, 우, 잽, 스트레이트, 어퍼컷, 방어)와 같습니다.
+INPUT_LEFT = 1 << 0
+INPUT_RIGHT = 1 << 1
+INPUT_JAB = 1 << 2
+INPUT_STRAIGHT = 1 << 3
+INPUT_UPPERCUT = 1 << 4
+INPUT_BLOCK = 1 << 5
+
+INPUT_BITS = (INPUT_LEFT, INPUT_RIGHT, INPUT_JAB, INPUT_STRAIGHT, INPUT_UPPERCUT, INPUT_BLOCK)
+INPUT_MASK = (1 << len(INPUT_BITS)) - 1
+
+
+def read_keyboard(controls, keys):
+    """pygame.key.get_pressed() 결과를 controls 순서의 입력 비트로 변환합니다."""
+    bits = 0
+    for key, bit in zip(controls, INPUT_BITS):
+        if keys[key]:
+            bits |= bit
+    return bits
@@ -0,0 +1,271 @@
+# (파일: latency.py)
+#
+# 입력 -> 화면 지연 측정과 프레임 페이싱.
+#
+# 1. LatencyTracer: 키 눌림 하나를 네 시점으로 추적합니다. (모두 time.perf_counter 기준)
+#      눌림   : KEYDOWN을 받은 시각 (이벤트에 pressed_at이 있으면 그 값 - 아래 측정용 합성 입력)
+#      소비   : 그 눌림이 들어간 입력 스냅샷을 만든 시각 (input_system.InputSnapshot.time)
+#      시뮬   : 그 플레이어가 새 행동(Walk, Jab 등)을 시작한 틱이 끝난 시각
+#      표시   : 그 틱을 그린 프레임의 flip이 끝난 시각
+#    행동 중(공격 모션, Dizzy 등)에 누른 키는 게임 규칙상 늦게 나가는 것이라 추적하지 않고 개수만 셉니다.
+#    반응이 EXPIRE_TICKS 안에 없어도 (이미 같은 방향으로 걷는 중 등) 버리고 개수만 셉니다.
+#
+# 2. FramePacer: main 루프의 대기 방식
+#      tick        : 기존처럼 flip 뒤에 clock.tick(fps)로 남은 시간을 잠 (입력은 잠에서 깬 직후에 읽음)
+#      early_sleep : 잠을 입력 읽기 앞으로 옮김. 최근 프레임 작업 시간만큼 일찍 깨서
+#                    입력을 읽자마자 시뮬/그리기/flip을 하므로 입력이 화면까지 가는 시간이 짧아짐
+#      busy_wait   : early_sleep과 같지만 마지막 BUSY_WAIT_MS는 잠 대신 시계를 보며 기다림 (OS 잠 해상도 보정)
+#
+#   python latency.py --modes tick early_sleep busy_wait --seconds 10
+#   -> 합성 키 입력을 넣으며 실제 GameScreen 루프를 모드별로 돌리고 지연 백분위를 비교합니다.
+
+import argparse
+import random
+import threading
+import time
+from collections import deque
+
+PACER_MODES = ('tick', 'early_sleep', 'busy_wait')
+BUSY_WAIT_MS = 2.0
+WORK_HISTORY = 30          # 작업 시간 예측에 쓰는 최근 프레임 수 (그중 최댓값 + 여유)
+WORK_MARGIN_MS = 1.0
+EXPIRE_TICKS = 30
+
+STAGES = ('input->consume', 'consume->sim', 'sim->present', 'input->present')
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+# ==================================================
+# 1. 지연 추적
+# ==================================================
+class LatencyTracer:
+    def __init__(self):
+        self.samples = {stage: [] for stage in STAGES}  # ms
+        self.expired = 0
+        self.busy = 0
+        self._pending = {}     # 플레이어 번호 -> [(눌림, 소비, 틱)] - 아직 반응 전
+        self._in_flight = []   # [(눌림, 소비, 시뮬, 틱)] - 반응했지만 아직 화면에 안 나감
+        self._last_states = {}
+        self._lock = threading.Lock()  # on_tick은 시뮬레이션 스레드에서 올 수 있음
+
+    def on_tick(self, snapshot, players):
+        """GameScreen.tick에서 Match.step 직후. snapshot: 이번 틱에 쓴 InputSnapshot"""
+        now = time.perf_counter()
+        with self._lock:
+            for index, player in enumerate(players):
+                state = (player.current_state, player.current_frame)
+                previous = self._last_states.get(index, ('Idle', 0))
+                self._last_states[index] = state
+
+                pending = self._pending.setdefault(index, [])
+                press_time = snapshot.press_times[index]
+                if press_time is not None:
+                    if previous[0] in player.looping_states:
+                        pending.append((press_time, snapshot.time, snapshot.tick))
+                    else:
+                        self.busy += 1
+                if not pending:
+                    continue
+                if self._reacted(player, previous, state):
+                    self._in_flight.extend((pressed, consumed, now, snapshot.tick + 1)
+                                           for pressed, consumed, _ in pending)
+                    pending.clear()
+                elif snapshot.tick - pending[0][2] > EXPIRE_TICKS:
+                    self.expired += len(pending)
+                    pending.clear()
+
+    @staticmethod
+    def _reacted(player, previous, state):
+        """새 행동을 시작했는지 (다른 상태로 바뀌었거나 같은 기술을 처음부터 다시 시작)"""
+        name, frame = state
+        if name == 'Idle' or (name not in player.looping_states and name not in player.attacks):
+            return False  # 키를 떼서 Idle, 맞아서 Dizzy/KO로 바뀐 건 눌림에 대한 반응이 아님
+        if name != previous[0]:
+            return True
+        return name in player.attacks and frame == 0 and previous[1] != 0
+
+    def on_present(self, drawn_tick, present_time=None):
+        """flip 직후. drawn_tick: 방금 그린 스냅샷의 틱 (Match.tick)"""
+        present_time = present_time if present_time is not None else time.perf_counter()
+        with self._lock:
+            remaining = []
+            for record in self._in_flight:
+                pressed, consumed, simulated, tick = record
+                if tick > drawn_tick:
+                    remaining.append(record)
+                    continue
+                pressed = min(pressed, consumed)
+                self.samples['input->consume'].append((consumed - pressed) * 1000)
+                self.samples['consume->sim'].append((simulated - consumed) * 1000)
+                self.samples['sim->present'].append((present_time - simulated) * 1000)
+                self.samples['input->present'].append((present_time - pressed) * 1000)
+            self._in_flight = remaining
+
+    def report(self, title):
+        lines = [f"[{title}] 입력 {len(self.samples['input->present'])}개 "
+                 f"(행동 중이라 제외 {self.busy}개, 반응 없음 {self.expired}개)"]
+        for stage in STAGES:
+            values = sorted(self.samples[stage])
+            if not values:
+                continue
+            cells = "  ".join(f"p{p} {percentile(values, p):6.2f}" for p in PERCENTILES)
+            lines.append(f"  {stage:15s} {cells}  max {values[-1]:6.2f} ms")
+        return "\n".join(lines)
+
+
+# ==================================================
+# 2. 프레임 페이싱
+# ==================================================
+class FramePacer:
+    """
+    main 루프에서:  pacer.wait() -> 이벤트/업데이트/그리기/flip -> dt_ms = pacer.end_frame()
+    end_frame은 다음 프레임의 GameScreen.update에 넘길 경과 시간(ms)을 반환합니다.
+    """
+
+    def __init__(self, mode='tick', fps=60, clock=None):
+        if mode not in PACER_MODES:
+            raise ValueError(f"알 수 없는 페이싱 모드: {mode}")
+        self.mode = mode
+        self.fps = fps
+        self.period = 1 / fps
+        self.clock = clock
+        if mode == 'tick' and clock is None:
+            import pygame
+            self.clock = pygame.time.Clock()
+
+        self.work_times = deque(maxlen=WORK_HISTORY)
+        self.frame_intervals = []  # flip 간격 (ms) - 페이싱 흔들림 확인용
+        now = time.perf_counter()
+        self.frame_start = now
+        self.last_end = now
+        self.next_deadline = now + self.period
+
+    def work_estimate(self):
+        if not self.work_times:
+            return self.period / 2
+        return min(self.period, max(self.work_times) + WORK_MARGIN_MS / 1000)
+
+    def wait(self):
+        """입력을 읽기 직전. early_sleep/busy_wait는 여기서 다음 flip 시각 - 예상 작업 시간까지 기다립니다."""
+        if self.mode != 'tick':
+            target = self.next_deadline - self.work_estimate()
+            if self.mode == 'busy_wait':
+                self._sleep(target - BUSY_WAIT_MS / 1000)
+                while time.perf_counter() < target:
+                    pass
+            else:
+                self._sleep(target)
+        self.frame_start = time.perf_counter()
+
+    @staticmethod
+    def _sleep(until):
+        remaining = until - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def end_frame(self):
+        """flip 직후."""
+        if self.mode == 'tick':
+            end = time.perf_counter()
+            dt_ms = self.clock.tick(self.fps)
+        else:
+            end = time.perf_counter()
+            self.work_times.append(end - self.frame_start)
+            self.next_deadline += self.period
+            if self.next_deadline < end:
+                self.next_deadline = end + self.period  # 한 프레임 이상 밀렸으면 지금부터 다시 셈
+            dt_ms = (end - self.last_end) * 1000
+        self.frame_intervals.append((end - self.last_end) * 1000)
+        self.last_end = end
+        return dt_ms
+
+    def report(self):
+        intervals = sorted(self.frame_intervals[1:])
+        if not intervals:
+            return "  프레임 간격: -"
+        mean = sum(intervals) / len(intervals)
+        deviation = (sum((value - mean) ** 2 for value in intervals) / len(intervals)) ** 0.5
+        return (f"  프레임 간격     평균 {mean:6.2f}  표준편차 {deviation:5.2f}  "
+                f"p99 {percentile(intervals, 99):6.2f}  max {intervals[-1]:6.2f} ms")
+
+
+# ==================================================
+# 3. 측정 (합성 입력으로 실제 GameScreen 루프 실행)
+# ==================================================
+def _inject_presses(stop, rng):
+    """1P 키를 실제 사람처럼 눌렀다 뗌: 좌/우 짧게 걷기, 잽 (앞 키 간격은 잽이 끝날 만큼 둠)"""
+    import pygame
+    from match import P1_CONTROLS
+    left, right, jab = P1_CONTROLS[0], P1_CONTROLS[1], P1_CONTROLS[2]
+    pattern = ((right, 0.8), (left, 0.25), (jab, 0.25))
+    while not stop.is_set():
+        for key, gap in pattern:
+            if stop.wait(rng.uniform(gap, gap + 0.2)):
+                return
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0,
+                                                 pressed_at=time.perf_counter()))
+            if stop.wait(rng.uniform(0.03, 0.08)):
+                return
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode='', scancode=0))
+
+
+def measure(mode, seconds, seed=0, screen_size=(1080, 720)):
+    """pygame 창/GameScreen을 만들고 mode로 seconds초 동안 돌린 뒤 (LatencyTracer, FramePacer)를 반환합니다."""
+    import pygame
+    from game_screen import GameScreen
+    from combat_log import COMBAT_LOG, LEVEL_OFF
+
+    COMBAT_LOG.set_level(LEVEL_OFF)
+    screen = pygame.display.set_mode(screen_size)
+    game_screen = GameScreen(*screen_size)
+    tracer = LatencyTracer()
+    game_screen.latency = tracer
+    pacer = FramePacer(mode)
+
+    stop = threading.Event()
+    injector = threading.Thread(target=_inject_presses, args=(stop, random.Random(seed)), daemon=True)
+    injector.start()
+
+    dt_ms = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pacer.wait()
+        events = pygame.event.get()
+        game_screen.handle_events(events)
+        game_screen.update(dt_ms)
+        game_screen.draw(screen)
+        pygame.display.flip()
+        tracer.on_present(game_screen.drawn_tick)
+        dt_ms = pacer.end_frame()
+
+    stop.set()
+    injector.join()
+    return tracer, pacer
+
+
+def main():
+    import pygame
+
+    parser = argparse.ArgumentParser(description="입력 -> 화면 지연 측정 (페이싱 모드별)")
+    parser.add_argument("--modes", nargs="+", choices=PACER_MODES, default=list(PACER_MODES))
+    parser.add_argument("--seconds", type=float, default=10.0, help="모드마다 돌릴 시간")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    for mode in args.modes:
+        tracer, pacer = measure(mode, args.seconds, args.seed)
+        print(tracer.report(mode))
+        print(pacer.report())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
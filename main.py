@@ -3,6 +3,11 @@
 import pygame
 from title_screen import TitleScreen
 from game_screen import GameScreen
+from preloader import MatchPreloader
+from frame_profiler import PROFILER
+from ai_controller import CpuController
+from latency import FramePacer, LatencyTracer
+from telemetry import TelemetryRecorder
 
 # --- 초기화 ---
 pygame.init()
@@ -17,44 +22,162 @@ clock = pygame.time.Clock()
 # --- 상태 상수 ---
 STATE_TITLE = "TITLE"
 STATE_PLAY = "PLAY"
+STATE_LOADING = "LOADING"  # SPACE를 눌렀지만 에셋 로딩이 아직 끝나지 않은 상태
+
+# 더티 렉트 렌더링: 바뀐 부분만 다시 그리고 pygame.display.update(rects)로 올림 (저사양 기기용)
+DIRTY_RECT_RENDERING = False
+
+# 전투 시뮬레이션을 별도 스레드에서 고정 속도로 돌리고, 메인 루프는 최신 스냅샷만 그림 (sim_thread.py)
+THREADED_SIMULATION = False
+
+# 끝난 경기의 입력 녹화를 저장할 폴더 (python replay.py verify/play 로 재생)
+REPLAY_DIR = "Replays"
+
+# 타격 판정: True면 사각형이 겹친 뒤 프레임 마스크로 그림이 실제로 닿았는지 확인 (이 모드의 경기는 녹화하지 않음)
+PRECISE_HITS = False
+
+# 경기 텔레메트리 (틱별 선수 상태 + 타격 기록)를 덧붙일 파일 (python telemetry.py summary 로 집계, None이면 기록 안 함)
+# 1분에 약 120KB씩 계속 커지므로 분석할 때만 켬. 예: "Telemetry/matches.bxt"
+TELEMETRY_PATH = None
+
+# 타이틀에서 C를 눌렀을 때 CPU 난이도 ('easy' / 'normal' / 'hard')
+CPU_DIFFICULTY = "normal"
+
+# 프레임 단계별 시간 측정. F3 오버레이는 이 값과 상관없이 언제든 켤 수 있고,
+# True면 처음부터 측정하다가 종료 시 원시 샘플 저장 (.csv 외 확장자는 바이너리, None이면 저장 안 함)
+PROFILE_FRAMES = False
+PROFILE_EXPORT_PATH = "frame_profile.csv"
+
+# 프레임 대기 방식 (latency.py): 'tick'(flip 뒤 clock.tick) / 'early_sleep'(입력 읽기 전에 잠) / 'busy_wait'(early_sleep + 마지막 2ms 바쁜 대기)
+FRAME_PACING = "tick"
+# 키 입력 -> 화면 표시 지연을 단계별로 측정해 종료 시 백분위 출력
+LATENCY_TRACE = False
 
 # --- 현재 상태 ---
 current_state = STATE_TITLE
+vs_cpu = False  # True면 2P를 CPU가 조종
 
 # 스크린 객체
 title_screen = TitleScreen(SCREEN_WIDTH, SCREEN_HEIGHT)
 game_screen = None
 
+# 타이틀이 보이는 동안 경기 에셋을 백그라운드에서 미리 로드
+preloader = MatchPreloader(SCREEN_WIDTH, SCREEN_HEIGHT)
+preloader.start()
+
+PROFILER.set_enabled(PROFILE_FRAMES)
+pacer = FramePacer(FRAME_PACING, 60, clock)
+latency_tracer = LatencyTracer() if LATENCY_TRACE else None
+telemetry = TelemetryRecorder(TELEMETRY_PATH) if TELEMETRY_PATH else None
+
+
+def new_game_screen():
+    cpu = CpuController(CPU_DIFFICULTY) if vs_cpu else None
+    new_screen = GameScreen(SCREEN_WIDTH, SCREEN_HEIGHT, preloader.assets, replay_dir=REPLAY_DIR, cpu=cpu,
+                            precise_hits=PRECISE_HITS)
+    new_screen.latency = latency_tracer
+    new_screen.telemetry = telemetry
+    if THREADED_SIMULATION:
+        new_screen.start_simulation_thread()
+    return new_screen
+
+
 # --- 메인 루프 ---
 running = True
+dt_ms = 0  # 지난 프레임에 걸린 실제 시간 (GameScreen의 고정 틱 누산기에 전달)
 while running:
+    dirty_rects = []  # DIRTY_RECT_RENDERING일 때 이번 프레임에 바뀐 화면 영역
+    pacer.wait()  # early_sleep/busy_wait: 다음 flip 직전까지 기다렸다가 입력을 읽음
+    PROFILER.lap('wait')  # 일부러 쉰 시간이므로 프레임 합계에 넣지 않음
     events = pygame.event.get()
     for event in events:
         if event.type == pygame.QUIT:
             running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            PROFILER.toggle_overlay()
+            # 오버레이가 보이는 동안은 PROFILE_FRAMES와 상관없이 측정 (끄면 측정도 원래 설정으로)
+            PROFILER.set_enabled(PROFILE_FRAMES or PROFILER.overlay_visible)
+            if not PROFILER.overlay_visible:  # 오버레이가 있던 자리를 다시 그리도록
+                title_screen.renderer.invalidate()
+                if game_screen:
+                    game_screen.renderer.invalidate()
+    PROFILER.lap('events')
 
     if current_state == STATE_TITLE:
         action = title_screen.handle_events(events)
-        if action == "PLAY":
-            current_state = STATE_PLAY
-            game_screen = GameScreen(SCREEN_WIDTH, SCREEN_HEIGHT)  # 게임 초기화
+        if action in ("PLAY", "PLAY_CPU"):
+            current_state = STATE_LOADING
+            vs_cpu = action == "PLAY_CPU"
 
         title_screen.update()
-        title_screen.draw(screen)
+        PROFILER.lap('update')
+        if DIRTY_RECT_RENDERING:
+            dirty_rects += title_screen.draw_dirty(screen)
+        else:
+            title_screen.draw(screen)
+        PROFILER.lap('draw')
+
+    if current_state == STATE_LOADING:
+        if preloader.done:
+            current_state = STATE_PLAY
+            game_screen = new_game_screen()  # 게임 초기화
+        elif DIRTY_RECT_RENDERING:
+            dirty_rects += title_screen.draw_dirty(screen, preloader.progress)
+        else:
+            title_screen.draw_loading(screen, preloader.progress)
+        PROFILER.lap('update')
 
     elif current_state == STATE_PLAY:
         if game_screen:
             action = game_screen.handle_events(events)
             if action == "RESTART":
-                game_screen = GameScreen(SCREEN_WIDTH, SCREEN_HEIGHT)  # 재시작
+                game_screen.close()
+                game_screen = new_game_screen()  # 재시작
             elif action == "TITLE":
                 current_state = STATE_TITLE
+                game_screen.close()
                 game_screen = None  # 메모리 정리
+                title_screen.renderer.invalidate()
+
+        if game_screen:
+            game_screen.update(dt_ms)
+            PROFILER.lap('update')
+            if DIRTY_RECT_RENDERING:
+                dirty_rects += game_screen.draw_dirty(screen)
+            else:
+                game_screen.draw(screen)
+            PROFILER.lap('draw')
+
+    overlay_rect = PROFILER.draw_overlay(screen)
+    if overlay_rect:
+        dirty_rects.append(overlay_rect)
+    PROFILER.lap('overlay')
+
+    if DIRTY_RECT_RENDERING:
+        pygame.display.update(dirty_rects)
+    else:
+        pygame.display.flip()
+    PROFILER.lap('flip')
+    if latency_tracer and game_screen:
+        latency_tracer.on_present(game_screen.drawn_tick)
+    dt_ms = pacer.end_frame()
+    PROFILER.lap_sleep()
+    PROFILER.end_frame()
+
+if game_screen:
+    game_screen.close()
+
+if telemetry:
+    telemetry.close()
+    if telemetry.matches:
+        print(f"텔레메트리 저장: {TELEMETRY_PATH} ({telemetry.matches} 경기)")
 
-            game_screen.update()
-            game_screen.draw(screen)
+if latency_tracer:
+    print(latency_tracer.report(FRAME_PACING))
+    print(pacer.report())
 
-    pygame.display.flip()
-    clock.tick(60)
+if PROFILE_FRAMES and PROFILE_EXPORT_PATH:
+    saved = PROFILER.export(PROFILE_EXPORT_PATH)
+    print(f"프레임 프로파일 저장: {PROFILE_EXPORT_PATH} ({saved} 프레임)")
 
 pygame.quit()
\ No newline at end of file
@@ -0,0 +1,138 @@
+# (파일: match.py)
+
+import pygame
+from player import Player
+from collisions import resolve_collisions
+from utils import frame_masks
+from visual_effects import EffectPool, MAX_EFFECTS, mirrored_pair
+from combat_log import COMBAT_LOG
+from frame_profiler import PROFILER
+
+
+# --- 경기 에셋 설정 (preloader.py 와 공유) ---
+ANIM_FOLDERS = {
+    'Idle': 'Idle', 'Walk': 'Walk', 'Jab': 'PunchLeft', 'Straight': 'PunchRight',
+    'Uppercut': 'PunchUp', 'Blocking': 'Blocking', 'Dizzy': 'Dizzy', 'KO': 'KO'
+}
+FIGHTER_SCALE = 0.5
+EFFECT_SCALE = 2.0
+EFFECT_FOLDERS = ('BlockEffect', 'HitEffect')
+
+# --- 조작 키 (좌, 우, 잽, 스트레이트, 어퍼컷, 방어) ---
+P1_CONTROLS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_e, pygame.K_r, pygame.K_s)
+P2_CONTROLS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_u, pygame.K_i, pygame.K_o, pygame.K_DOWN)
+
+# Match(tuning=...)으로 바꿀 수 있는 Player 밸런스 값 (기본값은 player.py 상수)
+TUNING_KEYS = ('hit_knockback', 'dizzy_hp', 'awaken_multiplier')
+
+
+class Match:
+    """
+    한 경기의 전투 규칙(플레이어 업데이트, 이펙트, 타격 판정, 승패)을 담당합니다.
+    화면/폰트와는 무관해서 GameScreen과 헤드리스 엔진(headless.py)이 같이 사용합니다.
+    """
+
+    def __init__(self, screen_width, screen_height, sounds=None, headless=False, move_data=None, tuning=None,
+                 precise_hits=False):
+        """
+        move_data: 기술 프레임 데이터 (없으면 moves.json)
+        tuning: {TUNING_KEYS 중 하나: 값} - 두 선수 모두에게 적용 (밸런스 테스트용)
+        precise_hits: True면 사각형 판정 뒤 프레임 마스크로 실제 그림이 닿는지 확인 (헤드리스에서는 효과 없음)
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.headless = headless
+        self.move_data = move_data
+        self.tuning = tuning
+        self.precise_hits = precise_hits
+
+        # --- 이펙트 (헤드리스에서는 그릴 일이 없으므로 생성하지 않음) ---
+        # 이름 -> (정방향, 반전) 프레임. 공격자 방향(flip_images)으로 골라 씀
+        if headless:
+            self.effect_frames = {}
+        else:
+            self.effect_frames = {folder: mirrored_pair(folder, EFFECT_SCALE) for folder in EFFECT_FOLDERS}
+        self.effect_group = EffectPool(0 if headless else MAX_EFFECTS)
+
+        self.sounds = sounds  # sound_bank.SoundPlayer (None이면 소리 없음)
+
+        # --- 플레이어 생성 ---
+        P1_START_POS = (screen_width // 4, screen_height - 30)
+        self.player1 = Player(P1_START_POS, P1_CONTROLS, ANIM_FOLDERS, screen_width, FIGHTER_SCALE,
+                              flip_images=False, headless=headless, move_data=move_data, name="P1", team=0)
+
+        P2_START_POS = (screen_width * 3 // 4, screen_height - 30)
+        self.player2 = Player(P2_START_POS, P2_CONTROLS, ANIM_FOLDERS, screen_width, FIGHTER_SCALE,
+                              flip_images=True, headless=headless, move_data=move_data, name="P2", team=1)
+        self.players = (self.player1, self.player2)
+
+        for key, value in (tuning or {}).items():
+            if key not in TUNING_KEYS:
+                raise ValueError(f"알 수 없는 밸런스 값: {key}")
+            for player in self.players:
+                setattr(player, key, value)
+
+        if precise_hits and not headless:
+            # 마스크를 미리 만들어 둠 (첫 타격 때 멈칫하지 않도록, 프레임 캐시의 FrameList에 보관되어 다음 경기도 공유)
+            for player in self.players:
+                for frames in player.frame_sets():
+                    frame_masks(frames)
+
+        self.tick = 0
+        self.game_over = False
+        self.winner_text = ""
+        self.hit_log = []  # [(틱, 공격자 번호 0/1, 기술 이름, 결과)]
+        self.last_inputs = (0, 0)  # 마지막 틱의 (P1, P2) 입력 (CPU가 상대 행동을 예측할 때 사용)
+
+    def step(self, p1_input=None, p2_input=None):
+        """고정 시뮬레이션 틱 하나(sim_clock.TICK_MS)를 진행합니다.
+        입력이 None이면 각 플레이어가 키보드에서 직접 읽습니다."""
+        COMBAT_LOG.frame = self.tick
+        self.last_inputs = (p1_input or 0, p2_input or 0)
+        PROFILER.lap('update')
+        self.player1.update(p1_input)
+        self.player2.update(p2_input)
+        PROFILER.lap('player_update')
+        self.effect_group.update()
+        PROFILER.lap('effects')
+
+        # [수정] 타격 판정에 사운드 재생 창구 전달
+        hits = resolve_collisions(self.players, self.effect_group, self.effect_frames, self.sounds,
+                                  precise=self.precise_hits)
+        PROFILER.lap('collisions')
+        for attacker, defender, move, outcome in hits:
+            self.hit_log.append((self.tick, self.players.index(attacker), move, outcome))
+
+        # 승패 판정
+        if not self.game_over:
+            if (not self.player1.is_alive and self.player1.current_state == 'KO') or \
+                    (not self.player2.is_alive and self.player2.current_state == 'KO'):
+                self.game_over = True
+                if not self.player1.is_alive:
+                    self.winner_text = "2P WINS!"
+                else:
+                    self.winner_text = "1P WINS!"
+
+        self.tick += 1
+
+    # --- 롤백 넷플레이용 상태 저장/복원 ---
+    def save_state(self, include_effects=True):
+        """틱 하나의 경기 상태 (플레이어, 살아 있는 이펙트, 타격 기록 길이)
+        include_effects: False면 이펙트를 빼고 저장 (판정에 영향이 없으므로 예측 시뮬레이션용)"""
+        effects = self.effect_group.save_state() if include_effects else ()
+        return (self.tick, self.game_over, self.winner_text, len(self.hit_log),
+                tuple(player.save_state() for player in self.players), effects)
+
+    def load_state(self, state):
+        self.tick, self.game_over, self.winner_text, hit_count, players, effects = state
+        del self.hit_log[hit_count:]  # hit_log는 뒤에만 추가되므로 길이만 되돌리면 됨
+        for player, player_state in zip(self.players, players):
+            player.load_state(player_state)
+        self.effect_group.load_state(effects)
+
+    @property
+    def winner(self):
+        """0: 아직/무승부, 1: 1P 승, 2: 2P 승"""
+        if not self.game_over:
+            return 0
+        return 2 if not self.player1.is_alive else 1
\ No newline at end of file
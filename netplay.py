@@ -0,0 +1,362 @@
+# (파일: netplay.py)
+#
+# UDP 롤백 넷플레이 (2인).
+#   python netplay.py --selftest --latency 60 --jitter 10 --loss 0.1
+#       -> localhost에서 두 피어를 화면 없이 돌리고, 양쪽 최종 상태가 같은지 확인
+#   python netplay.py --player 1 --local-port 7001 --remote 127.0.0.1:7002
+#   python netplay.py --player 2 --local-port 7002 --remote 127.0.0.1:7001
+#       -> 창을 열고 대전 (1P는 WASD 쪽, 2P는 방향키 쪽 조작)
+#
+# 입력 지연 없이 로컬 입력은 바로 적용하고, 상대 입력은 마지막으로 받은 입력이 계속된다고 예측합니다.
+# 실제 입력이 도착해서 예측이 틀렸으면 그 틱의 저장 상태로 되돌린 뒤 현재 틱까지 다시 시뮬레이션합니다.
+# (다시 돌리는 동안에는 소리와 전투 로그를 끕니다)
+#
+# 패킷 (리틀 엔디언): MAGIC, version, 첫 틱, ack(받은 상대 입력 수), 입력 개수, 입력 바이트들
+#   아직 ack되지 않은 로컬 입력을 최대 REDUNDANT_INPUTS개까지 매번 다시 보내므로 손실에 강합니다.
+
+import argparse
+import heapq
+import random
+import socket
+import struct
+import sys
+import time
+import zlib
+
+from inputs import INPUT_MASK
+from sim_clock import TICK_MS
+from combat_log import COMBAT_LOG, LEVEL_OFF
+
+MAGIC = b'BXNP'
+VERSION = 1
+_PACKET = struct.Struct('<4sBIIB')
+
+MAX_PREDICTION = 8      # 상대 입력 없이 앞서 나갈 수 있는 최대 틱 수 (넘으면 기다림)
+STATE_RING = 16         # 저장해 두는 틱 상태 수 (MAX_PREDICTION보다 커야 함)
+REDUNDANT_INPUTS = 32   # 한 패킷에 다시 실어 보내는 최대 입력 수
+SELFTEST_PORTS = (47001, 47002)
+
+
+# ==================================================
+# 1. 패킷
+# ==================================================
+def encode_packet(first_tick, ack, inputs):
+    return _PACKET.pack(MAGIC, VERSION, first_tick, ack, len(inputs)) + bytes(inputs)
+
+
+def decode_packet(data):
+    """(첫 틱, ack, 입력 목록). 형식이 맞지 않으면 None"""
+    if len(data) < _PACKET.size:
+        return None
+    magic, version, first_tick, ack, count = _PACKET.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION or len(data) != _PACKET.size + count:
+        return None
+    return first_tick, ack, data[_PACKET.size:]
+
+
+# ==================================================
+# 2. UDP 전송 (지연/손실 시뮬레이션 포함)
+# ==================================================
+class UdpTransport:
+    """
+    논블로킹 UDP 소켓.
+    latency_ms/jitter_ms/loss는 보내는 쪽에서 흉내냅니다. (편도 지연, 손실 확률 0.0 ~ 1.0)
+    """
+
+    def __init__(self, local_port, remote_addr, latency_ms=0, jitter_ms=0, loss=0.0, seed=None,
+                 bind_host="0.0.0.0"):
+        self.remote_addr = remote_addr
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.loss = loss
+        self.rng = random.Random(seed)
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((bind_host, local_port))
+        self.sock.setblocking(False)
+
+        self._outgoing = []  # 지연 중인 패킷 힙 [(보낼 시각, 순번, 데이터)]
+        self._seq = 0
+        self.sent = 0
+        self.lost = 0
+
+    def send(self, data):
+        if self.loss and self.rng.random() < self.loss:
+            self.lost += 1
+            return
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter) if self.jitter else self.latency
+        if delay <= 0:
+            self._sendto(data)
+        else:
+            self._seq += 1
+            heapq.heappush(self._outgoing, (time.perf_counter() + delay, self._seq, data))
+
+    def pump(self):
+        """지연 시간이 지난 패킷을 실제로 보냅니다."""
+        now = time.perf_counter()
+        while self._outgoing and self._outgoing[0][0] <= now:
+            self._sendto(heapq.heappop(self._outgoing)[2])
+
+    def _sendto(self, data):
+        try:
+            self.sock.sendto(data, self.remote_addr)
+            self.sent += 1
+        except OSError:
+            pass  # 상대가 아직 안 떴거나 버퍼가 가득 참: UDP이므로 그냥 버림
+
+    def receive(self):
+        packets = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            packets.append(data)
+        return packets
+
+    def close(self):
+        self.sock.close()
+
+
+# ==================================================
+# 3. 롤백 세션
+# ==================================================
+class RollbackSession:
+    """
+    Match 하나를 롤백 방식으로 진행합니다.
+    local_index: 이 기기의 플레이어 (0: 1P, 1: 2P)
+    """
+
+    def __init__(self, match, local_index, transport, max_prediction=MAX_PREDICTION):
+        if max_prediction >= STATE_RING:
+            raise ValueError("max_prediction은 STATE_RING보다 작아야 합니다.")
+        self.match = match
+        self.local_index = local_index
+        self.transport = transport
+        self.max_prediction = max_prediction
+
+        self.local_inputs = []   # 틱별 로컬 입력 (보낸 것 전부)
+        self.remote_inputs = []  # 틱별 확정된 상대 입력 (0틱부터 끊김 없이)
+        self.predicted = []      # 틱별로 시뮬레이션에 실제로 쓴 상대 입력
+        self._pending = {}       # 순서가 뒤바뀌어 먼저 도착한 상대 입력 {틱: 입력}
+        self._states = [None] * STATE_RING  # 틱 t를 시뮬레이션하기 직전 상태 (t % STATE_RING)
+        self.remote_ack = 0      # 상대가 받은 로컬 입력 수
+
+        # 통계
+        self.rollbacks = 0
+        self.resimulated = 0
+        self.max_rollback = 0
+        self.stalls = 0
+
+    @property
+    def confirmed_tick(self):
+        """이 틱 전까지는 양쪽 입력이 모두 확정됨"""
+        return min(len(self.remote_inputs), len(self.local_inputs))
+
+    def _remote_input(self, tick):
+        if tick < len(self.remote_inputs):
+            return self.remote_inputs[tick]
+        return self.remote_inputs[-1] if self.remote_inputs else 0  # 예측: 마지막 입력이 계속됨
+
+    def _simulate(self, tick):
+        match = self.match
+        self._states[tick % STATE_RING] = match.save_state()
+        remote = self._remote_input(tick)
+        if tick < len(self.predicted):
+            self.predicted[tick] = remote
+        else:
+            self.predicted.append(remote)
+        local = self.local_inputs[tick]
+        if self.local_index == 0:
+            match.step(local, remote)
+        else:
+            match.step(remote, local)
+
+    def _rollback(self, tick):
+        """tick의 저장 상태로 되돌린 뒤 현재 틱까지 다시 시뮬레이션합니다. (소리/로그 없이)"""
+        match = self.match
+        end = match.tick
+        sounds, log_level = match.sounds, COMBAT_LOG.level
+        match.sounds = None
+        COMBAT_LOG.level = LEVEL_OFF
+        try:
+            match.load_state(self._states[tick % STATE_RING])
+            for t in range(tick, end):
+                self._simulate(t)
+        finally:
+            match.sounds = sounds
+            COMBAT_LOG.level = log_level
+        self.rollbacks += 1
+        self.resimulated += end - tick
+        self.max_rollback = max(self.max_rollback, end - tick)
+
+    def poll(self):
+        """받은 입력을 반영하고, 예측이 틀린 틱이 있으면 롤백합니다."""
+        self.transport.pump()
+        for data in self.transport.receive():
+            packet = decode_packet(data)
+            if packet is None:
+                continue
+            first_tick, ack, inputs = packet
+            self.remote_ack = max(self.remote_ack, ack)
+            for offset, bits in enumerate(inputs):
+                tick = first_tick + offset
+                if tick >= len(self.remote_inputs):
+                    self._pending[tick] = bits & INPUT_MASK
+
+        rollback_to = None
+        while len(self.remote_inputs) in self._pending:
+            tick = len(self.remote_inputs)
+            bits = self._pending.pop(tick)
+            self.remote_inputs.append(bits)
+            if rollback_to is None and tick < len(self.predicted) and self.predicted[tick] != bits:
+                rollback_to = tick
+        if rollback_to is not None:
+            self._rollback(rollback_to)
+
+    def advance(self, local_input):
+        """로컬 입력으로 한 틱 진행합니다. 상대가 너무 뒤처져 있으면 진행하지 않고 False"""
+        self.poll()
+        tick = self.match.tick
+        if tick - len(self.remote_inputs) >= self.max_prediction:
+            self.stalls += 1
+            self.send()
+            return False
+
+        self.local_inputs.append(local_input & INPUT_MASK)
+        self._simulate(tick)
+        self.send()
+        return True
+
+    def send(self):
+        """상대가 아직 받지 못한 로컬 입력을 (최대 REDUNDANT_INPUTS개) 보냅니다."""
+        first = max(self.remote_ack, len(self.local_inputs) - REDUNDANT_INPUTS)
+        self.transport.send(encode_packet(first, len(self.remote_inputs), self.local_inputs[first:]))
+        self.transport.pump()
+
+
+def match_checksum(match):
+    """두 피어의 시뮬레이션 결과 비교용 (이미지 참조 제외)"""
+    players = [(tuple(p.frame_rect), p.current_state, p.current_frame, p.anim_ticks, p.hp, p.is_alive,
+                p.has_hit, p.is_awakened, p.knockback_velocity) for p in match.players]
+    return zlib.crc32(repr((match.tick, match.game_over, players, match.hit_log)).encode('utf-8'))
+
+
+# ==================================================
+# 4. 셀프 테스트 (localhost, 화면 없음)
+# ==================================================
+def selftest(ticks, latency_ms, jitter_ms, loss, seed):
+    from headless import SCREEN_WIDTH, SCREEN_HEIGHT, RandomController
+    from match import Match
+
+    COMBAT_LOG.set_level(LEVEL_OFF)
+    port_a, port_b = SELFTEST_PORTS
+    peers = []
+    for index, (local_port, remote_port) in enumerate(((port_a, port_b), (port_b, port_a))):
+        transport = UdpTransport(local_port, ("127.0.0.1", remote_port), latency_ms, jitter_ms, loss,
+                                 seed=seed * 2 + index, bind_host="127.0.0.1")
+        session = RollbackSession(Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True), index, transport)
+        peers.append((session, RandomController(seed * 2 + index)))
+
+    # 실제 시간에 맞춰 (틱마다 TICK_MS) 양쪽을 번갈아 진행
+    start = time.perf_counter()
+    frame = 0
+    while any(session.match.tick < ticks for session, _ in peers):
+        for index, (session, controller) in enumerate(peers):
+            if session.match.tick < ticks:
+                session.advance(controller(session.match, index))
+            else:
+                session.poll()
+                session.send()
+        frame += 1
+        delay = start + frame * TICK_MS / 1000 - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+    # 남은 입력이 모두 도착할 때까지 주고받기 (최대 5초)
+    deadline = time.perf_counter() + 5.0
+    while any(session.confirmed_tick < ticks for session, _ in peers) and time.perf_counter() < deadline:
+        for session, _ in peers:
+            session.poll()
+            session.send()
+        time.sleep(TICK_MS / 1000)
+
+    # 오프라인 기준: 확정된 입력으로 처음부터 한 번에 시뮬레이션
+    a, b = peers[0][0], peers[1][0]
+    reference = Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True)
+    for tick in range(ticks):
+        reference.step(a.local_inputs[tick], b.local_inputs[tick])
+
+    checksums = [match_checksum(session.match) for session, _ in peers]
+    expected = match_checksum(reference)
+    for index, (session, _) in enumerate(peers):
+        transport = session.transport
+        print(f"{index + 1}P: 롤백 {session.rollbacks}회 (재시뮬레이션 {session.resimulated}틱, 최대 "
+              f"{session.max_rollback}틱), 대기 {session.stalls}프레임, 패킷 {transport.sent}개 전송 / "
+              f"{transport.lost}개 손실")
+        transport.close()
+    ok = checksums[0] == checksums[1] == expected
+    print(f"{'OK  ' if ok else 'FAIL'} {ticks}틱 (타격 {len(reference.hit_log)}회), "
+          f"지연 {latency_ms}ms ±{jitter_ms}ms, 손실 {loss:.0%} "
+          f"(체크섬 {checksums[0]:08x} / {checksums[1]:08x}, 기준 {expected:08x})")
+    return ok
+
+
+# ==================================================
+# 5. 대전 (창 열기)
+# ==================================================
+def play(player, local_port, remote_addr, latency_ms, jitter_ms, loss):
+    import pygame
+    from game_screen import GameScreen
+
+    pygame.init()
+    screen = pygame.display.set_mode((1080, 720))
+    pygame.display.set_caption(f"Boxing King - Netplay {player}P")
+    clock = pygame.time.Clock()
+
+    game_screen = GameScreen(1080, 720)
+    transport = UdpTransport(local_port, remote_addr, latency_ms, jitter_ms, loss)
+    game_screen.netplay = RollbackSession(game_screen.match, player - 1, transport)
+
+    dt_ms = 0
+    running = True
+    while running:
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        game_screen.handle_events(events)  # 키 입력을 입력 스냅샷에 전달
+        game_screen.update(dt_ms)
+        game_screen.draw(screen)
+        pygame.display.flip()
+        dt_ms = clock.tick(60)
+
+    transport.close()
+    pygame.quit()
+
+
+def parse_address(text):
+    host, port = text.rsplit(":", 1)
+    return host, int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UDP 롤백 넷플레이")
+    parser.add_argument("--selftest", action="store_true", help="localhost에서 두 피어를 돌려 동기화 확인")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--player", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--local-port", type=int, default=7001)
+    parser.add_argument("--remote", type=parse_address, default=("127.0.0.1", 7002))
+    parser.add_argument("--latency", type=int, default=0, help="흉내낼 편도 지연 (ms)")
+    parser.add_argument("--jitter", type=int, default=0, help="지연 흔들림 (ms)")
+    parser.add_argument("--loss", type=float, default=0.0, help="패킷 손실 확률 (0.0 ~ 1.0)")
+    args = parser.parse_args()
+
+    if args.selftest:
+        sys.exit(0 if selftest(args.ticks, args.latency, args.jitter, args.loss, args.seed) else 1)
+    play(args.player, args.local_port, args.remote, args.latency, args.jitter, args.loss)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -3,85 +3,102 @@
 import pygame
 import os
 from attacks import Attack
-from utils import load_animation_frames
+from utils import load_animation_frames, frame_masks
 from defenses import Defense
 from effects import Effect
+from sim_clock import ms_to_ticks_exceeded
+from frame_data import load_move_data, get_default_hurtbox
+from combat_log import COMBAT_LOG, LEVEL_INFO, EVENT_DIZZY, EVENT_KO, EVENT_AWAKEN
+from inputs import (INPUT_LEFT, INPUT_RIGHT, INPUT_JAB, INPUT_STRAIGHT, INPUT_UPPERCUT,
+                    INPUT_BLOCK, read_keyboard)
+
+# --- 밸런스 값 (Match(tuning=...)으로 경기별로 바꿀 수 있음) ---
+HIT_KNOCKBACK = 15       # 맞았을 때 밀려나는 속도
+KO_KNOCKBACK = 30        # KO 때 밀려나는 속도
+DIZZY_HP_THRESHOLD = 30  # 각성 전에 HP가 이 이하로 떨어지면 Dizzy
+AWAKEN_MULTIPLIER = 1.5  # 각성 상태의 데미지 배율
 
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, start_pos, controls, anim_folders, screen_width, scale_factor=1.0, flip_images=False):
+    def __init__(self, start_pos, controls, anim_folders, screen_width, scale_factor=1.0, flip_images=False,
+                 headless=False, move_data=None, name="Player", team=None):
+        """
+        headless: True면 이미지를 디코딩하지 않고 크기만 가진 프레임으로 동작 (화면 없이 시뮬레이션용)
+        move_data: 기술 프레임 데이터 (없으면 moves.json)
+        name: 로그에 쓰는 이름 ("P1" 등)
+        team: 같은 team끼리는 서로 맞지 않음 (None이면 모두와 적)
+        """
         super().__init__()
 
         self.screen_width = screen_width
         self.flip_images = flip_images
+        self.name = name
+        self.team = team
 
         # --- 1. 애니메이션 로딩 ---
         self.animations = {}
-        self.animations['Idle'] = load_animation_frames(anim_folders['Idle'], scale_factor, flip_images)
-        self.animations['Walk'] = load_animation_frames(anim_folders['Walk'], scale_factor, flip_images)
-        self.animations['KO'] = load_animation_frames(anim_folders.get('KO', 'KO'), scale_factor, flip_images)
+        self.animations['Idle'] = load_animation_frames(anim_folders['Idle'], scale_factor, flip_images, headless)
+        self.animations['Walk'] = load_animation_frames(anim_folders['Walk'], scale_factor, flip_images, headless)
+        self.animations['KO'] = load_animation_frames(anim_folders.get('KO', 'KO'), scale_factor, flip_images, headless)
 
-        # --- 1-2. 공격 모션 로딩 ---
+        # --- 1-2. 공격 모션 로딩 (Jab, Straight, Uppercut - 데이터는 moves.json) ---
+        if move_data is None:
+            move_data = load_move_data()
         self.attacks = {}
-        self.attacks['Jab'] = Attack(
-            folder_name=anim_folders.get('Jab', 'Jab'),
-            damage=10, hit_frame=1, hitbox_rect=pygame.Rect(170, 120, 75, 30),
-            scale_factor=scale_factor, flip_images=flip_images, is_ko_move=False
-        )
-        self.attacks['Straight'] = Attack(
-            folder_name=anim_folders.get('Straight', 'Straight'),
-            damage=20, hit_frame=2, hitbox_rect=pygame.Rect(170, 120, 70, 30),
-            scale_factor=scale_factor, flip_images=flip_images, is_ko_move=False
-        )
-        self.attacks['Uppercut'] = Attack(
-            folder_name=anim_folders.get('Uppercut', 'Uppercut'),
-            damage=0, hit_frame=1, hitbox_rect=pygame.Rect(170, 120, 55, 50),
-            scale_factor=scale_factor, flip_images=flip_images, is_ko_move=True
-        )
+        for move_name in move_data['moves']:
+            self.attacks[move_name] = Attack(
+                folder_name=anim_folders.get(move_name, move_name), move_name=move_name,
+                scale_factor=scale_factor, flip_images=flip_images, headless=headless, move_data=move_data
+            )
 
         # --- 1-3. 방어 모션 로딩 ---
         self.defenses = {}
-        self.defenses['Blocking'] = Defense(anim_folders.get('Blocking', 'Blocking'), scale_factor, flip_images)
+        self.defenses['Blocking'] = Defense(anim_folders.get('Blocking', 'Blocking'), scale_factor, flip_images, headless)
 
         # --- 1-4. 효과(Effect) 로딩 ---
         self.effects = {}
-        self.effects['Dizzy'] = Effect(anim_folders.get('Dizzy', 'Dizzy'), scale_factor, flip_images)
+        self.effects['Dizzy'] = Effect(anim_folders.get('Dizzy', 'Dizzy'), scale_factor, flip_images, headless)
 
         self.looping_states = ['Idle', 'Walk', 'Blocking']
 
         # --- 2. 상태 및 애니메이션 관리 ---
         self.current_state = 'Idle'
         self.current_frame = 0
-        self.last_update_time = pygame.time.get_ticks()
+        self.anim_ticks = 0  # 마지막 프레임 전환 이후 지난 시뮬레이션 틱 수
         self.base_animation_delay = 100
 
         # --- 3. 이미지 및 위치 ---
+        # frame_rect: 여백을 자르기 전 원본 프레임 크기의 '논리' 사각형 (이동/경계/판정 기준)
+        # rect: 실제로 그려지는 잘린 이미지의 사각형 (frame_rect + 프레임 오프셋)
         if self.animations['Idle']:
             self.image = self.animations['Idle'][0]
-            self.rect = self.image.get_rect()
+            self.image_offset = self.animations['Idle'].offsets[0]
+            self.image_frames = self.animations['Idle']  # image가 들어 있는 FrameList와 번호 (정밀 판정 마스크 조회용)
+            self.image_index = 0
+            self.frame_rect = pygame.Rect((0, 0), self.animations['Idle'].frame_size)
         else:
             print("오류: 'Idle' 애니메이션을 찾을 수 없습니다. 임시 사각형으로 대체합니다.")
             self.image = pygame.Surface((50, 100));
             self.image.fill((255, 0, 0))
-            self.rect = self.image.get_rect()
+            self.image_offset = (0, 0)
+            self.image_frames = None
+            self.image_index = 0
+            self.frame_rect = self.image.get_rect()
 
-        self.rect.midbottom = start_pos
+        self.frame_rect.midbottom = start_pos
+        self.rect = self.image.get_rect()
+        self.sync_draw_rect()
         self.speed = 5
         self.is_moving = False
 
-        # --- Hurtbox 로직 ---
-        self.hurtbox_relative_P1 = pygame.Rect(150, 100, 40, 90)
-        self.hurtbox_absolute = self.hurtbox_relative_P1.copy()
-        self.hurtbox_absolute.topleft = (self.rect.x + self.hurtbox_relative_P1.x,
-                                         self.rect.y + self.hurtbox_relative_P1.y)
+        # --- Hurtbox / Hitbox 로직 (방향별로 미리 반전된 상대 좌표 + 매 틱 재사용하는 Rect) ---
+        self.default_hurtbox = get_default_hurtbox(self.frame_rect.width, flip_images, move_data)
+        hx, hy, hw, hh = self.default_hurtbox
+        self.hurtbox_absolute = pygame.Rect(self.frame_rect.x + hx, self.frame_rect.y + hy, hw, hh)
+        self.hitbox_absolute = pygame.Rect(0, 0, 0, 0)
 
-        # --- 4. 조작 키 저장 ---
-        self.key_left = controls[0]
-        self.key_right = controls[1]
-        self.key_jab = controls[2]
-        self.key_straight = controls[3]
-        self.key_uppercut = controls[4]
-        self.key_block = controls[5]
+        # --- 4. 조작 키 저장 (좌, 우, 잽, 스트레이트, 어퍼컷, 방어) ---
+        self.controls = controls
 
         # --- 5. 체력, 각성 등 ---
         self.max_hp = 100
@@ -93,17 +110,22 @@ class Player(pygame.sprite.Sprite):
         # --- [추가] 넉백 속도 변수 ---
         self.knockback_velocity = 0
 
+        # --- 6. 밸런스 값 ---
+        self.hit_knockback = HIT_KNOCKBACK
+        self.dizzy_hp = DIZZY_HP_THRESHOLD
+        self.awaken_multiplier = AWAKEN_MULTIPLIER
+
     def animate(self):
         if self.is_awakened:
             current_delay = int(self.base_animation_delay / 1.5)
         else:
             current_delay = self.base_animation_delay
 
-        now = pygame.time.get_ticks()
-
-        if now - self.last_update_time <= current_delay:
+        # 벽시계 대신 고정 틱 수로 딜레이를 판단 (프레임이 튀어도 hit_frame을 건너뛰지 않음)
+        self.anim_ticks += 1
+        if not ms_to_ticks_exceeded(self.anim_ticks, current_delay):
             return
-        self.last_update_time = now
+        self.anim_ticks = 0
 
         is_looping = self.current_state in self.looping_states
         current_frames = []
@@ -145,7 +167,9 @@ class Player(pygame.sprite.Sprite):
                         self.current_state = 'Idle'
                         self.current_frame = 0
                         self.is_awakened = True
-                        print("AWAKENING ACTIVATED!")
+                        if COMBAT_LOG.level >= LEVEL_INFO:
+                            COMBAT_LOG.emit(EVENT_AWAKEN, None, self.name, None, 0, self.hp,
+                                            *self.frame_rect.midbottom)
                     else:
                         self.current_state = 'Idle'
                         self.current_frame = 0
@@ -156,86 +180,120 @@ class Player(pygame.sprite.Sprite):
         safe_frame = min(self.current_frame, len(current_frames) - 1)
 
         if self.current_state == 'Idle':
-            self.image = self.animations['Idle'][self.current_frame % len(self.animations['Idle'])]
+            shown_frames = self.animations['Idle']
+            shown_index = self.current_frame % len(shown_frames)
         elif current_frames:
-            self.image = current_frames[safe_frame]
+            shown_frames = current_frames
+            shown_index = safe_frame
         else:
-            self.image = self.animations['Idle'][0]
+            shown_frames = self.animations['Idle']
+            shown_index = 0
 
-        old_midbottom = self.rect.midbottom
-        self.rect = self.image.get_rect()
-        self.rect.midbottom = old_midbottom
+        self.image = shown_frames[shown_index]
+        self.image_offset = shown_frames.offsets[shown_index]
+        self.image_frames = shown_frames
+        self.image_index = shown_index
+
+        old_midbottom = self.frame_rect.midbottom
+        self.frame_rect.size = shown_frames.frame_size
+        self.frame_rect.midbottom = old_midbottom
 
-    def update(self):
-        """플레이어 입력 처리 및 상태 업데이트."""
+    def sync_draw_rect(self):
+        """논리 사각형(frame_rect) 위치에 잘린 이미지의 오프셋을 더해 그리기용 rect를 맞춥니다."""
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (self.frame_rect.x + self.image_offset[0],
+                             self.frame_rect.y + self.image_offset[1])
+
+    def update(self, input_bits=None):
+        """플레이어 입력 처리 및 상태 업데이트.
+        input_bits: inputs.py의 입력 비트. 없으면 키보드에서 직접 읽습니다."""
 
         # --- [추가] 넉백 물리 적용 (가장 먼저 처리) ---
         if self.knockback_velocity != 0:
-            self.rect.x += self.knockback_velocity
+            self.frame_rect.x += self.knockback_velocity
             self.knockback_velocity *= 0.85  # 마찰력 (속도가 점점 줄어듦)
             if abs(self.knockback_velocity) < 0.5:
                 self.knockback_velocity = 0
 
         # 화면 경계 처리 (넉백으로 나가는 것 방지)
-        if self.rect.left < 0: self.rect.left = 0
-        if self.rect.right > self.screen_width: self.rect.right = self.screen_width
+        if self.frame_rect.left < 0: self.frame_rect.left = 0
+        if self.frame_rect.right > self.screen_width: self.frame_rect.right = self.screen_width
 
         # KO나 Dizzy 상태면 조작 불가 (애니메이션만 재생)
         if not self.is_alive or self.current_state in ['KO', 'Dizzy']:
             self.animate()
         else:
-            keys = pygame.key.get_pressed()
-            is_busy = self.current_state not in self.looping_states
+            if input_bits is None:
+                input_bits = read_keyboard(self.controls, pygame.key.get_pressed())
+            is_busy = not self.is_actionable()
 
             if is_busy:
                 self.animate()
             else:
-                if keys[self.key_jab]:
+                if input_bits & INPUT_JAB:
                     self.current_state = 'Jab'
                     self.current_frame = 0
                     self.has_hit = False
-                elif keys[self.key_straight]:
+                elif input_bits & INPUT_STRAIGHT:
                     self.current_state = 'Straight'
                     self.current_frame = 0
                     self.has_hit = False
-                elif keys[self.key_uppercut]:
+                elif input_bits & INPUT_UPPERCUT:
                     self.current_state = 'Uppercut'
                     self.current_frame = 0
                     self.has_hit = False
-                elif keys[self.key_block]:
+                elif input_bits & INPUT_BLOCK:
                     self.current_state = 'Blocking'
                     self.current_frame = 0
+                elif self.current_state in self.attacks:
+                    pass  # 후딜 캔슬 구간: 다른 행동 입력이 없으면 남은 동작을 그대로 재생
                 else:
                     self.is_moving = False
-                    if keys[self.key_left]:
-                        self.rect.x -= self.speed
+                    if input_bits & INPUT_LEFT:
+                        self.frame_rect.x -= self.speed
                         self.is_moving = True
-                    if keys[self.key_right]:
-                        self.rect.x += self.speed
+                    if input_bits & INPUT_RIGHT:
+                        self.frame_rect.x += self.speed
                         self.is_moving = True
                     self.current_state = 'Walk' if self.is_moving else 'Idle'
 
                 # 이동 입력으로 인한 경계 처리는 위에서 한 번 했지만,
                 # 키 입력으로 또 움직였을 수 있으므로 안전하게 한 번 더 체크하거나
                 # 위쪽의 경계 처리를 이 아래로 옮겨도 됩니다. (여기서는 안전하게 둠)
-                if self.rect.left < 0: self.rect.left = 0
-                if self.rect.right > self.screen_width: self.rect.right = self.screen_width
+                if self.frame_rect.left < 0: self.frame_rect.left = 0
+                if self.frame_rect.right > self.screen_width: self.frame_rect.right = self.screen_width
 
                 self.animate()
 
-        # --- Hurtbox 갱신 ---
-        current_hurtbox_relative = self.hurtbox_relative_P1.copy()
-        if self.flip_images:
-            current_hurtbox_relative.x = self.rect.width - current_hurtbox_relative.x - current_hurtbox_relative.width
-
-        self.hurtbox_absolute.x = self.rect.x + current_hurtbox_relative.x
-        self.hurtbox_absolute.y = self.rect.y + current_hurtbox_relative.y
+        # --- Hurtbox 갱신 (테이블 조회 + 이동, 할당 없음) ---
+        current_attack = self.attacks.get(self.current_state)
+        if current_attack is not None and self.current_frame < current_attack.frame_count:
+            hx, hy, hw, hh = current_attack.hurtboxes[self.current_frame]
+        else:
+            hx, hy, hw, hh = self.default_hurtbox
+        self.hurtbox_absolute.update(self.frame_rect.x + hx, self.frame_rect.y + hy, hw, hh)
+
+        self.sync_draw_rect()
+
+    # --- 롤백 넷플레이용 상태 저장/복원 ---
+    def save_state(self):
+        """시뮬레이션에 필요한 값만 담은 튜플 (이미지는 캐시된 프레임의 참조만 저장)"""
+        return (tuple(self.frame_rect), self.current_state, self.current_frame, self.anim_ticks,
+                self.hp, self.is_alive, self.has_hit, self.is_awakened, self.knockback_velocity, self.is_moving,
+                tuple(self.hurtbox_absolute), self.image, self.image_offset, self.image_frames, self.image_index)
+
+    def load_state(self, state):
+        (frame_rect, self.current_state, self.current_frame, self.anim_ticks,
+         self.hp, self.is_alive, self.has_hit, self.is_awakened, self.knockback_velocity, self.is_moving,
+         hurtbox, self.image, self.image_offset, self.image_frames, self.image_index) = state
+        self.frame_rect.update(frame_rect)
+        self.hurtbox_absolute.update(hurtbox)
+        self.sync_draw_rect()
 
     def take_damage(self, damage):
         if not self.is_alive: return
 
         if self.current_state == 'Blocking':
-            print("BLOCK!")
             # [추가] 방어 성공 시에도 살짝 밀림 (선택 사항)
             knockback_force = 5 if self.flip_images else -5
             # self.knockback_velocity = knockback_force
@@ -243,8 +301,7 @@ class Player(pygame.sprite.Sprite):
 
         # [추가] 데미지 입을 때 넉백 적용
         # P1(flip=False)은 왼쪽으로(-), P2(flip=True)는 오른쪽으로(+) 밀려나야 함
-        # 넉백 강도: 15
-        knockback_force = 15
+        knockback_force = self.hit_knockback
         if self.flip_images:  # P2인 경우 (오른쪽 -> 왼쪽 보고 있음)
             self.knockback_velocity = knockback_force  # 오른쪽으로 밀림 (+)
         else:  # P1인 경우 (왼쪽 -> 오른쪽 보고 있음)
@@ -256,23 +313,21 @@ class Player(pygame.sprite.Sprite):
             self.is_alive = False
             self.current_state = 'KO'
             self.current_frame = 0
-            print("KO!")
-        elif self.hp <= 30 and not self.is_awakened:
+            if COMBAT_LOG.level >= LEVEL_INFO:
+                COMBAT_LOG.emit(EVENT_KO, None, self.name, None, 0, self.hp, *self.frame_rect.midbottom)
+        elif self.hp <= self.dizzy_hp and not self.is_awakened:
             self.current_state = 'Dizzy'
             self.current_frame = 0
             self.has_hit = False
-            print("HP low! Triggering Dizzy...")
-        else:
-            print(f"Hit! HP left: {self.hp}")
+            if COMBAT_LOG.level >= LEVEL_INFO:
+                COMBAT_LOG.emit(EVENT_DIZZY, None, self.name, None, 0, self.hp, *self.frame_rect.midbottom)
 
     def force_ko(self):
         """HP와 상관없이 즉시 KO 상태가 됩니다."""
         if not self.is_alive: return
 
-        print("KO PUNCH LANDED!")
-
         # [추가] KO 시 강한 넉백
-        knockback_force = 30
+        knockback_force = KO_KNOCKBACK
         if self.flip_images:
             self.knockback_velocity = knockback_force
         else:
@@ -282,20 +337,40 @@ class Player(pygame.sprite.Sprite):
         self.is_alive = False
         self.current_state = 'KO'
         self.current_frame = 0
+        if COMBAT_LOG.level >= LEVEL_INFO:
+            COMBAT_LOG.emit(EVENT_KO, None, self.name, None, 0, self.hp, *self.frame_rect.midbottom)
+
+    def is_actionable(self):
+        """새 행동(이동/공격/방어)을 입력받을 수 있는 상태인지 (루프 상태이거나 공격의 후딜 캔슬 구간)"""
+        if self.current_state in self.looping_states:
+            return True
+        current_attack = self.attacks.get(self.current_state)
+        return current_attack is not None and self.current_frame >= current_attack.actionable_frame
+
+    def frame_sets(self):
+        """이 선수가 쓰는 모든 FrameList (정밀 판정 마스크를 미리 만들 때)"""
+        yield from self.animations.values()
+        for table in (self.attacks, self.defenses, self.effects):
+            for entry in table.values():
+                yield entry.frames
+
+    def current_mask(self):
+        """지금 그려진 프레임의 충돌 마스크 (rect 기준 좌표, 헤드리스면 None)"""
+        if self.image_frames is None:
+            return None
+        masks = frame_masks(self.image_frames)
+        return masks[self.image_index] if masks is not None else None
 
     def get_absolute_hitbox(self):
-        if self.current_state not in self.attacks:
+        """현재 프레임의 히트박스 (없으면 None).
+        반환되는 Rect는 매 틱 재사용되므로 다음 update 이후까지 보관하지 마세요."""
+        current_attack = self.attacks.get(self.current_state)
+        if current_attack is None or self.current_frame >= current_attack.frame_count:
             return None
 
-        current_attack = self.attacks[self.current_state]
-
-        if self.current_frame != current_attack.hit_frame:
+        box = current_attack.hitboxes[self.current_frame]
+        if box is None:
             return None
 
-        relative_box = current_attack.hitbox.copy()
-
-        if self.flip_images:
-            relative_box.x = self.rect.width - relative_box.x - relative_box.width
-
-        absolute_box = relative_box.move(self.rect.topleft)
-        return absolute_box
\ No newline at end of file
+        self.hitbox_absolute.update(self.frame_rect.x + box[0], self.frame_rect.y + box[1], box[2], box[3])
+        return self.hitbox_absolute
\ No newline at end of file
@@ -0,0 +1,61 @@
+# (파일: preloader.py)
+
+import threading
+
+from game_screen import load_game_background, load_match_sounds
+from match import ANIM_FOLDERS, FIGHTER_SCALE, EFFECT_SCALE, EFFECT_FOLDERS
+from utils import load_animation_frames
+
+
+class MatchPreloader(threading.Thread):
+    """
+    타이틀 화면이 떠 있는 동안 작업 스레드에서 경기 에셋을 미리 로드합니다.
+    프레임은 프로세스 전역 프레임 캐시에 채워지고, 배경/사운드는 assets 딕셔너리로 넘겨집니다.
+    """
+
+    def __init__(self, screen_width, screen_height):
+        super().__init__(daemon=True)
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+        # (폴더, 배율, 반전) 프레임 작업 목록 - P1(정방향), P2(반전), 이펙트
+        self.frame_jobs = []
+        for folder in ANIM_FOLDERS.values():
+            self.frame_jobs.append((folder, FIGHTER_SCALE, False))
+            self.frame_jobs.append((folder, FIGHTER_SCALE, True))
+        for folder in EFFECT_FOLDERS:
+            self.frame_jobs.append((folder, EFFECT_SCALE, False))
+
+        self.total_jobs = len(self.frame_jobs) + 2  # + 배경, 사운드
+        self.done_jobs = 0
+        self.assets = None
+        self.error = None
+        self._finished = threading.Event()
+
+    def run(self):
+        try:
+            for folder, scale, flip in self.frame_jobs:
+                load_animation_frames(folder, scale, flip)
+                self.done_jobs += 1
+
+            bg_image = load_game_background(self.screen_width, self.screen_height)
+            self.done_jobs += 1
+            sounds = load_match_sounds()
+            self.done_jobs += 1
+
+            self.assets = {'bg_image': bg_image, 'sounds': sounds}
+        except Exception as e:
+            # 실패하면 GameScreen이 직접 로드하도록 assets를 None으로 둡니다.
+            print(f"에셋 미리 로드 실패: {e}")
+            self.error = e
+        finally:
+            self._finished.set()
+
+    @property
+    def progress(self):
+        """0.0 ~ 1.0 진행률"""
+        return self.done_jobs / self.total_jobs
+
+    @property
+    def done(self):
+        return self._finished.is_set()
\ No newline at end of file
@@ -0,0 +1,210 @@
+# (파일: replay.py)
+#
+# 경기 입력 녹화 / 재생.
+#   python replay.py verify Replays/*.bxr   -> 화면 없이 최대 속도로 재생해서 결과가 같은지 확인
+#   python replay.py play Replays/a.bxr     -> 창을 열고 실시간으로 재생
+#
+# 파일 구조 (리틀 엔디언):
+#   헤더   : MAGIC, version, tick_rate, tick_count
+#   결과   : winner, p1_hp, p2_hp, hit_count, hit_crc  (재생 결과 검증용)
+#   스트림 : 입력이 바뀔 때마다 [12비트 입력(P1 6비트 | P2 6비트 << 6), 지속 틱 수(Elias gamma)]
+
+import struct
+import sys
+import zlib
+
+from inputs import INPUT_MASK
+from sim_clock import TICK_RATE
+
+MAGIC = b'BXRP'
+VERSION = 1
+INPUT_WORD_BITS = 12
+
+_HEADER = struct.Struct('<4sBBI')
+_RESULT = struct.Struct('<BddII')
+
+
+# ==================================================
+# 1. 비트 스트림
+# ==================================================
+class BitWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self._acc = 0
+        self._count = 0
+
+    def write(self, value, bits):
+        self._acc = (self._acc << bits) | value
+        self._count += bits
+        while self._count >= 8:
+            self._count -= 8
+            self.data.append((self._acc >> self._count) & 0xFF)
+        self._acc &= (1 << self._count) - 1
+
+    def write_gamma(self, value):
+        """1 이상의 정수를 Elias gamma 코드로 씁니다. (짧은 반복일수록 적은 비트)"""
+        length = value.bit_length()
+        self.write(0, length - 1)
+        self.write(value, length)
+
+    def getvalue(self):
+        if self._count:
+            return bytes(self.data) + bytes([(self._acc << (8 - self._count)) & 0xFF])
+        return bytes(self.data)
+
+
+class BitReader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0  # 비트 단위 위치
+
+    def read(self, bits):
+        value = 0
+        for _ in range(bits):
+            byte = self.data[self.pos >> 3]
+            value = (value << 1) | ((byte >> (7 - (self.pos & 7))) & 1)
+            self.pos += 1
+        return value
+
+    def read_gamma(self):
+        zeros = 0
+        while self.read(1) == 0:
+            zeros += 1
+        return (1 << zeros) | self.read(zeros)
+
+
+# ==================================================
+# 2. 녹화 데이터
+# ==================================================
+def match_result(match):
+    """재생 검증에 쓰는 경기 결과 요약."""
+    hit_crc = zlib.crc32(repr(match.hit_log).encode('utf-8'))
+    return {
+        'winner': match.winner,
+        'p1_hp': float(match.player1.hp),
+        'p2_hp': float(match.player2.hp),
+        'hit_count': len(match.hit_log),
+        'hit_crc': hit_crc,
+    }
+
+
+class Replay:
+    """틱별 (P1 입력, P2 입력) 목록과 녹화 당시의 경기 결과."""
+
+    def __init__(self, inputs=None, result=None):
+        self.inputs = inputs if inputs is not None else []
+        self.result = result
+
+    def record(self, p1_input, p2_input):
+        self.inputs.append((p1_input, p2_input))
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def encode(self):
+        writer = BitWriter()
+        i = 0
+        while i < len(self.inputs):
+            run = 1
+            while i + run < len(self.inputs) and self.inputs[i + run] == self.inputs[i]:
+                run += 1
+            p1_input, p2_input = self.inputs[i]
+            writer.write((p1_input & INPUT_MASK) | ((p2_input & INPUT_MASK) << 6), INPUT_WORD_BITS)
+            writer.write_gamma(run)
+            i += run
+
+        result = self.result or {'winner': 0, 'p1_hp': 0.0, 'p2_hp': 0.0, 'hit_count': 0, 'hit_crc': 0}
+        return (_HEADER.pack(MAGIC, VERSION, TICK_RATE, len(self.inputs)) +
+                _RESULT.pack(result['winner'], result['p1_hp'], result['p2_hp'],
+                             result['hit_count'], result['hit_crc']) +
+                writer.getvalue())
+
+    @classmethod
+    def decode(cls, data):
+        magic, version, tick_rate, tick_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("지원하지 않는 리플레이 형식입니다.")
+        if tick_rate != TICK_RATE:
+            raise ValueError(f"틱 속도가 다릅니다: {tick_rate} (현재 {TICK_RATE})")
+
+        winner, p1_hp, p2_hp, hit_count, hit_crc = _RESULT.unpack_from(data, _HEADER.size)
+        result = {'winner': winner, 'p1_hp': p1_hp, 'p2_hp': p2_hp,
+                  'hit_count': hit_count, 'hit_crc': hit_crc}
+
+        reader = BitReader(data[_HEADER.size + _RESULT.size:])
+        inputs = []
+        while len(inputs) < tick_count:
+            word = reader.read(INPUT_WORD_BITS)
+            run = reader.read_gamma()
+            inputs.extend([(word & INPUT_MASK, word >> 6)] * run)
+        return cls(inputs, result)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.decode(f.read())
+
+
+# ==================================================
+# 3. 재생
+# ==================================================
+def run_replay(replay):
+    """화면 없이 최대 속도로 재생하고 경기 결과를 반환합니다."""
+    from headless import SCREEN_WIDTH, SCREEN_HEIGHT
+    from match import Match
+
+    match = Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True)
+    for p1_input, p2_input in replay.inputs:
+        match.step(p1_input, p2_input)
+    return match_result(match)
+
+
+def verify(paths):
+    failed = 0
+    for path in paths:
+        replay = Replay.load(path)
+        result = run_replay(replay)
+        ok = result == replay.result
+        failed += not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {path} ({len(replay)} 틱)")
+        if not ok:
+            print(f"     기록: {replay.result}")
+            print(f"     재생: {result}")
+    return failed
+
+
+def play(path):
+    """창을 열고 실시간으로 재생합니다."""
+    import pygame
+    from game_screen import GameScreen
+
+    pygame.init()
+    screen = pygame.display.set_mode((1080, 720))
+    pygame.display.set_caption(f"Replay - {path}")
+    clock = pygame.time.Clock()
+    game_screen = GameScreen(1080, 720, replay=Replay.load(path))
+
+    dt_ms = 0
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        game_screen.update(dt_ms)
+        game_screen.draw(screen)
+        pygame.display.flip()
+        dt_ms = clock.tick(60)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "verify":
+        sys.exit(1 if verify(sys.argv[2:]) else 0)
+    elif len(sys.argv) == 3 and sys.argv[1] == "play":
+        play(sys.argv[2])
+    else:
+        print("사용법: python replay.py verify <파일...> | play <파일>")
\ No newline at end of file
@@ -0,0 +1,38 @@
+# (파일: sim_clock.py)
+
+# 전투 시뮬레이션은 고정 틱으로 진행합니다. (렌더링 프레임 속도와 무관)
+TICK_RATE = 60
+TICK_MS = 1000 / TICK_RATE
+
+# 한 번에 따라잡을 수 있는 최대 틱 수 (이보다 밀리면 남은 시간은 버림)
+MAX_CATCHUP_STEPS = 5
+
+
+def ms_to_ticks_exceeded(ticks, delay_ms):
+    """ticks 만큼 흐른 시간이 delay_ms를 '초과'했는지 정수 연산으로 판단합니다."""
+    return ticks * 1000 > delay_ms * TICK_RATE
+
+
+class FixedStepAccumulator:
+    """
+    실제 경과 시간(ms)을 모아 두었다가 고정 틱 몇 번을 돌려야 하는지 알려줍니다.
+    time_scale로 시뮬레이션을 실제보다 빠르게/느리게 돌릴 수 있습니다.
+    """
+
+    def __init__(self, time_scale=1.0, max_steps=MAX_CATCHUP_STEPS):
+        self.time_scale = time_scale
+        self.max_steps = max_steps
+        self.accumulated_ms = 0.0
+
+    def add(self, dt_ms):
+        self.accumulated_ms += dt_ms * self.time_scale
+
+    def consume(self):
+        """이번 프레임에 실행할 틱 수를 반환하고 그만큼 시간을 차감합니다."""
+        steps = int(self.accumulated_ms // TICK_MS)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulated_ms = 0.0  # 너무 밀렸으면 따라잡기를 포기 (spiral of death 방지)
+        else:
+            self.accumulated_ms -= steps * TICK_MS
+        return steps
@@ -0,0 +1,92 @@
+# (파일: sim_thread.py)
+#
+# 시뮬레이션 스레드 (main.py의 THREADED_SIMULATION 모드).
+# GameScreen의 고정 틱(입력 스냅샷 -> Match.step -> 녹화)을 별도 스레드에서 TICK_RATE로 돌리고,
+# 틱이 끝날 때마다 그리는 데 필요한 값만 복사한 불변 스냅샷(MatchSnapshot)을 발행합니다.
+# 메인 스레드는 가장 최근 스냅샷만 그리며 살아 있는 Player/이펙트는 건드리지 않습니다.
+#   - 발행은 참조 하나를 바꾸는 것뿐이라 잠금이 필요 없고, 렌더링은 항상 완성된 틱 하나를 통째로 봅니다.
+#   - blit/flip/vsync 대기 중에는 GIL이 풀리므로 그동안 시뮬레이션이 진행되고,
+#     렌더링이 한 번 크게 늦어져도 틱 간격은 그대로 유지됩니다.
+
+import threading
+import time
+
+from sim_clock import TICK_RATE, MAX_CATCHUP_STEPS
+
+TICK_SECONDS = 1 / TICK_RATE
+SPIN_SECONDS = 0.002  # 예정 시각 직전 2ms는 sleep 대신 양보하며 기다림 (sleep 해상도가 거친 OS 대비)
+
+
+class MatchSnapshot:
+    """
+    한 틱의 그릴 거리.
+    sprites: 그리는 순서대로 (이미지, Rect 복사본) - 이미지는 프레임 캐시의 공유 Surface (수정하지 않음)
+    hud: 체력바별 (hp, 각성 여부)
+    """
+    __slots__ = ('tick', 'sprites', 'hud', 'game_over', 'winner_text')
+
+    def __init__(self, tick, sprites, hud, game_over, winner_text):
+        self.tick = tick
+        self.sprites = sprites
+        self.hud = hud
+        self.game_over = game_over
+        self.winner_text = winner_text
+
+
+class SimulationThread:
+    """GameScreen.tick()을 고정 간격으로 부르고 latest에 스냅샷을 발행합니다."""
+
+    def __init__(self, game_screen):
+        self.game_screen = game_screen
+        self.latest = game_screen.make_snapshot()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # 통계 (틱 간격이 흔들리지 않는지 확인용)
+        self.ticks = 0
+        self.late_ticks = 0      # 예정 시각보다 한 틱 이상 늦게 시작한 틱
+        self.skipped_ticks = 0   # 너무 밀려서 건너뛴 틱
+        self.max_lateness = 0.0  # 초
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        next_time = time.perf_counter()
+        while not self._stop.is_set():
+            remaining = next_time - time.perf_counter()
+            if remaining > SPIN_SECONDS:
+                self._stop.wait(remaining - SPIN_SECONDS)
+                continue
+            if remaining > 0:
+                time.sleep(0)  # GIL을 넘겨 렌더링이 진행되게 함
+                continue
+
+            lateness = -remaining
+            if lateness > MAX_CATCHUP_STEPS * TICK_SECONDS:
+                # 너무 밀렸으면 따라잡기를 포기하고 지금부터 다시 셈 (FixedStepAccumulator와 같은 규칙)
+                skipped = int(lateness / TICK_SECONDS)
+                self.skipped_ticks += skipped
+                next_time += skipped * TICK_SECONDS
+                lateness -= skipped * TICK_SECONDS
+            if lateness >= TICK_SECONDS:
+                self.late_ticks += 1
+            if lateness > self.max_lateness:
+                self.max_lateness = lateness
+
+            self.game_screen.tick()
+            self.latest = self.game_screen.make_snapshot()
+            self.ticks += 1
+            next_time += TICK_SECONDS
+
+    def summary(self):
+        return (f"시뮬레이션 스레드: {self.ticks}틱, 한 틱 이상 늦음 {self.late_ticks}회, "
+                f"건너뜀 {self.skipped_ticks}틱, 최대 지연 {self.max_lateness * 1000:.1f}ms")
\ No newline at end of file
@@ -0,0 +1,174 @@
+# (파일: sound_bank.py)
+#
+# 프로세스 전역 사운드 뱅크 + 우선순위 채널 풀.
+#   - 사운드는 프로세스당 한 번만 디코딩합니다. (mixer.Sound = 믹서 포맷 PCM 버퍼)
+#   - 재생은 예약된 채널 풀에서만 하며, 종류별 동시 재생 수 제한과 우선순위가 있습니다.
+#     (bell > ko > hit > block) 채널이 모자라면 더 낮은 우선순위 소리를 끊고, 그것도 없으면 버립니다.
+#   - play()는 디코딩/대기 없이 바로 반환합니다. (타격 판정 중에 호출됨)
+
+import os
+import threading
+
+import pygame
+
+SOUND_DIR = "Sounds"
+
+# 이름: (파일, 볼륨, 종류)
+#   - 펀치 소리는 기술과 상관없이 'hit'. KO 펀치는 펀치 소리 대신 'KO'를 냅니다. (collisions._apply_hit)
+#   - 방어 효과음('Block') 파일은 아직 없어서 'block' 종류는 지금 쓰이지 않음 (없는 이름은 조용히 무시)
+SOUND_FILES = {
+    'Bell': ("boxing_matchbell.wav", 0.5, 'bell'),
+    'Jab': ("MP_Left Hook.mp3", 0.6, 'hit'),
+    'Straight': ("MP_Right Cross.mp3", 0.6, 'hit'),
+    'Uppercut': ("MP_Right Hook.mp3", 0.6, 'hit'),
+    'KO': ("MP_Right Hook.mp3", 0.9, 'ko'),
+}
+
+# 종류: (우선순위 - 클수록 중요, 최대 동시 재생 수)
+CATEGORIES = {
+    'bell': (3, 1),
+    'ko': (2, 2),
+    'hit': (1, 4),
+    'block': (0, 2),
+}
+
+RESERVED_CHANNELS = 8  # 풀 전용으로 예약하는 믹서 채널 수
+
+
+# ==================================================
+# 1. 사운드 뱅크 (디코딩 캐시)
+# ==================================================
+class SoundBank:
+    """이름 -> (mixer.Sound, 종류). 한 번 로드하면 프로세스가 끝날 때까지 재사용합니다."""
+
+    def __init__(self, sound_files=SOUND_FILES, sound_dir=SOUND_DIR):
+        self.sound_files = sound_files
+        self.sound_dir = sound_dir
+        self.entries = {}
+        self._lock = threading.Lock()  # 프리로더 스레드와 메인 스레드가 동시에 부를 수 있음
+        self.loaded = False
+
+    def load(self):
+        with self._lock:
+            if self.loaded:
+                return
+            for name, (filename, volume, category) in self.sound_files.items():
+                try:
+                    sound = pygame.mixer.Sound(os.path.join(self.sound_dir, filename))
+                except Exception as e:
+                    print(f"사운드 로드 실패 ({name}): {e}")
+                    continue
+                sound.set_volume(volume)
+                self.entries[name] = (sound, category)
+            self.loaded = True
+
+    def get(self, name):
+        return self.entries.get(name)
+
+
+# ==================================================
+# 2. 채널 풀
+# ==================================================
+class ChannelPool:
+    """
+    예약된 채널에서만 재생하는 보이스 할당기.
+    채널/상태 리스트는 미리 만들어 두고, play()는 채널 몇 개를 훑는 것 말고는 하지 않습니다.
+    """
+
+    def __init__(self, num_channels=RESERVED_CHANNELS, categories=CATEGORIES):
+        if pygame.mixer.get_num_channels() < num_channels:
+            pygame.mixer.set_num_channels(num_channels)
+        pygame.mixer.set_reserved(num_channels)  # Sound.play()의 자동 채널 선택에서 제외
+
+        self.categories = categories
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self.owner = [None] * num_channels    # 채널별 현재 재생 중인 종류
+        self.started = [0] * num_channels     # 채널별 재생 시작 순번 (작을수록 오래됨)
+        self.counter = 0
+        self.stolen = 0   # 다른 소리를 끊고 재생한 횟수
+        self.dropped = 0  # 채널이 없어 버린 횟수
+
+    def play(self, sound, category):
+        """재생했으면 True, 더 중요한 소리들에 밀려 버렸으면 False"""
+        priority, limit = self.categories[category]
+
+        free = None
+        same_count = 0
+        same_oldest = None
+        victim = None
+        victim_priority = priority
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                if free is None:
+                    free = i
+                continue
+            owner = self.owner[i]
+            if owner == category:
+                same_count += 1
+                if same_oldest is None or self.started[i] < self.started[same_oldest]:
+                    same_oldest = i
+            else:
+                # 끊을 후보: 우선순위가 가장 낮고, 같으면 가장 오래된 소리
+                owner_priority = self.categories[owner][0] if owner else -1
+                if owner_priority < victim_priority or \
+                        (victim is not None and owner_priority == victim_priority and
+                         self.started[i] < self.started[victim]):
+                    victim = i
+                    victim_priority = owner_priority
+
+        if same_count >= limit:
+            index = same_oldest  # 같은 종류가 한도만큼 재생 중: 가장 오래된 것을 다시 사용
+            self.stolen += 1
+        elif free is not None:
+            index = free
+        elif victim is not None:
+            index = victim
+            self.stolen += 1
+        else:
+            self.dropped += 1
+            return False
+
+        self.counter += 1
+        self.owner[index] = category
+        self.started[index] = self.counter
+        self.channels[index].play(sound)
+        return True
+
+
+# ==================================================
+# 3. 재생 창구 (GameScreen / 타격 판정에서 사용)
+# ==================================================
+class SoundPlayer:
+    """이름으로 재생합니다. 없는 이름(예: 'Block' 효과음 파일이 없을 때)은 조용히 무시합니다."""
+
+    def __init__(self, bank, pool):
+        self.bank = bank
+        self.pool = pool
+
+    def play(self, name):
+        entry = self.bank.get(name)
+        if entry is None:
+            return False
+        return self.pool.play(entry[0], entry[1])
+
+
+_sound_player = None
+_player_lock = threading.Lock()
+
+
+def get_sound_player():
+    """프로세스 전역 SoundPlayer. 첫 호출에서만 믹서 초기화와 디코딩을 합니다.
+    믹서를 쓸 수 없으면 None (소리 없이 진행)."""
+    global _sound_player
+    with _player_lock:
+        if _sound_player is None:
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+            except pygame.error as e:
+                print(f"믹서 초기화 실패: {e}")
+                return None
+            bank = SoundBank()
+            bank.load()
+            _sound_player = SoundPlayer(bank, ChannelPool())
+        return _sound_player
\ No newline at end of file
@@ -0,0 +1,367 @@
+# (파일: telemetry.py)
+#
+# 경기 텔레메트리 (분석용). 틱마다 두 선수의 상태와 타격/방어 기록을 열 단위로 모아 파일에 덧붙입니다.
+#   - 기록: 타입이 정해진 array 버퍼에 append만 하고, CHUNK_ROWS 틱마다(또는 경기가 끝나면) 한 덩어리로 씀
+#   - 읽기: 파일을 mmap하고 덩어리마다 numpy 배열 뷰를 만들어 수천 경기를 집계
+#           (column_chunks는 복사 없는 덩어리별 뷰, column은 덩어리를 이어 붙인 복사본)
+#   python telemetry.py summary Telemetry/matches.bxt  -> 경기 수, 상태 비율, 기술별 타격/방어, 승률
+#
+# 파일 구조 (리틀 엔디언, 모든 열은 4바이트 경계에서 시작):
+#   헤더   : MAGIC, version, 선수 수, 상태 이름 길이 + 이름(쉼표 구분 UTF-8), 4바이트 패딩
+#   덩어리 : match_id, 틱 수, 이벤트 수, 플래그(1: 경기 끝)
+#            틱 열   : tick, 선수별 x / hp / knockback / state / frame / awakened (tick_fields 순서)
+#            이벤트 열: tick, attacker, move, outcome (EVENT_FIELDS 순서)
+#   한 경기가 여러 덩어리에 걸칠 수 있고, 같은 파일에 세션마다 경기가 계속 덧붙습니다.
+
+import argparse
+import mmap
+import os
+import struct
+from array import array
+
+MAGIC = b'BXTM'
+VERSION = 1
+CHUNK_ROWS = 3600  # 3600틱(1분)마다 한 번 씀
+
+STATE_NAMES = ('Idle', 'Walk', 'Blocking', 'Jab', 'Straight', 'Uppercut', 'Dizzy', 'KO')
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+UNKNOWN_STATE = 255
+OUTCOMES = ('hit', 'block', 'invincible')
+OUTCOME_CODES = {name: code for code, name in enumerate(OUTCOMES)}
+
+PLAYER_FIELDS = (('x', 'i'), ('hp', 'f'), ('knockback', 'f'), ('state', 'B'), ('frame', 'B'), ('awakened', 'B'))
+EVENT_FIELDS = (('tick', 'I'), ('attacker', 'B'), ('move', 'B'), ('outcome', 'B'))
+FLAG_MATCH_END = 1
+
+_HEADER = struct.Struct('<4sBBH')
+_CHUNK = struct.Struct('<IIII')
+_DTYPES = {'I': '<u4', 'i': '<i4', 'f': '<f4', 'B': 'u1'}
+
+
+def tick_fields(player_count):
+    """틱 열 (이름, 타입) 목록: tick, 그다음 필드마다 p1_x, p2_x, p1_hp, ... (4바이트 열이 앞에 오도록)"""
+    fields = [('tick', 'I')]
+    for name, typecode in PLAYER_FIELDS:
+        fields.extend((f"p{n + 1}_{name}", typecode) for n in range(player_count))
+    return fields
+
+
+def _padding(size):
+    return -size % 4
+
+
+def _block_layout(fields, rows):
+    """[(이름, 타입, 덩어리 안 오프셋)], 전체 바이트 수"""
+    layout = []
+    offset = 0
+    for name, typecode in fields:
+        layout.append((name, typecode, offset))
+        offset += array(typecode).itemsize * rows
+        offset += _padding(offset)
+    return layout, offset
+
+
+def _read_header(data):
+    magic, version, player_count, name_length = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("지원하지 않는 텔레메트리 형식입니다.")
+    start = _HEADER.size
+    state_names = tuple(bytes(data[start:start + name_length]).decode('utf-8').split(","))
+    end = start + name_length
+    return player_count, state_names, end + _padding(end)
+
+
+def _iter_chunks(data, offset, player_count):
+    """(match_id, 틱 수, 이벤트 수, 플래그, 틱 열 시작, 이벤트 열 시작) - 헤더만 읽고 건너뜀"""
+    fields = tick_fields(player_count)
+    while offset + _CHUNK.size <= len(data):
+        match_id, rows, events, flags = _CHUNK.unpack_from(data, offset)
+        tick_start = offset + _CHUNK.size
+        event_start = tick_start + _block_layout(fields, rows)[1]
+        offset = event_start + _block_layout(EVENT_FIELDS, events)[1]
+        if offset > len(data):
+            break  # 쓰다 만 덩어리 (강제 종료 등)
+        yield match_id, rows, events, flags, tick_start, event_start
+
+
+# ==================================================
+# 1. 기록
+# ==================================================
+class TelemetryRecorder:
+    """
+    GameScreen.tick에서 Match.step 직후 record(match)를 부릅니다.
+    다른 Match 객체가 들어오면 새 경기로 보고, 경기가 끝난 틱까지만 기록합니다.
+    파일은 만들 때 바로 엽니다. (main 시작 시점 - 게임 루프가 돌기 전)
+    """
+
+    def __init__(self, path, player_count=2, chunk_rows=CHUNK_ROWS):
+        self.path = path
+        self.player_count = player_count
+        self.chunk_rows = chunk_rows
+        self.matches = 0  # 이번 세션에 기록한 경기 수
+
+        self.tick = array('I')
+        self.players = [[array(typecode) for _, typecode in PLAYER_FIELDS] for _ in range(player_count)]
+        self.events = [array(typecode) for _, typecode in EVENT_FIELDS]
+        # record가 틱마다 부르므로 append 메서드를 미리 꺼내 둠
+        self._tick_append = self.tick.append
+        self._player_appends = [tuple(column.append for column in columns) for columns in self.players]
+
+        self._file = None
+        self._next_id = 0
+        self._match = None
+        self._match_id = 0
+        self._hit_index = 0
+        self._finished = False
+        self._open()  # 시작할 때 미리 열어 둠 (첫 경기 틱이 기존 파일을 훑느라 멈추지 않도록)
+
+    def record(self, match):
+        if match is not self._match:
+            self._begin(match)
+        if self._finished:
+            return
+
+        self._tick_append(match.tick)
+        for player, (x, hp, knockback, state, frame, awakened) in zip(match.players, self._player_appends):
+            x(player.frame_rect.x)
+            hp(player.hp)
+            knockback(player.knockback_velocity)
+            state(STATE_CODES.get(player.current_state, UNKNOWN_STATE))
+            frame(player.current_frame & 0xFF)
+            awakened(player.is_awakened)
+
+        hit_log = match.hit_log
+        if self._hit_index < len(hit_log):
+            event_tick, attacker, move, outcome = self.events
+            for tick, attacker_index, move_name, result in hit_log[self._hit_index:]:
+                event_tick.append(tick)
+                attacker.append(attacker_index)
+                move.append(STATE_CODES.get(move_name, UNKNOWN_STATE))
+                outcome.append(OUTCOME_CODES[result])
+            self._hit_index = len(hit_log)
+
+        if match.game_over:
+            self._finished = True
+            self.flush(FLAG_MATCH_END)
+        elif len(self.tick) >= self.chunk_rows:
+            self.flush()
+
+    def _begin(self, match):
+        self.flush()
+        self._match = match
+        self._match_id = self._next_id
+        self._next_id += 1
+        self._hit_index = 0
+        self._finished = False
+        self.matches += 1
+
+    def _open(self):
+        """파일이 이미 있으면 뒤에 이어 쓰고, match_id도 이어서 매깁니다."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            self._file = open(self.path, 'r+b')
+            try:
+                end = self._scan(self._file, os.path.getsize(self.path))
+            except Exception:
+                self._file.close()
+                self._file = None
+                raise
+            self._file.truncate(end)  # 쓰다 만 덩어리는 버림
+            self._file.seek(end)
+        else:
+            names = ",".join(STATE_NAMES).encode('utf-8')
+            header = _HEADER.pack(MAGIC, VERSION, self.player_count, len(names)) + names
+            self._file = open(self.path, 'wb')
+            self._file.write(header + bytes(_padding(len(header))))
+
+    def _scan(self, f, size):
+        """덩어리 헤더(16바이트)만 seek로 따라가며 다음 match_id와 온전한 마지막 덩어리의 끝을 찾습니다.
+        (열 데이터는 읽지 않으므로 파일이 커져도 시간/메모리가 거의 늘지 않음)"""
+        header = f.read(_HEADER.size)
+        name_length = _HEADER.unpack(header)[3]
+        player_count, state_names, offset = _read_header(header + f.read(name_length))
+        if player_count != self.player_count or state_names != STATE_NAMES:
+            raise ValueError(f"{self.path}: 다른 형식의 텔레메트리 파일입니다.")
+        fields = tick_fields(player_count)
+        end = offset
+        while end + _CHUNK.size <= size:
+            f.seek(end)
+            match_id, rows, events, _ = _CHUNK.unpack(f.read(_CHUNK.size))
+            chunk_end = (end + _CHUNK.size + _block_layout(fields, rows)[1]
+                         + _block_layout(EVENT_FIELDS, events)[1])
+            if chunk_end > size:
+                break  # 쓰다 만 덩어리 (강제 종료 등)
+            self._next_id = max(self._next_id, match_id + 1)
+            end = chunk_end
+        return end
+
+    def flush(self, flags=0):
+        """모은 틱과 이벤트를 덩어리 하나로 씁니다."""
+        rows, events = len(self.tick), len(self.events[0])
+        if self._file is None or (rows == 0 and events == 0 and not flags):
+            return
+        columns = [self.tick] + [player[i] for i in range(len(PLAYER_FIELDS)) for player in self.players]
+        parts = [_CHUNK.pack(self._match_id, rows, events, flags)]
+        for column in columns + self.events:
+            data = column.tobytes()
+            parts.append(data)
+            parts.append(bytes(_padding(len(data))))
+            del column[:]
+        self._file.write(b''.join(parts))
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ==================================================
+# 2. 읽기 (mmap + numpy)
+# ==================================================
+class TelemetryFile:
+    """
+    with TelemetryFile(path) as telemetry:
+        for chunk, states in telemetry.column_chunks('p1_state'):  # 덩어리별 mmap 뷰 (복사 없음)
+            ...
+        states = telemetry.column('p1_state')   # 모든 경기의 틱별 값 (이어 붙인 복사본)
+        matches = telemetry.column('match')      # 같은 길이의 match_id
+    뷰는 파일이 열려 있는 동안만 씁니다. (close 때 남아 있는 뷰가 있으면 매핑은 그 뷰가 사라질 때 닫힘)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.player_count, self.state_names, offset = _read_header(self._map)
+        self.chunks = list(_iter_chunks(self._map, offset, self.player_count))
+        self.tick_fields = tick_fields(self.player_count)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # 아직 살아 있는 뷰가 매핑을 참조 중
+        self._file.close()
+
+    @property
+    def match_ids(self):
+        return sorted({chunk[0] for chunk in self.chunks})
+
+    @property
+    def finished_match_ids(self):
+        return sorted({chunk[0] for chunk in self.chunks if chunk[3] & FLAG_MATCH_END})
+
+    def column_chunks(self, name):
+        """틱 열 하나를 덩어리마다 (덩어리 정보, mmap 위의 numpy 뷰)로 (복사 없음, 큰 파일의 누적 집계용)"""
+        return self._views(name, self.tick_fields, count_index=1, start_index=4)
+
+    def event_column_chunks(self, name):
+        """이벤트 열 하나 (tick / attacker / move / outcome)를 덩어리마다 뷰로"""
+        return self._views(name, EVENT_FIELDS, count_index=2, start_index=5)
+
+    def column(self, name):
+        """틱 열 하나를 모든 덩어리를 이어 붙인 배열(복사본)로. 'match'는 각 틱의 match_id"""
+        return self._gather(name, self.tick_fields, count_index=1, start_index=4)
+
+    def event_column(self, name):
+        """이벤트 열 하나를 이어 붙인 배열(복사본)로 ('match'는 match_id)"""
+        return self._gather(name, EVENT_FIELDS, count_index=2, start_index=5)
+
+    def _views(self, name, fields, count_index, start_index):
+        import numpy as np
+
+        typecode = dict(fields).get(name)
+        if typecode is None:
+            raise KeyError(f"없는 열: {name}")
+        dtype = np.dtype(_DTYPES[typecode])
+        for chunk in self.chunks:
+            count = chunk[count_index]
+            layout = dict((field, offset) for field, _, offset in _block_layout(fields, count)[0])
+            yield chunk, np.frombuffer(self._map, dtype, count, chunk[start_index] + layout[name])
+
+    def _gather(self, name, fields, count_index, start_index):
+        import numpy as np
+
+        if name == 'match':
+            return np.repeat(np.array([chunk[0] for chunk in self.chunks], dtype=np.uint32),
+                             [chunk[count_index] for chunk in self.chunks])
+        views = [view for _, view in self._views(name, fields, count_index, start_index)]
+        if not views:
+            return np.zeros(0, np.dtype(_DTYPES[dict(fields)[name]]))
+        return np.concatenate(views)
+
+
+def summarize(paths):
+    """여러 파일을 합쳐서 집계한 결과 dict"""
+    import numpy as np
+
+    ticks = 0
+    matches = finished = p1_wins = p2_wins = 0
+    state_ticks = np.zeros((2, len(STATE_NAMES)), dtype=np.int64)
+    event_counts = np.zeros((len(STATE_NAMES), len(OUTCOMES)), dtype=np.int64)
+    for path in paths:
+        with TelemetryFile(path) as telemetry:
+            matches += len(telemetry.match_ids)
+            ticks += sum(chunk[1] for chunk in telemetry.chunks)
+            # 틱 열은 덩어리별 뷰로 누적 (파일 전체를 복사하지 않음)
+            for n in range(2):
+                for _, states in telemetry.column_chunks(f"p{n + 1}_state"):
+                    state_ticks[n] += np.bincount(states[states < len(STATE_NAMES)], minlength=len(STATE_NAMES))
+
+            # 경기가 끝난 덩어리의 마지막 틱 체력으로 승패
+            final_hp = {}
+            for n in range(2):
+                for chunk, hp in telemetry.column_chunks(f"p{n + 1}_hp"):
+                    if chunk[3] & FLAG_MATCH_END and chunk[1]:
+                        final_hp.setdefault(chunk[4], [0.0, 0.0])[n] = float(hp[-1])
+            finished += len(final_hp)
+            p1_wins += sum(1 for p1_hp, p2_hp in final_hp.values() if p2_hp <= 0)
+            p2_wins += sum(1 for p1_hp, p2_hp in final_hp.values() if p1_hp <= 0)
+
+            moves = telemetry.event_column('move')
+            outcomes = telemetry.event_column('outcome')
+            known = moves < len(STATE_NAMES)
+            np.add.at(event_counts, (moves[known], outcomes[known]), 1)
+
+    return {
+        'matches': matches, 'finished': finished, 'ticks': ticks,
+        'p1_wins': p1_wins, 'p2_wins': p2_wins,
+        'state_share': {f"p{n + 1}": {name: float(state_ticks[n, code] / max(1, ticks))
+                                      for code, name in enumerate(STATE_NAMES) if state_ticks[n, code]}
+                        for n in range(2)},
+        'moves': {STATE_NAMES[code]: dict(zip(OUTCOMES, map(int, event_counts[code])))
+                  for code in range(len(STATE_NAMES)) if event_counts[code].any()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경기 텔레메트리 집계")
+    parser.add_argument("command", choices=("summary",))
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args()
+
+    result = summarize(args.paths)
+    print(f"경기 {result['matches']}개 (끝난 경기 {result['finished']}개), {result['ticks']}틱 "
+          f"({result['ticks'] / 60 / 60:.1f}분)")
+    if result['finished']:
+        print(f"  1P 승 {result['p1_wins']}  2P 승 {result['p2_wins']}")
+    for player, shares in result['state_share'].items():
+        cells = "  ".join(f"{name} {share * 100:.1f}%" for name, share in shares.items())
+        print(f"  {player} 상태 비율: {cells}")
+    for move, counts in result['moves'].items():
+        cells = "  ".join(f"{outcome} {count}" for outcome, count in counts.items())
+        print(f"  {move:9s} {cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
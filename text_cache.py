@@ -0,0 +1,23 @@
+# (파일: text_cache.py)
+
+# 바뀌지 않는 텍스트("BOXING KING", 승패 배너 등)를 매 프레임 다시 래스터라이즈하지 않도록
+# (폰트, 텍스트, 색상, 안티앨리어싱) 키로 렌더링 결과 Surface를 보관합니다.
+MAX_ENTRIES = 256
+
+_cache = {}
+
+
+def render_text(font, text, color, antialias=True):
+    key = (font, text, tuple(color), antialias)
+    surface = _cache.get(key)
+    if surface is None:
+        if len(_cache) >= MAX_ENTRIES:
+            # 가장 먼저 들어온 항목부터 버림 (dict는 삽입 순서 유지)
+            del _cache[next(iter(_cache))]
+        surface = font.render(text, antialias, color)
+        _cache[key] = surface
+    return surface
+
+
+def clear():
+    _cache.clear()
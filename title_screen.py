@@ -2,6 +2,8 @@
 
 import pygame
 import os
+from dirty_renderer import DirtyRenderer, HudItem
+from text_cache import render_text
 
 
 class TitleScreen:
@@ -10,6 +12,7 @@ class TitleScreen:
         self.screen_height = screen_height
         self.title_font = pygame.font.Font(None, 80)
         self.sub_font = pygame.font.Font(None, 40)
+        self.guide_font = pygame.font.Font(None, 30)
 
         try:
             self.bg_image = pygame.image.load(os.path.join("Backgrounds", "lobby.png")).convert()
@@ -17,11 +20,27 @@ class TitleScreen:
         except:
             self.bg_image = None
 
+        # --- 더티 렉트 렌더링용 (정적인 화면이라 바뀐 부분만 갱신) ---
+        self.renderer = DirtyRenderer(self.bg_image)
+        self.hud_title = HudItem(self.text_rect("BOXING KING", self.title_font, -50),
+                                 lambda s: self.draw_text_center(s, "BOXING KING", self.title_font, (255, 255, 0), -50))
+        self.hud_start = HudItem(self.text_rect("Press SPACE to Start", self.sub_font, 50),
+                                 lambda s: self.draw_text_center(s, "Press SPACE to Start", self.sub_font,
+                                                                 (255, 255, 255), 50))
+        self.hud_cpu = HudItem(self.text_rect("Press C to Play vs CPU", self.guide_font, 100),
+                               lambda s: self.draw_text_center(s, "Press C to Play vs CPU", self.guide_font,
+                                                               (200, 200, 200), 100))
+        loading_rect = self.text_rect("Loading... 100%", self.sub_font, 50).union(self.loading_bar_rect())
+        self.hud_loading = HudItem(loading_rect.inflate(20, 4), self.draw_loading_overlay)
+        self.loading_progress = 0.0
+
     def handle_events(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     return "PLAY"
+                elif event.key == pygame.K_c:
+                    return "PLAY_CPU"
         return "TITLE"
 
     def update(self):
@@ -35,8 +54,56 @@ class TitleScreen:
 
         self.draw_text_center(screen, "BOXING KING", self.title_font, (255, 255, 0), -50)
         self.draw_text_center(screen, "Press SPACE to Start", self.sub_font, (255, 255, 255), 50)
+        self.draw_text_center(screen, "Press C to Play vs CPU", self.guide_font, (200, 200, 200), 100)
+
+    def draw_loading(self, screen, progress):
+        """SPACE를 눌렀지만 경기 에셋 로딩이 끝나지 않았을 때 진행률을 보여줍니다."""
+        if self.bg_image:
+            screen.blit(self.bg_image, (0, 0))
+        else:
+            screen.fill((0, 0, 0))
+
+        self.draw_text_center(screen, "BOXING KING", self.title_font, (255, 255, 0), -50)
+        self.loading_progress = progress
+        self.draw_loading_overlay(screen)
+
+    def draw_loading_overlay(self, screen):
+        progress = self.loading_progress
+        self.draw_text_center(screen, f"Loading... {int(progress * 100)}%", self.sub_font, (255, 255, 255), 50)
+
+        bar_rect = self.loading_bar_rect()
+        pygame.draw.rect(screen, (80, 80, 80), bar_rect)
+        pygame.draw.rect(screen, (255, 255, 255), pygame.Rect(bar_rect.x, bar_rect.y,
+                                                              int(bar_rect.width * progress), bar_rect.height))
+
+    def loading_bar_rect(self):
+        BAR_LENGTH = 300
+        BAR_HEIGHT = 10
+        x = (self.screen_width - BAR_LENGTH) // 2
+        y = self.screen_height // 2 + 80
+        return pygame.Rect(x, y, BAR_LENGTH, BAR_HEIGHT)
+
+    def draw_dirty(self, screen, progress=None):
+        """더티 렉트 버전의 draw / draw_loading. 바뀐 화면 사각형 목록을 반환합니다.
+        progress가 None이면 타이틀, 아니면 로딩 화면."""
+        if progress is not None:
+            self.loading_progress = progress
+            loading_key = int(progress * 100)
+            start_key = None
+        else:
+            loading_key = None
+            start_key = True
+        hud = [(self.hud_title, True), (self.hud_start, start_key), (self.hud_cpu, start_key),
+               (self.hud_loading, loading_key)]
+        return self.renderer.render(screen, [], hud)
+
+    def text_rect(self, text, font, y_offset=0):
+        """draw_text_center로 그렸을 때 텍스트가 차지하는 사각형"""
+        rect = pygame.Rect((0, 0), font.size(text))
+        rect.center = (self.screen_width // 2, self.screen_height // 2 + y_offset)
+        return rect
 
     def draw_text_center(self, surface, text, font, color, y_offset=0):
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(font, text, color)
         rect = text_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + y_offset))
         surface.blit(text_surface, rect)
\ No newline at end of file
@@ -0,0 +1,293 @@
+# (파일: tournament.py)
+#
+# 밸런스 테스트용 셀프 플레이 토너먼트. 화면 없이 (headless) 여러 프로세스에서 경기를 나눠 돌리고,
+# 파라미터 변형(variant)별로 승률, KO까지 걸린 시간, 타격/방어 비율, 마무리 기술 비율을 모아 출력합니다.
+#   python tournament.py --matches 2000 --p1 random --p2 hard \
+#       --variant "kb20:hit_knockback=20" --variant "Jab.damage=12,Uppercut.hit_frame=2"
+#
+# 변형 형식: "[이름:]키=값[,키=값...]"  (--variants 파일이면 {"이름": {"키": 값}} JSON)
+#   - Player 밸런스 값: hit_knockback, dizzy_hp, awaken_multiplier (match.TUNING_KEYS)
+#     (KO 펀치도 take_damage를 거치므로 KO 때 넉백도 hit_knockback)
+#   - 기술 프레임 데이터: 기술.damage, 기술.ko, 기술.hit_frame (타격 구간을 그 프레임부터로 이동),
+#     기술.active, 기술.recovery, 기술.hitbox (moves.json 필드 그대로)
+#
+# 컨트롤러: random, easy / normal / hard (ai_controller), script:파일.json ([[틱 수, 입력 비트], ...])
+# 경기 번호 i는 변형과 상관없이 같은 시드를 쓰므로, 변형끼리 같은 상황에서 비교됩니다.
+#
+# 각 작업 프로세스는 변형별 Match를 한 번만 만들고 경기마다 시작 상태로 되돌려서 재사용하며,
+# 결과는 경기 목록이 아니라 묶음별 합계만 돌려보내므로 프로세스 수에 거의 비례해서 빨라집니다.
+
+import argparse
+import copy
+import json
+import multiprocessing
+import os
+import statistics
+import time
+
+from headless import RandomController, ScriptedController, SCREEN_WIDTH, SCREEN_HEIGHT, MAX_TICKS
+from ai_controller import CpuController, DIFFICULTY
+from match import Match, TUNING_KEYS
+from frame_data import load_move_data
+from combat_log import COMBAT_LOG, LEVEL_OFF
+from sim_clock import TICK_RATE
+
+BASELINE = 'baseline'
+MOVE_FIELDS = ('damage', 'ko', 'hit_frame', 'active', 'recovery', 'hitbox')
+
+
+# ==================================================
+# 1. 변형 / 컨트롤러 해석
+# ==================================================
+def parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_variant(spec):
+    """"[이름:]키=값,..." -> (이름, {키: 값})"""
+    name, body = spec.split(':', 1) if ':' in spec.split('=', 1)[0] else (spec, spec)
+    overrides = {}
+    # 값에 쉼표가 들어갈 수 있으므로 (예: active=[2,3]) '키=' 앞에서만 나눔
+    for part in _split_assignments(body):
+        key, _, value = part.partition('=')
+        overrides[key.strip()] = parse_value(value.strip())
+    return name, overrides
+
+
+def _split_assignments(body):
+    parts = []
+    depth = 0
+    current = ''
+    for char in body:
+        if char in '[{':
+            depth += 1
+        elif char in ']}':
+            depth -= 1
+        if char == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        parts.append(current)
+    return parts
+
+
+def build_variant(overrides):
+    """{키: 값} -> (move_data 또는 None, tuning). 알 수 없는 키는 ValueError."""
+    tuning = {}
+    move_data = None
+    for key, value in overrides.items():
+        if key in TUNING_KEYS:
+            tuning[key] = value
+            continue
+        move_name, _, field = key.partition('.')
+        if move_data is None:
+            move_data = copy.deepcopy(load_move_data())
+        if move_name not in move_data['moves'] or field not in MOVE_FIELDS:
+            raise ValueError(f"알 수 없는 변형 키: {key}")
+        move = move_data['moves'][move_name]
+        if field == 'hit_frame':
+            start, end = move['active']
+            move['active'] = [value, value + end - start]
+        else:
+            move[field] = value
+    return move_data, tuning
+
+
+def make_controller(spec, seed):
+    if spec == 'random':
+        return RandomController(seed)
+    if spec in DIFFICULTY:
+        # 시간 예산을 없애서 탐색이 기계 속도와 상관없이 항상 끝까지 돌게 함 (재현 가능)
+        return CpuController(spec, time_budget_ms=float('inf'))
+    if spec.startswith('script:'):
+        with open(spec[len('script:'):], encoding='utf-8') as f:
+            return ScriptedController([tuple(step) for step in json.load(f)])
+    raise ValueError(f"알 수 없는 컨트롤러: {spec}")
+
+
+# ==================================================
+# 2. 작업 프로세스
+# ==================================================
+_matches = {}  # 작업 프로세스별: 변형 이름 -> (Match, 시작 상태)
+
+
+def _init_worker():
+    COMBAT_LOG.set_level(LEVEL_OFF)
+
+
+def _get_match(name, overrides):
+    entry = _matches.get(name)
+    if entry is None:
+        move_data, tuning = build_variant(overrides)
+        match = Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True, move_data=move_data, tuning=tuning)
+        entry = (match, match.save_state())
+        _matches[name] = entry
+    return entry
+
+
+def new_stats():
+    return {'matches': 0, 'wins': [0, 0, 0], 'ticks': 0, 'ko_ticks': [],
+            'hit': [0, 0], 'block': [0, 0], 'invincible': [0, 0], 'finishers': {}}
+
+
+def merge_stats(total, part):
+    total['matches'] += part['matches']
+    total['ticks'] += part['ticks']
+    total['ko_ticks'].extend(part['ko_ticks'])
+    for key in ('wins', 'hit', 'block', 'invincible'):
+        total[key] = [a + b for a, b in zip(total[key], part[key])]
+    for move, count in part['finishers'].items():
+        total['finishers'][move] = total['finishers'].get(move, 0) + count
+
+
+def play_chunk(task):
+    """경기 묶음 하나를 돌리고 (변형 이름, 합계)를 반환합니다."""
+    name, overrides, p1_spec, p2_spec, seed, first, count, max_ticks = task
+    match, initial = _get_match(name, overrides)
+    stats = new_stats()
+
+    for i in range(first, first + count):
+        match.load_state(initial)
+        match.last_inputs = (0, 0)
+        p1 = make_controller(p1_spec, seed + 2 * i)
+        p2 = make_controller(p2_spec, seed + 2 * i + 1)
+        while not match.game_over and match.tick < max_ticks:
+            match.step(p1(match, 0), p2(match, 1))
+
+        winner = match.winner
+        stats['matches'] += 1
+        stats['wins'][winner] += 1
+        stats['ticks'] += match.tick
+        for _, attacker, move, outcome in match.hit_log:
+            stats[outcome][attacker] += 1
+        if winner:
+            stats['ko_ticks'].append(match.tick)
+            # 마무리 기술: 승자의 마지막 유효타
+            for _, attacker, move, outcome in reversed(match.hit_log):
+                if outcome == 'hit' and attacker == winner - 1:
+                    stats['finishers'][move] = stats['finishers'].get(move, 0) + 1
+                    break
+    return name, stats
+
+
+# ==================================================
+# 3. 실행 / 요약
+# ==================================================
+def run_tournament(variants, p1_spec, p2_spec, matches, seed=0, workers=None, chunk=None, max_ticks=MAX_TICKS):
+    """variants: [(이름, {키: 값})] -> {이름: 합계}"""
+    for _, overrides in variants:
+        build_variant(overrides)  # 작업을 나눠 주기 전에 잘못된 키를 먼저 잡아냄
+    for spec in (p1_spec, p2_spec):
+        if spec.startswith('script:'):
+            make_controller(spec, 0)
+
+    workers = workers or os.cpu_count() or 1
+    chunk = chunk or max(1, min(50, matches // (workers * 4)))
+    tasks = [(name, overrides, p1_spec, p2_spec, seed, first, min(chunk, matches - first), max_ticks)
+             for name, overrides in variants for first in range(0, matches, chunk)]
+
+    results = {name: new_stats() for name, _ in variants}
+    if workers == 1:
+        _init_worker()
+        for task in tasks:
+            name, stats = play_chunk(task)
+            merge_stats(results[name], stats)
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+            for name, stats in pool.imap_unordered(play_chunk, tasks):
+                merge_stats(results[name], stats)
+    return results
+
+
+def summarize(name, stats):
+    n = stats['matches']
+    wins = stats['wins']
+    ko_ticks = stats['ko_ticks']
+    lines = [f"[{name}] {n} 경기",
+             f"  승률  1P {wins[1] / n:6.1%}   2P {wins[2] / n:6.1%}   무승부 {wins[0] / n:6.1%}"]
+    if ko_ticks:
+        lines.append(f"  KO까지  평균 {statistics.mean(ko_ticks) / TICK_RATE:5.1f}초   "
+                     f"중앙값 {statistics.median(ko_ticks) / TICK_RATE:5.1f}초")
+    for side in (0, 1):
+        hits, blocks = stats['hit'][side], stats['block'][side]
+        ratio = f"{hits / blocks:.2f}" if blocks else "-"
+        lines.append(f"  {side + 1}P 타격 {hits}  방어당함 {blocks}  무적 {stats['invincible'][side]}  "
+                     f"타격/방어 {ratio}")
+    decided = wins[1] + wins[2]
+    if decided:
+        finishers = sorted(stats['finishers'].items(), key=lambda item: -item[1])
+        lines.append("  마무리 기술  " + "   ".join(f"{move} {count / decided:.1%}" for move, count in finishers))
+    return "\n".join(lines)
+
+
+def to_json(results):
+    summary = {}
+    for name, stats in results.items():
+        n = stats['matches']
+        ko_ticks = stats['ko_ticks']
+        decided = stats['wins'][1] + stats['wins'][2]
+        summary[name] = {
+            'matches': n,
+            'p1_win_rate': stats['wins'][1] / n, 'p2_win_rate': stats['wins'][2] / n,
+            'draw_rate': stats['wins'][0] / n,
+            'mean_ko_seconds': statistics.mean(ko_ticks) / TICK_RATE if ko_ticks else None,
+            'median_ko_seconds': statistics.median(ko_ticks) / TICK_RATE if ko_ticks else None,
+            'hits': stats['hit'], 'blocks': stats['block'], 'invincible': stats['invincible'],
+            'finisher_rates': {move: count / decided for move, count in stats['finishers'].items()},
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 셀프 플레이 밸런스 토너먼트")
+    parser.add_argument("--matches", type=int, default=200, help="변형마다 돌릴 경기 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--p1", default="random", help="random / easy / normal / hard / script:파일.json")
+    parser.add_argument("--p2", default="random")
+    parser.add_argument("--variant", action="append", default=[], help='"[이름:]키=값[,키=값...]"')
+    parser.add_argument("--variants", help='{"이름": {"키": 값}} JSON 파일')
+    parser.add_argument("--no-baseline", action="store_true", help="기본값 경기를 빼고 변형만 돌림")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--chunk", type=int, default=None, help="작업 하나에 담을 경기 수")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="이 틱이 지나면 무승부")
+    parser.add_argument("--json", help="요약을 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    variants = [] if args.no_baseline else [(BASELINE, {})]
+    if args.variants:
+        with open(args.variants, encoding='utf-8') as f:
+            variants.extend(json.load(f).items())
+    variants.extend(parse_variant(spec) for spec in args.variant)
+    if not variants:
+        parser.error("돌릴 변형이 없습니다.")
+    names = [name for name, _ in variants]
+    if len(set(names)) != len(names):
+        parser.error("변형 이름이 겹칩니다.")
+
+    start = time.perf_counter()
+    try:
+        results = run_tournament(variants, args.p1, args.p2, args.matches, args.seed, args.workers, args.chunk,
+                                 args.max_ticks)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    total_matches = sum(stats['matches'] for stats in results.values())
+    total_ticks = sum(stats['ticks'] for stats in results.values())
+    print(f"{args.p1} vs {args.p2}: {len(variants)} 변형, {total_matches} 경기, {elapsed:.2f} 초 "
+          f"({total_matches / elapsed * 60:.0f} 경기/분, {total_ticks / elapsed:.0f} 틱/초)")
+    for name, _ in variants:
+        print(summarize(name, results[name]))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(to_json(results), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
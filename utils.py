@@ -1,14 +1,86 @@
 # (새 파일: utils.py)
 import pygame
 import os
+import struct
+import frame_cache
 
-def load_animation_frames(folder_path, scale_factor=1.0, flip_images=False):
-    """폴더 경로와 배율을 받아 스케일링 및 반전된 이미지 프레임 리스트를 반환합니다."""
-    frames = []
-    if not os.path.exists(folder_path):
-        print(f"경고: 애니메이션 폴더를 찾을 수 없습니다: {folder_path}")
-        return frames
+class FrameList(list):
+    """
+    투명 여백을 잘라낸 프레임 리스트.
+    frame_size: 잘라내기 전 원본 프레임 크기, offsets: 프레임별 (잘린 이미지의 원본 내 좌상단 위치)
+    """
+
+    def __init__(self, frames=(), frame_size=(0, 0), offsets=None):
+        super().__init__(frames)
+        self.frame_size = frame_size
+        self.offsets = offsets if offsets is not None else [(0, 0)] * len(self)
+        self.masks = None  # 프레임별 충돌 마스크 (frame_masks가 처음 필요할 때 채움)
+
+
+def trim_frame(image):
+    """불투명 영역만 남긴 Surface와 원본 내 오프셋을 반환합니다."""
+    bounds = image.get_bounding_rect()
+    if bounds.width == 0 or bounds.height == 0:
+        bounds = pygame.Rect(0, 0, 1, 1)
+    return image.subsurface(bounds).copy(), bounds.topleft
+
+
+def flip_frames(frames):
+    """FrameList를 좌우 반전합니다. (오프셋도 원본 프레임 기준으로 같이 뒤집힘)"""
+    frame_width = frames.frame_size[0]
+    flipped = [pygame.transform.flip(img, True, False) for img in frames]
+    offsets = [(frame_width - ox - img.get_width(), oy) for img, (ox, oy) in zip(frames, frames.offsets)]
+    return FrameList(flipped, frames.frame_size, offsets)
+
+
+class FrameStub:
+    """
+    헤드리스 모드용 가짜 프레임. 픽셀 없이 크기만 가지고 있어서
+    Player의 rect/판정 계산에는 충분하지만 화면에 그릴 수는 없습니다.
+    """
+    __slots__ = ('size',)
+
+    def __init__(self, size):
+        self.size = size
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_bytesize(self):
+        return 0  # 픽셀 메모리 없음
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+
+def frame_masks(frames):
+    """프레임별 pygame.mask.Mask 목록. 처음 부를 때 한 번 만들어 FrameList에 같이 보관합니다.
+    (반전 프레임은 캐시에서 별도 FrameList이므로 방향별로 따로 만들어짐, 헤드리스 프레임이면 None)"""
+    if frames.masks is None:
+        if not frames or isinstance(frames[0], FrameStub):
+            return None
+        frames.masks = [pygame.mask.from_surface(img) for img in frames]
+    return frames.masks
 
+
+def load_animation_frames(folder_path, scale_factor=1.0, flip_images=False, headless=False):
+    """폴더 경로와 배율을 받아 스케일링 및 반전된 이미지 프레임 리스트를 반환합니다.
+    (프로세스 전역 프레임 캐시를 거치므로 같은 폴더를 두 번 디코딩하지 않습니다.)
+    headless=True면 디코딩 없이 크기만 가진 FrameStub 리스트를 반환합니다."""
+    return frame_cache.get_frame_cache().get(folder_path, scale_factor, flip_images, headless)
+
+
+def _list_frame_files(folder_path):
+    """폴더 안의 이미지 파일 이름을 프레임 번호 순서로 정렬해서 반환합니다."""
     file_names = os.listdir(folder_path)
 
     try:
@@ -17,19 +89,54 @@ def load_animation_frames(folder_path, scale_factor=1.0, flip_images=False):
         print(f"경고: {folder_path}의 파일명에서 숫자를 추출할 수 없습니다. 일반 정렬합니다.")
         file_names.sort()
 
-    for file_name in file_names:
-        if file_name.endswith(('.png', '.jpg', '.bmp')):
-            image_path = os.path.join(folder_path, file_name)
-            try:
-                image = pygame.image.load(image_path).convert_alpha()
-                width = image.get_width()
-                height = image.get_height()
-                image = pygame.transform.scale(image, (int(width * scale_factor), int(height * scale_factor)))
-                if flip_images:
-                    image = pygame.transform.flip(image, True, False)
-                frames.append(image)
-            except pygame.error as e:
-                print(f"이미지 로드 오류 {image_path}: {e}")
+    return [f for f in file_names if f.endswith(('.png', '.jpg', '.bmp'))]
+
+
+def read_image_size(image_path):
+    """PNG는 IHDR 헤더만 읽어서 (w, h)를 얻습니다. 그 외 형식은 디코딩해서 확인합니다."""
+    with open(image_path, 'rb') as f:
+        header = f.read(24)
+    if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    return pygame.image.load(image_path).get_size()
+
+
+def stub_animation_frames(folder_path, scale_factor=1.0):
+    """이미지를 디코딩하지 않고 프레임 수/크기만 읽어 FrameStub 리스트를 만듭니다."""
+    frames = FrameList()
+    if not os.path.exists(folder_path):
+        print(f"경고: 애니메이션 폴더를 찾을 수 없습니다: {folder_path}")
+        return frames
+
+    for file_name in _list_frame_files(folder_path):
+        width, height = read_image_size(os.path.join(folder_path, file_name))
+        frames.frame_size = (int(width * scale_factor), int(height * scale_factor))
+        frames.append(FrameStub(frames.frame_size))
+        frames.offsets.append((0, 0))
+
+    return frames
+
+
+def decode_animation_frames(folder_path, scale_factor=1.0):
+    """캐시를 거치지 않고 폴더의 이미지를 직접 디코딩/스케일링하고, 투명 여백을 잘라냅니다."""
+    frames = FrameList()
+    if not os.path.exists(folder_path):
+        print(f"경고: 애니메이션 폴더를 찾을 수 없습니다: {folder_path}")
+        return frames
+
+    for file_name in _list_frame_files(folder_path):
+        image_path = os.path.join(folder_path, file_name)
+        try:
+            image = pygame.image.load(image_path).convert_alpha()
+            width = image.get_width()
+            height = image.get_height()
+            image = pygame.transform.scale(image, (int(width * scale_factor), int(height * scale_factor)))
+            frames.frame_size = image.get_size()
+            image, offset = trim_frame(image)
+            frames.append(image)
+            frames.offsets.append(offset)
+        except pygame.error as e:
+            print(f"이미지 로드 오류 {image_path}: {e}")
 
     if not frames:
         print(f"경고: {folder_path} 폴더에서 이미지를 로드하지 못했습니다.")
@@ -0,0 +1,477 @@
+# (파일: vector_engine.py)
+#
+# 많은 경기를 한꺼번에 진행하는 NumPy 헤드리스 엔진 (struct-of-arrays).
+# Player 객체 대신 (경기 수, 2) 배열에 선수 상태를 담고, 틱마다 전체 배열에 같은 규칙을 적용합니다.
+#   python vector_engine.py parity Replays/*.bxr        -> 녹화된 입력으로 Match와 틱 단위로 비교
+#   python vector_engine.py parity --random 256         -> 무작위 입력 경기로 비교
+#   python vector_engine.py bench --matches 4096        -> 경기·틱/초 측정 (Match와 비교)
+#
+# 규칙은 player.py / collisions.py와 같아야 합니다. (규칙을 바꾸면 여기도 같이 바꾸고 parity로 확인)
+#   - 상태별 프레임 수/크기와 기술 판정 테이블은 헤드리스 Player에서 그대로 뽑아 쓰므로 moves.json과 항상 일치
+#   - 이미지/이펙트/사운드/전투 로그는 없음 (판정에 영향 없음)
+#   - frame_rect.x에 실수를 더하면 pygame처럼 반올림(0.5는 0에서 먼 쪽)합니다.
+
+import argparse
+import time
+
+import numpy as np
+
+from inputs import INPUT_LEFT, INPUT_RIGHT, INPUT_JAB, INPUT_STRAIGHT, INPUT_UPPERCUT, INPUT_BLOCK
+from match import Match
+from sim_clock import ms_to_ticks_exceeded
+from headless import SCREEN_WIDTH, SCREEN_HEIGHT, MAX_TICKS, RandomController
+
+# 타격 결과 코드 (Match.hit_log의 결과 문자열과 대응)
+OUTCOME_NONE = 0
+OUTCOME_HIT = 1
+OUTCOME_BLOCK = 2
+OUTCOME_INVINCIBLE = 3
+OUTCOME_NAMES = (None, 'hit', 'block', 'invincible')
+
+# Player.update의 입력 우선순위 (앞에 있을수록 먼저)
+ACTION_INPUTS = ((INPUT_JAB, 'Jab'), (INPUT_STRAIGHT, 'Straight'), (INPUT_UPPERCUT, 'Uppercut'),
+                 (INPUT_BLOCK, 'Blocking'))
+
+
+def round_half_away(values):
+    """pygame Rect에 실수를 대입할 때와 같은 반올림 (0.5는 0에서 먼 쪽)"""
+    magnitude = np.abs(values)
+    whole = np.floor(magnitude)
+    return np.copysign(whole + (magnitude - whole >= 0.5), values)
+
+
+# ==================================================
+# 1. 상태 테이블 (헤드리스 Player에서 추출)
+# ==================================================
+class StateTables:
+    """
+    [방향(0: 1P, 1: 2P), 상태] -> 값 테이블.
+    상태 번호는 states 순서 (루프 상태, 기술들, Dizzy, KO).
+    """
+
+    def __init__(self, players):
+        reference = players[0]
+        self.states = tuple(reference.looping_states) + tuple(reference.attacks) + ('Dizzy', 'KO')
+        self.index = {name: i for i, name in enumerate(self.states)}
+        state_count = len(self.states)
+
+        frame_lists = [[self._shown_frames(player, name) for name in self.states] for player in players]
+        max_frames = max(len(frames) for per_side in frame_lists for frames in per_side)
+
+        self.frame_count = np.zeros((2, state_count), np.int32)
+        self.width = np.zeros((2, state_count), np.int32)
+        self.height = np.zeros((2, state_count), np.int32)
+        self.is_looping = np.zeros(state_count, bool)
+        self.is_attack = np.zeros(state_count, bool)
+        self.actionable_frame = np.zeros((2, state_count), np.int32)
+        self.damage = np.zeros((2, state_count), np.float64)
+        self.is_ko_move = np.zeros((2, state_count), bool)
+        self.has_hitbox = np.zeros((2, state_count, max_frames), bool)
+        self.hitbox = np.zeros((2, state_count, max_frames, 4), np.int32)
+        self.hurtbox = np.zeros((2, state_count, max_frames, 4), np.int32)
+
+        for s, name in enumerate(self.states):
+            self.is_looping[s] = name in reference.looping_states
+            self.is_attack[s] = name in reference.attacks
+        for side, player in enumerate(players):
+            for s, name in enumerate(self.states):
+                frames = frame_lists[side][s]
+                self.frame_count[side, s] = len(frames)
+                self.width[side, s], self.height[side, s] = frames.frame_size
+                self.hurtbox[side, s, :] = player.default_hurtbox
+                attack = player.attacks.get(name)
+                if attack is None:
+                    continue
+                self.actionable_frame[side, s] = attack.actionable_frame
+                self.damage[side, s] = attack.damage
+                self.is_ko_move[side, s] = attack.is_ko_move
+                for frame in range(attack.frame_count):
+                    self.hurtbox[side, s, frame] = attack.hurtboxes[frame]
+                    box = attack.hitboxes[frame]
+                    if box is not None:
+                        self.has_hitbox[side, s, frame] = True
+                        self.hitbox[side, s, frame] = box
+
+    @staticmethod
+    def _shown_frames(player, name):
+        """Player.animate가 이 상태에서 고르는 프레임 리스트"""
+        if name == 'Blocking':
+            defense = player.defenses.get('Blocking')
+            frames = defense.frames if defense is not None and defense.frames else player.animations.get('Idle')
+        elif name in player.looping_states:
+            frames = player.animations.get(name)
+        elif name in player.attacks:
+            frames = player.attacks[name].frames
+        elif name in player.effects:
+            frames = player.effects[name].frames
+        else:
+            frames = player.animations.get(name)
+        return frames if frames else player.animations['Idle']
+
+
+# ==================================================
+# 2. 엔진
+# ==================================================
+class VectorMatches:
+    """
+    count개의 경기를 같은 규칙(move_data, tuning)으로 동시에 진행합니다.
+    선수 상태는 모두 (count, 2) 배열이며 [:, 0]이 1P, [:, 1]이 2P입니다.
+    """
+
+    def __init__(self, count, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT, move_data=None, tuning=None):
+        # 테이블과 시작 상태는 같은 규칙의 헤드리스 Match에서 가져옴
+        template = Match(screen_width, screen_height, headless=True, move_data=move_data, tuning=tuning)
+        players = template.players
+        self.tables = StateTables(players)
+        self.count = count
+        self.screen_width = screen_width
+
+        reference = players[0]
+        self.speed = reference.speed
+        self.max_hp = reference.max_hp
+        self.hit_knockback = reference.hit_knockback
+        self.dizzy_hp = reference.dizzy_hp
+        self.awaken_multiplier = reference.awaken_multiplier
+        self.idle_delay = reference.base_animation_delay
+        self.awakened_delay = int(reference.base_animation_delay / 1.5)
+        self.knockback_sign = np.array([-1 if not player.flip_images else 1 for player in players], np.float64)
+        self.bottom = np.array([player.frame_rect.bottom for player in players], np.int32)
+
+        index = self.tables.index
+        self.IDLE, self.WALK, self.BLOCKING = index['Idle'], index['Walk'], index['Blocking']
+        self.DIZZY, self.KO = index['Dizzy'], index['KO']
+        self.action_states = [(bit, index[name]) for bit, name in ACTION_INPUTS]
+
+        def per_side(values, dtype):
+            return np.tile(np.array(values, dtype), (count, 1))
+
+        self.x = per_side([player.frame_rect.x for player in players], np.int32)
+        self.width = per_side([player.frame_rect.width for player in players], np.int32)
+        self.height = per_side([player.frame_rect.height for player in players], np.int32)
+        self.state = per_side([index[player.current_state] for player in players], np.int32)
+        self.frame = per_side([player.current_frame for player in players], np.int32)
+        self.anim_ticks = per_side([player.anim_ticks for player in players], np.int32)
+        self.hp = per_side([player.hp for player in players], np.float64)
+        self.alive = per_side([player.is_alive for player in players], bool)
+        self.has_hit = per_side([player.has_hit for player in players], bool)
+        self.awakened = per_side([player.is_awakened for player in players], bool)
+        self.knockback = per_side([player.knockback_velocity for player in players], np.float64)
+        self.hurtbox = np.zeros((count, 2, 4), np.int32)
+
+        self.tick = 0
+        self.game_over = np.zeros(count, bool)
+        self.outcome = np.zeros((count, 2), np.int8)  # 이번 틱에 공격자별 타격 결과 (OUTCOME_*)
+        self.outcome_move = np.zeros((count, 2), np.int32)  # 그때의 기술 (상태 번호)
+        self.hits = np.zeros((count, 2, len(OUTCOME_NAMES)), np.int32)  # 공격자별 결과 누적
+
+        self._side = np.arange(2)[None, :]
+        self._rows = np.arange(count)
+        self.update_hurtboxes()
+
+    @property
+    def winner(self):
+        """경기별 0: 아직/무승부, 1: 1P 승, 2: 2P 승 (Match.winner와 같음)"""
+        return np.where(self.game_over, np.where(self.alive[:, 0], 1, 2), 0).astype(np.int8)
+
+    # --- 2-1. 틱 진행 ---
+    def step(self, inputs):
+        """inputs: (count, 2) 입력 비트 배열. Match.step과 같은 순서로 한 틱을 진행합니다."""
+        inputs = np.asarray(inputs)
+        self.update_players(inputs)
+        self.update_hurtboxes()
+        self.resolve_collisions()
+
+        over = (~self.alive & (self.state == self.KO)).any(axis=1)
+        self.game_over |= over
+        self.tick += 1
+
+    def update_players(self, inputs):
+        """Player.update (1P, 2P는 서로 영향이 없으므로 한꺼번에)"""
+        tables = self.tables
+        side = self._side
+
+        # 넉백 (마찰 0.85, 0.5 미만이면 정지)
+        moving = self.knockback != 0
+        self.x = np.where(moving, round_half_away(self.x + self.knockback), self.x).astype(np.int32)
+        self.knockback *= 0.85
+        self.knockback[np.abs(self.knockback) < 0.5] = 0.0
+        self._clamp()
+
+        # 조작 가능한 선수만 입력 처리 (KO/Dizzy/동작 중이면 애니메이션만)
+        state = self.state
+        actionable = tables.is_looping[state] | \
+            (tables.is_attack[state] & (self.frame >= tables.actionable_frame[side, state]))
+        free = self.alive & (state != self.KO) & (state != self.DIZZY) & actionable
+
+        pending = free.copy()
+        for bit, action_state in self.action_states:
+            chosen = pending & ((inputs & bit) != 0)
+            if chosen.any():
+                self.state = np.where(chosen, action_state, self.state)
+                self.frame[chosen] = 0
+                if action_state != self.BLOCKING:
+                    self.has_hit[chosen] = False
+            pending &= ~chosen
+
+        # 후딜 캔슬 구간에서 새 입력이 없으면 남은 동작을 그대로 재생, 그 밖에는 이동
+        walking = pending & ~tables.is_attack[state]
+        left = walking & ((inputs & INPUT_LEFT) != 0)
+        right = walking & ((inputs & INPUT_RIGHT) != 0)
+        self.x += self.speed * (right.astype(np.int32) - left.astype(np.int32))
+        self.state = np.where(walking, np.where(left | right, self.WALK, self.IDLE), self.state)
+        self._clamp()
+
+        self._animate()
+
+    def _clamp(self):
+        np.maximum(self.x, 0, out=self.x)
+        over = self.x + self.width > self.screen_width
+        self.x[over] = (self.screen_width - self.width)[over]
+
+    def _animate(self):
+        """Player.animate: 딜레이가 지난 선수만 프레임을 넘기고, 크기가 바뀌면 midbottom을 유지"""
+        tables = self.tables
+        side = self._side
+
+        self.anim_ticks += 1
+        delay = np.where(self.awakened, self.awakened_delay, self.idle_delay)
+        advance = ms_to_ticks_exceeded(self.anim_ticks, delay)
+        if not advance.any():
+            return
+        self.anim_ticks[advance] = 0
+
+        state = self.state
+        frame_count = tables.frame_count[side, state]
+        looping = advance & tables.is_looping[state]
+        ko = advance & (state == self.KO)
+        once = advance & ~tables.is_looping[state] & (state != self.KO)
+
+        frame = self.frame
+        frame = np.where(looping, (frame + 1) % frame_count, frame)
+        frame = np.where(ko, np.minimum(frame + 1, frame_count - 1), frame)
+        frame = np.where(once, frame + 1, frame)
+        ended = once & (frame >= frame_count)
+        self.awakened |= ended & (state == self.DIZZY)
+        self.state = np.where(ended | (advance & ~self.alive & (state != self.KO)), self.IDLE, state)
+        self.frame = np.where(ended, 0, frame).astype(np.int32)
+
+        new_width = tables.width[side, self.state]
+        center = self.x + self.width // 2
+        self.x = np.where(advance, center - new_width // 2, self.x).astype(np.int32)
+        self.width = np.where(advance, new_width, self.width).astype(np.int32)
+        self.height = np.where(advance, tables.height[side, self.state], self.height).astype(np.int32)
+
+    # --- 2-2. 판정 ---
+    def _frame_box(self, table):
+        """현재 (상태, 프레임)의 상대 박스 + 프레임 위치 -> 절대 박스 (count, 2, 4)"""
+        frame = np.minimum(self.frame, table.shape[2] - 1)
+        box = table[self._side, self.state, frame].copy()
+        box[..., 0] += self.x
+        box[..., 1] += self.bottom - self.height
+        return box
+
+    def update_hurtboxes(self):
+        """Player.update 마지막의 허트박스 갱신 (판정 중에는 바뀌지 않음)"""
+        self.hurtbox = self._frame_box(self.tables.hurtbox)
+
+    def _hitboxes(self):
+        tables = self.tables
+        frame = np.minimum(self.frame, tables.has_hitbox.shape[2] - 1)
+        active = tables.is_attack[self.state] & (self.frame < tables.frame_count[self._side, self.state]) & \
+            tables.has_hitbox[self._side, self.state, frame]
+        return active, self._frame_box(tables.hitbox)
+
+    def resolve_collisions(self):
+        """collisions.resolve_collisions의 2인 버전: 1P 공격을 먼저 처리하고, 그 결과를 반영해서 2P 공격 처리"""
+        self.outcome[:] = OUTCOME_NONE
+        for attacker in (0, 1):
+            defender = 1 - attacker
+            active, hitbox = self._hitboxes()  # 앞선 타격으로 공격자가 Dizzy/KO가 됐을 수 있으므로 매번 다시 계산
+            a = hitbox[:, attacker]
+            d = self.hurtbox[:, defender]
+            touching = active[:, attacker] & ~self.has_hit[:, attacker] & self.alive[:, defender] & \
+                (a[:, 0] < d[:, 0] + d[:, 2]) & (d[:, 0] < a[:, 0] + a[:, 2]) & \
+                (a[:, 1] < d[:, 1] + d[:, 3]) & (d[:, 1] < a[:, 1] + a[:, 3])
+            if touching.any():
+                self._apply_hits(touching, attacker, defender)
+
+    def _apply_hits(self, touching, attacker, defender):
+        rows = self._rows[touching]
+        move = self.state[rows, attacker]
+        defender_state = self.state[rows, defender]
+        self.has_hit[rows, attacker] = True
+
+        outcome = np.where(defender_state == self.BLOCKING, OUTCOME_BLOCK,
+                           np.where(defender_state == self.DIZZY, OUTCOME_INVINCIBLE, OUTCOME_HIT))
+        self.outcome[rows, attacker] = outcome
+        self.outcome_move[rows, attacker] = move
+        self.hits[rows, attacker, outcome] += 1
+
+        hit = outcome == OUTCOME_HIT
+        rows, move = rows[hit], move[hit]
+        if not len(rows):
+            return
+        damage = np.where(self.tables.is_ko_move[attacker, move], self.max_hp,
+                          self.tables.damage[attacker, move] *
+                          np.where(self.awakened[rows, attacker], self.awaken_multiplier, 1))
+
+        # Player.take_damage
+        self.knockback[rows, defender] = self.knockback_sign[defender] * self.hit_knockback
+        hp = self.hp[rows, defender] - damage
+        dead = hp <= 0
+        dizzy = ~dead & (hp <= self.dizzy_hp) & ~self.awakened[rows, defender]
+        self.hp[rows, defender] = np.where(dead, 0, hp)
+        self.alive[rows[dead], defender] = False
+        changed = dead | dizzy
+        self.state[rows[changed], defender] = np.where(dead, self.KO, self.DIZZY)[changed]
+        self.frame[rows[changed], defender] = 0
+        self.has_hit[rows[dizzy], defender] = False
+
+
+# ==================================================
+# 3. Match와 비교 (parity)
+# ==================================================
+PLAYER_FIELDS = ('x', 'width', 'height', 'state', 'frame', 'anim_ticks', 'hp', 'alive', 'has_hit', 'awakened',
+                 'knockback', 'hurtbox')
+
+
+def scalar_fields(player):
+    rect = player.frame_rect
+    return (rect.x, rect.width, rect.height, player.current_state, player.current_frame, player.anim_ticks,
+            player.hp, player.is_alive, player.has_hit, player.is_awakened, player.knockback_velocity,
+            tuple(player.hurtbox_absolute))
+
+
+def vector_fields(engine, row, side):
+    return (engine.x[row, side], engine.width[row, side], engine.height[row, side],
+            engine.tables.states[engine.state[row, side]], engine.frame[row, side],
+            engine.anim_ticks[row, side], engine.hp[row, side], engine.alive[row, side],
+            engine.has_hit[row, side], engine.awakened[row, side], engine.knockback[row, side],
+            tuple(engine.hurtbox[row, side]))
+
+
+def vector_hits(engine, row):
+    """이번 틱의 타격을 Match.hit_log 항목 형식으로"""
+    return [(engine.tick - 1, attacker, engine.tables.states[engine.outcome_move[row, attacker]],
+             OUTCOME_NAMES[engine.outcome[row, attacker]])
+            for attacker in (0, 1) if engine.outcome[row, attacker] != OUTCOME_NONE]
+
+
+def check_parity(input_lists, move_data=None, tuning=None):
+    """
+    input_lists: 경기별 [(P1 입력, P2 입력), ...]. 모든 경기를 VectorMatches 하나로 같이 진행하면서
+    경기별 Match와 틱마다 비교합니다. 반환값: 경기별 첫 불일치 설명 (일치하면 None)
+    """
+    count = len(input_lists)
+    engine = VectorMatches(count, move_data=move_data, tuning=tuning)
+    matches = [Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True, move_data=move_data, tuning=tuning)
+               for _ in range(count)]
+    mismatches = [None] * count
+
+    length = max((len(inputs) for inputs in input_lists), default=0)
+    padded = np.zeros((length, count, 2), np.int32)
+    for i, inputs in enumerate(input_lists):
+        if inputs:
+            padded[:len(inputs), i] = inputs
+
+    for tick in range(length):
+        engine.step(padded[tick])
+        for i, match in enumerate(matches):
+            if mismatches[i] is not None or tick >= len(input_lists[i]):
+                continue
+            hit_count = len(match.hit_log)
+            match.step(*input_lists[i][tick])
+            problem = None
+            for side, player in enumerate(match.players):
+                for name, expected, actual in zip(PLAYER_FIELDS, scalar_fields(player), vector_fields(engine, i, side)):
+                    if expected != actual:
+                        problem = f"틱 {tick} {side + 1}P {name}: Match {expected!r} / 벡터 {actual!r}"
+                        break
+                if problem:
+                    break
+            if problem is None:
+                expected_hits = match.hit_log[hit_count:]
+                if expected_hits != vector_hits(engine, i):
+                    problem = f"틱 {tick} 타격: Match {expected_hits} / 벡터 {vector_hits(engine, i)}"
+                elif match.game_over != engine.game_over[i] or match.winner != engine.winner[i]:
+                    problem = f"틱 {tick} 승패: Match {match.winner} / 벡터 {engine.winner[i]}"
+            mismatches[i] = problem
+    return mismatches
+
+
+def random_inputs(count, ticks, seed=0):
+    """headless.RandomController와 같은 입력 (경기 i는 시드 seed + 2i, seed + 2i + 1)"""
+    class _Tick:
+        tick = 0
+
+    input_lists = []
+    for i in range(count):
+        controllers = (RandomController(seed + 2 * i), RandomController(seed + 2 * i + 1))
+        clock = _Tick()
+        inputs = []
+        for tick in range(ticks):
+            clock.tick = tick
+            inputs.append((controllers[0](clock, 0), controllers[1](clock, 1)))
+        input_lists.append(inputs)
+    return input_lists
+
+
+def benchmark(count, ticks, seed=0):
+    """같은 무작위 입력으로 VectorMatches와 Match의 경기·틱/초를 잽니다."""
+    inputs = np.array(random_inputs(count, ticks, seed), np.int32).transpose(1, 0, 2)
+
+    engine = VectorMatches(count)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        engine.step(inputs[tick])
+    vector_rate = count * ticks / (time.perf_counter() - start)
+
+    scalar_count = min(count, 16)  # Match는 몇 경기만 재서 환산
+    start = time.perf_counter()
+    for i in range(scalar_count):
+        match = Match(SCREEN_WIDTH, SCREEN_HEIGHT, headless=True)
+        for tick in range(ticks):
+            match.step(*inputs[tick, i])
+    scalar_rate = scalar_count * ticks / (time.perf_counter() - start)
+    return vector_rate, scalar_rate
+
+
+def main():
+    from combat_log import COMBAT_LOG, LEVEL_OFF
+    from replay import Replay
+
+    parser = argparse.ArgumentParser(description="NumPy 벡터 엔진 (Match와 결과 비교 / 성능 측정)")
+    parser.add_argument("command", choices=("parity", "bench"))
+    parser.add_argument("replays", nargs="*", help="parity: 비교할 리플레이 파일")
+    parser.add_argument("--random", type=int, default=0, help="parity: 무작위 입력 경기 수")
+    parser.add_argument("--matches", type=int, default=4096, help="bench: 동시에 돌릴 경기 수")
+    parser.add_argument("--ticks", type=int, default=600, help="무작위 입력 경기의 틱 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    COMBAT_LOG.set_level(LEVEL_OFF)
+
+    if args.command == "bench":
+        vector_rate, scalar_rate = benchmark(args.matches, args.ticks, args.seed)
+        print(f"{args.matches} 경기 x {args.ticks} 틱")
+        print(f"  벡터 엔진: {vector_rate:,.0f} 경기·틱/초")
+        print(f"  Match    : {scalar_rate:,.0f} 경기·틱/초  (x{vector_rate / scalar_rate:.1f})")
+        return 0
+
+    input_lists = [Replay.load(path).inputs for path in args.replays]
+    labels = list(args.replays)
+    if args.random:
+        input_lists += random_inputs(args.random, min(args.ticks, MAX_TICKS), args.seed)
+        labels += [f"random #{i} (seed {args.seed + 2 * i})" for i in range(args.random)]
+    if not input_lists:
+        parser.error("비교할 리플레이나 --random 경기 수가 필요합니다.")
+
+    mismatches = check_parity(input_lists)
+    for label, inputs, problem in zip(labels, input_lists, mismatches):
+        print(f"{'OK  ' if problem is None else 'FAIL'} {label} ({len(inputs)} 틱)")
+        if problem is not None:
+            print(f"     {problem}")
+    return 1 if any(problem is not None for problem in mismatches) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
@@ -1,35 +1,120 @@
 # (파일: visual_effects.py)
+#
+# 타격/방어 이펙트와 이펙트 풀.
+#   - 이펙트 객체는 EffectPool이 처음에 MAX_EFFECTS개 만들어 두고, 재생이 끝나면 버리지 않고 다시 씁니다.
+#     (타격이 몰리는 프레임에 객체/Rect 할당과 GC가 생기지 않도록)
+#   - 좌우 반전 프레임은 이펙트마다 만들지 않고, 로드할 때 (정방향, 반전) 한 쌍으로 준비합니다. (mirrored_pair)
+#   - 풀이 가득 찬 상태에서 새 이펙트가 나오면 가장 오래된 이펙트를 끊고 그 자리를 씁니다.
 
 import pygame
+from utils import load_animation_frames
 
+MAX_EFFECTS = 256  # 동시에 보이는 이펙트 수 상한
 
-class VisualEffect(pygame.sprite.Sprite):
-    """애니메이션을 한 번 재생하고 사라지는 이펙트 스프라이트"""
 
-    # [수정] flip=False 매개변수 추가
-    def __init__(self, pos, frames, flip=False):
-        super().__init__()
+def mirrored_pair(folder, scale_factor=1.0):
+    """(정방향 프레임, 좌우 반전 프레임). flip 값(False/True)으로 바로 인덱싱합니다.
+    반전 프레임은 프레임 캐시가 정방향에서 한 번만 만들어 모든 경기가 공유합니다."""
+    return (load_animation_frames(folder, scale_factor),
+            load_animation_frames(folder, scale_factor, flip_images=True))
 
-        # [수정] flip이 True면 모든 프레임을 좌우 반전시킴
-        if flip:
-            self.frames = [pygame.transform.flip(img, True, False) for img in frames]
-        else:
-            self.frames = frames
 
+class VisualEffect:
+    """애니메이션을 한 번 재생하고 사라지는 이펙트 (EffectPool이 만들고 재사용함)"""
+    __slots__ = ('frames', 'frame_rect', 'current_frame', 'animation_speed', 'image', 'rect')
+
+    def __init__(self):
+        self.frames = None
+        self.frame_rect = pygame.Rect(0, 0, 0, 0)
         self.current_frame = 0
         self.animation_speed = 0.5
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
 
-        if self.frames:
-            self.image = self.frames[0]
-            self.rect = self.image.get_rect()
-            self.rect.center = pos
-        else:
-            self.kill()
+    def start(self, pos, frames, current_frame=0):
+        """frames: 이미 방향이 적용된 프레임 (mirrored_pair[flip])"""
+        # 원본 프레임 크기 기준으로 pos에 중심을 맞춘 뒤, 잘린 이미지 오프셋을 더해 그림
+        self.frames = frames
+        self.frame_rect.size = frames.frame_size
+        self.frame_rect.center = pos
+        self.current_frame = current_frame
+        self._show(int(current_frame))
 
     def update(self):
+        """한 틱 진행. 재생이 끝났으면 False"""
         self.current_frame += self.animation_speed
 
         if self.current_frame >= len(self.frames):
-            self.kill()
+            self.frames = None
+            self.image = None
+            return False
+        self._show(int(self.current_frame))
+        return True
+
+    # --- 롤백 넷플레이용 상태 저장 ---
+    def save_state(self):
+        """(이미 방향이 적용된 프레임, 중심 위치, 진행 프레임)"""
+        return (self.frames, self.frame_rect.center, self.current_frame)
+
+    def _show(self, index):
+        self.image = self.frames[index]
+        ox, oy = self.frames.offsets[index]
+        self.rect.size = self.image.get_size()
+        self.rect.topleft = (self.frame_rect.x + ox, self.frame_rect.y + oy)
+
+
+class EffectPool:
+    """
+    고정 크기 이펙트 풀. pygame.sprite.Group처럼 update()/empty()/순회/len()을 쓸 수 있습니다.
+    순회 순서는 생성 순서 (먼저 나온 이펙트가 아래에 그려짐).
+    """
+
+    def __init__(self, capacity=MAX_EFFECTS):
+        self.capacity = capacity
+        self._free = [VisualEffect() for _ in range(capacity)]
+        self._active = []
+        self.dropped = 0  # 풀이 가득 차서 일찍 끊긴 이펙트 수
+
+    def spawn(self, pos, frames, current_frame=0):
+        """새 이펙트를 재생합니다. 풀이 가득 찼으면 가장 오래된 이펙트를 끊고 재사용합니다."""
+        if not frames or not self.capacity:
+            return None
+        if self._free:
+            effect = self._free.pop()
         else:
-            self.image = self.frames[int(self.current_frame)]
\ No newline at end of file
+            effect = self._active.pop(0)
+            self.dropped += 1
+        effect.start(pos, frames, current_frame)
+        self._active.append(effect)
+        return effect
+
+    def update(self):
+        active = self._active
+        if not active:
+            return
+        still_playing = [effect for effect in active if effect.update()]
+        if len(still_playing) != len(active):
+            self._free.extend(effect for effect in active if effect.frames is None)
+            self._active = still_playing
+
+    def empty(self):
+        for effect in self._active:
+            effect.frames = None
+            effect.image = None
+        self._free.extend(self._active)
+        self._active = []
+
+    def __iter__(self):
+        return iter(self._active)
+
+    def __len__(self):
+        return len(self._active)
+
+    # --- 롤백 넷플레이용 상태 저장/복원 ---
+    def save_state(self):
+        return tuple(effect.save_state() for effect in self._active)
+
+    def load_state(self, states):
+        self.empty()
+        for frames, center, current_frame in states:
+            self.spawn(center, frames, current_frame)
\ No newline at end of file